@@ -1,15 +1,22 @@
 import streamlit as st
+from talentscout import startup
+startup.begin()  # no-op unless TALENTSCOUT_STARTUP_PROFILE=1
+
+# Heavy dependencies (groq, numpy, matplotlib, fpdf, PyPDF2, docx) are imported
+# on first use inside talentscout.*, so the chat UI paints before they load.
+import asyncio
 import os
-import json
-import re
-import tempfile
-from groq import Groq
+import time
 from dotenv import load_dotenv
-import PyPDF2
-import docx
-from fpdf import FPDF
-import matplotlib.pyplot as plt
-import numpy as np
+from talentscout.batch import RESULT_COLUMNS, rows_to_csv, screen_resumes
+from talentscout.candidates import SCORE_FIELDS, candidate_record
+from talentscout.engine import FAST_MODEL, InterviewEngine
+from talentscout.llm import ResilientClient
+from talentscout.matching import MATCH_COLUMNS, rank_candidates
+from talentscout.metrics import REGISTRY, span
+from talentscout.recruiter import recruiter_login
+from talentscout.session_store import open_session_store
+from talentscout.transcript import TranscriptPages, split_transcript
 
 st.set_page_config(
     page_title="TalentScout AI",
@@ -17,14 +24,22 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+startup.mark("imports + page config")
 
 # [Past this into app.py replacing the existing API setup code]
 
 # --- CONFIGURATION ---
-GREETINGS = {"hi", "hello", "hey", "hii", "hiyo", "hiya", "hola", "namaste"}
-SENSITIVE_FIELDS = {"Email Address", "Phone Number"}
-FAST_MODEL = "llama-3.1-8b-instant"
-SMART_MODEL = "llama-3.3-70b-versatile"
+# Models, deadlines and interview rules live in talentscout.engine
+BATCH_CONCURRENCY = 8
+GROQ_RPM = int(os.getenv("GROQ_RPM", "30"))  # account limits, used to pace batch screening
+GROQ_TPM = int(os.getenv("GROQ_TPM", "6000"))
+REPORT_POLL_INTERVAL = 0.5  # seconds between progress reruns while a report job runs
+# Metrics export: Prometheus text on http://<host>:<port>/metrics and/or a textfile
+METRICS_PORT = os.getenv("TALENTSCOUT_METRICS_PORT")
+METRICS_FILE = os.getenv("TALENTSCOUT_METRICS_FILE")
+METRICS_HOST = os.getenv("TALENTSCOUT_METRICS_HOST", "127.0.0.1")  # 0.0.0.0 exposes /metrics to the network
+METRICS_FILE_INTERVAL = 5.0  # seconds between textfile exports; every rerun of every session asks for one
+DEBUG_PANEL = os.getenv("TALENTSCOUT_DEBUG_PANEL", "") == "1"
 
 # IMPROVED KEY LOADING
 try:
@@ -39,12 +54,39 @@ except (FileNotFoundError, KeyError):
 @st.cache_resource
 def get_groq_client(api_key):
     if not api_key: return None
-    return Groq(api_key=api_key)
+    # One client (and HTTP connection pool) shared by every session
+    return ResilientClient(api_key=api_key)
 
 # Call the function with the key
 client = get_groq_client(api_key)
 
+@st.cache_resource
+def start_metrics_server(port):
+    return REGISTRY.serve(int(port), host=METRICS_HOST)
+
+if METRICS_PORT: start_metrics_server(METRICS_PORT)
+
+# Interviews are persisted per turn so they survive restarts and replica hops
+# (TALENTSCOUT_SESSION_STORE=sqlite:///path | redis://host:6379/0 | memory://)
+@st.cache_resource
+def get_session_store():
+    return open_session_store()
+
+# The interview logic and everything sessions share (report jobs, resume and reply
+# caches, question bank) live in one engine per process; this page is one client of it,
+# `python -m talentscout.api` another
+@st.cache_resource
+def get_engine(api_key):
+    return InterviewEngine(get_groq_client(api_key), store=get_session_store())
+
+def persist_session():
+    engine.persist(st.session_state)
 
+# Finished interviews and screened resumes outlive the session in the candidate
+# index, which the "Candidate Search" page and `python -m talentscout.candidates` query
+def index_candidates(*records):
+    notice = engine.index_candidates(*records)
+    if notice: st.toast(f"⚠️ {notice}")
 
 # --- CUSTOM CSS ---
 st.markdown("""
@@ -89,253 +131,58 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+startup.mark("client + css")
+
 if not client:
     st.error("❌ Error: GROQ_API_KEY not found. Please check your .env file.")
     st.stop()
 
-# --- HELPER FUNCTIONS ---
-def clean_response_text(text: str) -> str:
-    """Smartly extracts JSON from mixed text."""
-    if not text: return ""
-    match = re.search(r"\{[\s\S]*\}", text)
-    if match:
-        text = match.group(0)
-    else:
-        text = re.sub(r"```(?:json)?\n?", "", text)
-        text = text.replace('```', '')
-    return text.strip()
-
-def is_valid_email(email: str) -> bool:
-    if not email: return False
-    return re.match(r"^[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}$", email.strip()) is not None
-
-def is_valid_phone(phone: str) -> bool:
-    if not phone: return False
-    digits = re.sub(r"\D", "", phone)
-    return 7 <= len(digits) <= 15
-
-def detect_hinglish(text: str) -> bool:
-    hinglish_indicators = {
-        "haan", "nahi", "theek", "ok", "okk", "shukriya", "thanks",
-        "kya", "aap", "mujhe", "apna", "kar", "sakte", "daal", "acha", "chalega",
-        "baat", "karo", "bol", "samajh", "dekh", "main", "maine", "hoon", "ho",
-        "ke", "ka", "ki", "se", "par", "aur", "ya", "toh", "bas", "tha",
-        "sey", "mein", "woh", "ye", "voh", "inko", "unko", "humein", "unhein"
-    }
-    words = text.lower().split()
-    count = sum(1 for w in words if any(w.startswith(h) or w.endswith(h) for h in hinglish_indicators))
-    return count >= len(words) * 0.3
-
-# --- RESUME PARSING ---
-def extract_text_from_pdf(file):
-    pdf_reader = PyPDF2.PdfReader(file)
-    text = ""
-    for page in pdf_reader.pages:
-        text += page.extract_text()
-    return text
-
-def extract_text_from_docx(file):
-    doc = docx.Document(file)
-    return "\n".join([paragraph.text for paragraph in doc.paragraphs])
-
-def parse_resume_with_ai(text):
-    # REMOVED "Desired Position" from here so the bot forces the question later.
-    prompt = f"""
-    Extract the following fields from the resume text below.
-    Return ONLY valid JSON.
-    Keys: "Full Name", "Email Address", "Phone Number", "Years of Experience", "Current Location", "Tech Stack".
-    
-    IMPORTANT: 
-    - DO NOT extract "Desired Position". We will ask the user for this.
-    - If "Tech Stack" is scattered, combine it into a comma-separated string.
-    - If a field is missing, use null.
-    
-    Resume Text:
-    {text[:4000]}
-    """
-    try:
-        completion = client.chat.completions.create(
-            model=FAST_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            response_format={"type": "json_object"} 
-        )
-        content = completion.choices[0].message.content
-        content = clean_response_text(content)
-        return json.loads(content)
-    except Exception as e:
-        st.error(f"Resume Parsing Error: {e}")
-        return {}
-
-# --- INTELLIGENT INPUT PROCESSOR ---
-def process_user_input(user_input, current_field, language="English"):
-    prompt = f"""
-    You are an AI Interviewer ({language}). 
-    We are currently asking the candidate for: "{current_field}".
-    User Input: "{user_input}"
-    
-    TASK:
-    1. If the user is providing the answer, extract ONLY the value. Set "is_answer": true.
-    2. If the user is asking a QUESTION (e.g., "Why do you need this?", "What is this for?"):
-       - Explain the reason professionally.
-       - Set "is_answer": false.
-    3. If user says "skip", extracted_value: "Skipped".
-    
-    RETURN JSON ONLY:
-    {{
-        "is_answer": boolean,
-        "extracted_value": string or null,
-        "response_message": string (required if is_answer is false)
-    }}
-    """
-    try:
-        completion = client.chat.completions.create(
-            model=FAST_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        return json.loads(completion.choices[0].message.content)
-    except:
-        return {"is_answer": True, "extracted_value": user_input}
-
-# --- PDF & GRAPH ---
-def create_radar_chart(scores):
-    categories = list(scores.keys())
-    values = list(scores.values())
-    
-    values += values[:1]
-    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-    angles += angles[:1]
-    
-    fig, ax = plt.subplots(figsize=(5, 5), subplot_kw=dict(polar=True))
-    ax.fill(angles, values, color='#4A90E2', alpha=0.15)
-    ax.plot(angles, values, color='#4A90E2', linewidth=2)
-    ax.set_ylim(0, 100)
-    ax.set_yticks([20, 40, 60, 80, 100])
-    ax.set_yticklabels(["20", "40", "60", "80", "100"], color="grey", size=8)
-    ax.set_xticks(angles[:-1])
-    ax.set_xticklabels(categories, size=10)
-    
-    temp_chart = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_chart.name, format='png', bbox_inches='tight')
-    plt.close()
-    return temp_chart.name
-
-class PDFReport(FPDF):
-    def header(self):
-        self.set_font('Arial', 'B', 15)
-        self.cell(0, 10, 'TalentScout AI - Candidate Evaluation', 0, 1, 'C')
-        self.ln(5)
-    def footer(self):
-        self.set_y(-15)
-        self.set_font('Arial', 'I', 8)
-        self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
-
-def generate_pdf_report(data):
-    pdf = PDFReport()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    
-    # Details
-    pdf.cell(0, 10, f"Candidate Name: {str(data.get('name', 'N/A')).encode('latin-1', 'replace').decode('latin-1')}", ln=True)
-    pdf.cell(0, 10, f"Position: {str(data.get('position', 'N/A')).encode('latin-1', 'replace').decode('latin-1')}", ln=True)
-    
-    # Tech Stack (wrapped)
-    pdf.ln(2)
-    pdf.set_font("Arial", 'B', 12)
-    pdf.cell(0, 10, "Tech Stack:", ln=True)
-    pdf.set_font("Arial", size=11)
-    tech_stack_text = str(data.get('tech_stack', 'N/A')).encode('latin-1', 'replace').decode('latin-1')
-    pdf.multi_cell(0, 7, tech_stack_text)
-    
-    pdf.ln(5)
-    
-    # Verdict
-    verdict = data.get('verdict', 'Pending')
-    color = (0, 128, 0) if "Hire" in verdict else (255, 0, 0)
-    pdf.set_text_color(*color)
-    pdf.set_font("Arial", 'B', 16)
-    pdf.cell(0, 10, f"VERDICT: {verdict}", ln=True)
-    pdf.set_text_color(0, 0, 0)
-    
-    # Graph + Summary
-    scores = {
-        "Tech": data.get("technical_score", 0),
-        "Comm": data.get("communication_score", 0),
-        "Prob Solv": data.get("problem_solving_score", 0),
-        "Exp Fit": data.get("experience_relevance", 0)
-    }
-    chart_path = create_radar_chart(scores)
-    
-    # Add Chart
-    pdf.image(chart_path, x=60, y=None, w=90)
-    os.unlink(chart_path)
-    
-    # Add Graph Summary (New Feature)
-    pdf.ln(5)
-    pdf.set_font("Arial", 'I', 11)
-    pdf.set_text_color(100, 100, 100) # Grey color for explanation
-    summary_text = f"Graph Interpretation: {data.get('graph_summary', 'Analysis of core competencies.')}"
-    # Clean unicode for PDF
-    summary_text = str(summary_text).encode('latin-1', 'replace').decode('latin-1')
-    pdf.multi_cell(0, 7, summary_text, align='C')
-    pdf.set_text_color(0, 0, 0) # Reset color
-    
-    # Strengths
-    pdf.ln(10)
-    pdf.set_font("Arial", 'B', 14)
-    pdf.cell(0, 10, "Strengths:", ln=True)
-    pdf.set_font("Arial", size=11)
-    for s in data.get('strengths', []): 
-        s = str(s).encode('latin-1', 'replace').decode('latin-1')
-        pdf.cell(0, 7, f"- {s}", ln=True)
-    
-    # Improvements
-    pdf.ln(5)
-    pdf.set_font("Arial", 'B', 14)
-    pdf.cell(0, 10, "Improvements:", ln=True)
-    pdf.set_font("Arial", size=11)
-    for i in data.get('improvement_areas', []): 
-        i = str(i).encode('latin-1', 'replace').decode('latin-1')
-        pdf.cell(0, 7, f"- {i}", ln=True)
-    
-    return pdf.output(dest="S").encode("latin-1")
-
-# --- TRANSLATIONS ---
-TRANSLATIONS = {
-    "English": {
-        "greeting": "Hello! I'm TalentScout. I've reviewed your resume. Welcome, {name}. I need to clarify a few details. Could you please provide your {field}?",
-        "greeting_full": "Hello! I'm TalentScout. I've reviewed your resume. Welcome, {name}. I see you are skilled in {stack}. Let's dive straight into the technical round.",
-        "greeting_manual": "Hello! I'm TalentScout. Before we begin, could you please tell me your {field}?",
-        "thanks_brief": "Thanks {name} — could you provide your {field}?",
-        "thanks_sensitive": "Thanks {name} — could you provide your {field}? (Confidential)",
-        "phase_transition": "Thanks {name}. I have all your details now. Moving to technical questions on: {stack}.",
-        "invalid_email": "Invalid email format. Please try name@example.com",
-        "invalid_phone": "Invalid phone format. Please enter digits only.",
-    },
-    # ... (Other languages logic preserved) ...
-}
-
-def get_translation(lang, key, field="", name="", stack=""):
-    if lang not in TRANSLATIONS: lang = "English"
-    msg = TRANSLATIONS[lang].get(key, TRANSLATIONS["English"].get(key, ""))
-    return msg.format(field=field, name=name, stack=stack)
-
-# --- SESSION STATE ---
-if "messages" not in st.session_state: st.session_state.messages = []
-if "phase" not in st.session_state: st.session_state.phase = "gathering_info"
-if "collected_info" not in st.session_state: st.session_state.collected_info = {}
-if "resume_uploaded" not in st.session_state: st.session_state.resume_uploaded = False
-
-REQUIRED_FIELDS = ["Full Name", "Email Address", "Phone Number", "Years of Experience", "Desired Position(s)", "Current Location", "Tech Stack"]
-
-# --- HELPER: FIND NEXT MISSING FIELD ---
-def get_next_missing_field():
-    for field in REQUIRED_FIELDS:
-        if field not in st.session_state.collected_info:
-            return field
-    return None
+engine = get_engine(api_key)
+
+# --- BATCH SCREENING ---
+def run_batch_screening(files, on_result, skip=frozenset()):
+    """Screens ``(name, bytes)`` pairs concurrently; rows arrive via ``on_result``."""
+    from groq import AsyncGroq
+
+    async def run():
+        async_client = AsyncGroq(api_key=api_key)
+        try:
+            return await screen_resumes(
+                files, async_client, model=FAST_MODEL, concurrency=BATCH_CONCURRENCY,
+                rpm=GROQ_RPM, tpm=GROQ_TPM, skip=skip, cache=engine.resume_cache, on_result=on_result
+            )
+        finally:
+            await async_client.close()
+    return asyncio.run(run())
+
+# --- SESSION STATE & PERSISTENCE ---
+# ?sid=<id> in the URL resumes a stored interview on any replica
+if "session_sync" not in st.session_state:
+    requested_sid = st.experimental_get_query_params().get("sid", [None])[0]
+    if engine.open_session(st.session_state, requested_sid):
+        st.toast("Interview resumed", icon="🔁")
+    st.experimental_set_query_params(sid=st.session_state.session_sync.session_id)
+
+# --- CHAT RENDERING ---
+def show_events(events):
+    """Draws a reply as it arrives: streamed tokens into one bubble, other messages each in their own."""
+    placeholder = None
+    streamed = ""
+    for event in events:
+        if event.kind == "delta":
+            if placeholder is None: placeholder = st.chat_message("assistant", avatar="🤖").empty()
+            streamed += event.text
+            placeholder.markdown(streamed + "▌")
+        elif event.kind == "message":
+            if placeholder is not None:
+                placeholder.markdown(event.text)
+                placeholder, streamed = None, ""
+            else:
+                with st.chat_message("assistant", avatar="🤖"): st.markdown(event.text)
+        elif event.kind == "notice":
+            st.toast(f"⚠️ {event.text}")
+        elif event.kind == "error":
+            st.error(event.text)
 
 # --- HEADER ---
 c1, c2, c3 = st.columns([1, 8, 1])
@@ -357,195 +204,126 @@ with st.sidebar:
     if uploaded_file and not st.session_state.resume_uploaded:
         with st.spinner("Parsing resume with AI..."):
             try:
-                # Text Extraction
-                file_text = ""
-                if uploaded_file.type == "application/pdf":
-                    file_text = extract_text_from_pdf(uploaded_file)
-                elif "wordprocessingml" in uploaded_file.type:
-                    file_text = extract_text_from_docx(uploaded_file)
-                else:
-                    file_text = str(uploaded_file.read(), "utf-8")
-                
-                # AI Parsing
-                extracted_data = parse_resume_with_ai(file_text)
-                
-                # Fill Info
-                if extracted_data:
-                    found_fields = []
-                    for key, value in extracted_data.items():
-                        if value and str(value).lower() != "null" and key in REQUIRED_FIELDS:
-                            st.session_state.collected_info[key] = str(value)
-                            found_fields.append(key)
-                    
-                    st.session_state.resume_uploaded = True
+                # Text Extraction + AI Parsing (cached by file content)
+                found_fields = engine.ingest_resume(st.session_state, uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)
+                if st.session_state.resume_uploaded:
                     st.success(f"✅ Extracted: {', '.join(found_fields[:3])}...")
             except Exception as e:
                 st.error(f"Error parsing file: {e}")
 
+    with st.expander("📦 Batch Screening (recruiters)"):
+        # Spends the shared Groq quota and writes to the candidate index: recruiters only
+        if recruiter_login(key="batch_recruiter_password"):
+            batch_files = st.file_uploader("Upload many resumes", type=["pdf", "docx", "txt"], accept_multiple_files=True, key="batch_files")
+            if "batch_results" not in st.session_state: st.session_state.batch_results = []
+            results = st.session_state.batch_results
+
+            if batch_files and st.button("🚀 Screen All", use_container_width=True):
+                # Files already screened OK in this session are skipped, so a re-click resumes
+                done = {row["sha256"] for row in results if row["status"] == "ok"}
+                results[:] = [row for row in results if row["status"] == "ok"]
+                progress = st.progress(0.0, text="Screening resumes...")
+                def on_result(row):
+                    results.append(row)
+                    progress.progress(min(len(results) / len(batch_files), 1.0), text=f"Screened {len(results)}/{len(batch_files)}")
+                try:
+                    counts = run_batch_screening([(f.name, f.getvalue()) for f in batch_files], on_result, skip=done)
+                    index_candidates(*[candidate_record(row, candidate_id="sha256:" + row["sha256"], source="batch")
+                                       for row in results if row["status"] == "ok"])
+                    st.toast(f"Batch done: {counts['ok']} ok, {counts['error']} failed", icon="✅")
+                except Exception as e:
+                    st.error(f"Batch screening stopped: {e}")
+
+            job_description = st.text_area("Job description (optional)", key="batch_job",
+                                           help="Ranks screened resumes against it locally, without an LLM call.")
+            if results:
+                shown, columns = results, None
+                if job_description.strip():
+                    # Deterministic pre-screen: skill coverage + TF-IDF similarity + experience fit
+                    with span("job_match"):
+                        ranked = rank_candidates(job_description, [row for row in results if row["status"] == "ok"])
+                    shown = [{**result, **row} for row, result in ranked]
+                    columns = [*MATCH_COLUMNS, *RESULT_COLUMNS]
+                st.dataframe(shown, hide_index=True, column_order=columns)
+                st.download_button("📥 Download CSV", rows_to_csv(shown, columns), "screening_results.csv", "text/csv", use_container_width=True)
+
     st.divider()
     if st.button("🔄 Start New Interview", use_container_width=True):
         st.session_state.clear()
+        st.experimental_set_query_params()
         st.rerun()
+    st.caption(f"Session ID: `{st.session_state.session_sync.session_id}`")
+
+startup.mark("header + sidebar")
 
 # --- SYSTEM PROMPT ---
-info_summary = ", ".join([f"{k}: {v}" for k, v in st.session_state.collected_info.items()])
-next_missing = get_next_missing_field()
-
-system_prompt = f"""
-You are 'TalentScout', an AI recruiter.
-CURRENT LANGUAGE: {selected_lang}.
-CANDIDATE INFO KNOWN: {info_summary}
-PROTOCOL:
-1. If all info is known (Tech Stack, etc), START TECHNICAL INTERVIEW immediately.
-2. If info is missing ({next_missing}), ask for it specifically.
-3. If technical interview, ask questions based on: {st.session_state.collected_info.get('Tech Stack', 'General')}.
-KEEP RESPONSES CONCISE.
-"""
-
-if not st.session_state.messages:
-    st.session_state.messages = [{"role": "system", "content": system_prompt}]
-else:
-    st.session_state.messages[0]["content"] = system_prompt
+# Rebuilt only when the candidate info or language changed since the last run
+engine.sync_system_prompt(st.session_state, selected_lang)
+
+# --- RESUME TRANSITION LOGIC ---
+# Before the chat is drawn, so the greeting shows in this run instead of costing a second one
+if engine.open_with_resume(st.session_state, selected_lang): persist_session()
 
 # --- MAIN CHAT UI ---
+# Only the newest messages are drawn as bubbles; older ones are paged on demand,
+# so a rerun costs the same at turn 40 as at turn 4
+if "transcript_pages" not in st.session_state: st.session_state.transcript_pages = TranscriptPages()
 chat_container = st.container()
 
 with chat_container:
-    for message in st.session_state.messages:
-        if message["role"] != "system":
-            avatar = "🤖" if message["role"] == "assistant" else "👤"
-            with st.chat_message(message["role"], avatar=avatar):
-                st.markdown(message["content"])
-
-# --- RESUME TRANSITION LOGIC ---
-if st.session_state.resume_uploaded and len(st.session_state.messages) == 1:
-    next_field = get_next_missing_field()
-    name = st.session_state.collected_info.get("Full Name", "Candidate")
-    
-    if next_field:
-        st.session_state.phase = "gathering_info"
-        msg = get_translation(selected_lang, "greeting", field=next_field, name=name)
-    else:
-        st.session_state.phase = "technical_interview"
-        stack = st.session_state.collected_info.get("Tech Stack", "")
-        msg = get_translation(selected_lang, "greeting_full", name=name, stack=stack)
-    
-    st.session_state.messages.append({"role": "assistant", "content": msg})
-    st.rerun()
+    earlier, recent = split_transcript(st.session_state.messages)
+    # A fixed label, so the toggle keeps its state as the history grows
+    if earlier and st.toggle("🕘 Show earlier conversation", key="show_history"):
+        pages = st.session_state.transcript_pages
+        st.caption(f"{len(earlier)} earlier messages")
+        page = st.number_input("Page", 1, pages.count(earlier), pages.count(earlier), key="history_page")
+        st.markdown(pages.page(earlier, page - 1))
+    for message in recent:
+        avatar = "🤖" if message["role"] == "assistant" else "👤"
+        with st.chat_message(message["role"], avatar=avatar):
+            st.markdown(message["content"])
 
 # --- INPUT HANDLER ---
 if prompt := st.chat_input("Type your response..."):
-    st.session_state.messages.append({"role": "user", "content": prompt})
     with st.chat_message("user", avatar="👤"): st.markdown(prompt)
-
-    # 1. INFO GATHERING
-    if st.session_state.phase == "gathering_info":
-        current_field = get_next_missing_field()
-        lang_to_use = selected_lang
-        if detect_hinglish(prompt): lang_to_use = "Hinglish"
-
-        # Handle Start (No Resume)
-        if not st.session_state.collected_info and prompt.lower() in GREETINGS:
-             assistant_text = get_translation(lang_to_use, "greeting_manual", current_field)
-             st.session_state.messages.append({"role": "assistant", "content": assistant_text})
-             with st.chat_message("assistant", avatar="🤖"): st.markdown(assistant_text)
-        else:
-            # INTELLIGENT PROCESSING
-            processed = process_user_input(prompt, current_field, lang_to_use)
-            
-            if not processed["is_answer"]:
-                response = processed["response_message"]
-                st.session_state.messages.append({"role": "assistant", "content": response})
-                with st.chat_message("assistant", avatar="🤖"): st.markdown(response)
-            else:
-                answer_val = processed.get("extracted_value", prompt)
-                
-                # Validate
-                invalid = False
-                if current_field == "Email Address" and not is_valid_email(answer_val):
-                    invalid = True
-                    msg = get_translation(lang_to_use, "invalid_email")
-                    st.session_state.messages.append({"role": "assistant", "content": msg})
-                    with st.chat_message("assistant", avatar="🤖"): st.markdown(msg)
-                elif current_field == "Phone Number" and not is_valid_phone(answer_val):
-                    invalid = True
-                    msg = get_translation(lang_to_use, "invalid_phone")
-                    st.session_state.messages.append({"role": "assistant", "content": msg})
-                    with st.chat_message("assistant", avatar="🤖"): st.markdown(msg)
-                
-                if not invalid:
-                    if current_field: st.session_state.collected_info[current_field] = answer_val
-                    
-                    next_f = get_next_missing_field()
-                    if next_f:
-                        name = st.session_state.collected_info.get("Full Name", "")
-                        key = "thanks_sensitive" if next_f in SENSITIVE_FIELDS else "thanks_brief"
-                        msg = get_translation(lang_to_use, key, field=next_f, name=name)
-                        st.session_state.messages.append({"role": "assistant", "content": msg})
-                        with st.chat_message("assistant", avatar="🤖"): st.markdown(msg)
-                    else:
-                        st.session_state.phase = "technical_interview"
-                        name = st.session_state.collected_info.get("Full Name", "")
-                        stack = st.session_state.collected_info.get("Tech Stack", "")
-                        msg = get_translation(lang_to_use, "phase_transition", name=name, stack=stack)
-                        st.session_state.messages.append({"role": "assistant", "content": msg})
-                        with st.chat_message("assistant", avatar="🤖"): st.markdown(msg)
-
-    # 2. TECHNICAL INTERVIEW
-    else:
-        with st.chat_message("assistant", avatar="🤖"):
-            placeholder = st.empty()
-            full_resp = ""
-            try:
-                stream = client.chat.completions.create(
-                    model=FAST_MODEL,
-                    messages=st.session_state.messages,
-                    stream=True,
-                    temperature=0.6,
-                    max_tokens=250
-                )
-                for chunk in stream:
-                    content = chunk.choices[0].delta.content
-                    if content:
-                        full_resp += content
-                        placeholder.markdown(full_resp + "▌")
-                placeholder.markdown(full_resp)
-                st.session_state.messages.append({"role": "assistant", "content": full_resp})
-            except Exception as e:
-                st.error(f"Error: {e}")
+    show_events(engine.reply(st.session_state, prompt, selected_lang))
 
 # --- REPORT SECTION ---
 with st.sidebar:
     st.divider()
     st.markdown("### 📊 Evaluation")
-    if st.button("📝 Generate Report", type="primary"):
-        if len(st.session_state.messages) < 4:
-            st.toast("⚠️ Chat more to get a report!", icon="⚠️")
-        else:
-            with st.spinner("Analyzing candidate..."):
-                prompt_text = """
-                Generate JSON evaluation.
-                Fields: name, position, tech_stack, 
-                technical_score (0-100), communication_score (0-100), problem_solving_score (0-100), experience_relevance (0-100),
-                verdict (Hire/No Hire/Maybe), strengths (list), improvement_areas (list),
-                graph_summary (1 brief sentence explaining what the scores mean for this candidate).
-                """
-                msgs = st.session_state.messages + [{"role": "user", "content": prompt_text}]
-                try:
-                    res = client.chat.completions.create(
-                        model=SMART_MODEL,
-                        messages=msgs,
-                        response_format={"type": "json_object"}
-                    )
-                    report = json.loads(res.choices[0].message.content)
-                    st.session_state.last_report = report
-                    st.toast("Report Ready!", icon="✅")
-                except Exception as e:
-                    st.error(f"Analysis failed: {e}")
+    stats = st.session_state.intake_stats
+    if stats["fast"] + stats["llm"]:
+        st.caption(f"⚡ Answers parsed locally: {stats['fast']}/{stats['fast'] + stats['llm']}")
+    if DEBUG_PANEL or st.experimental_get_query_params().get("debug") == ["1"]:
+        with st.expander("🛠️ Performance (this replica)"):
+            st.dataframe(REGISTRY.snapshot(), hide_index=True)
+            st.download_button("📈 Prometheus metrics", REGISTRY.render_prometheus(), "metrics.txt", "text/plain")
+    report_job = engine.report_job(st.session_state)
+    # Disabled while a job runs; a click that slips through still dedupes in ReportJobs.submit
+    if st.button("📝 Generate Report", type="primary", disabled=bool(report_job and report_job.active)):
+        started = engine.start_report(st.session_state)
+        if started is None: st.toast("⚠️ Chat more to get a report!", icon="⚠️")
+        else: report_job = started
+
+    report_status = st.empty()
+
+def show_report_progress(job):
+    with report_status.container():
+        st.info(f"⏳ {job.stage}... ({job.elapsed:.0f}s)")
+        # Scores appear one by one as the evaluation JSON streams in
+        for field in SCORE_FIELDS:
+            if field in job.partial: st.caption(f"{field.replace('_', ' ').capitalize()}: **{job.partial[field]}**")
+
+def apply_report_job(job):
+    """Copies a finished job into the session, once per job."""
+    for event in engine.apply_report(st.session_state, job):
+        if event.kind == "report": st.toast(event.text, icon="✅")
+        elif event.kind == "notice": st.toast(f"⚠️ {event.text}")
+        else: report_status.error(event.text)
 
 # --- DASHBOARD & PDF DOWNLOAD ---
-if "last_report" in st.session_state:
-    r = st.session_state.last_report
+def render_dashboard(r):
     st.markdown("---")
     st.subheader(f"Evaluation: {r.get('name', 'Candidate')}")
     
@@ -555,9 +333,27 @@ if "last_report" in st.session_state:
     c3.metric("Verdict", r.get('verdict'))
     
     try:
-        pdf_bytes = generate_pdf_report(r)
+        # Usually pre-rendered by the report job, so this is a cache hit
+        artifacts = engine.report_cache.get(r)
         d1, d2 = st.columns(2)
-        d1.download_button("📥 Download JSON", json.dumps(r, indent=2), "report.json", "application/json")
-        d2.download_button("📄 Download PDF Report", pdf_bytes, "candidate_report.pdf", "application/pdf")
+        d1.download_button("📥 Download JSON", artifacts.json, "report.json", "application/json")
+        d2.download_button("📄 Download PDF Report", artifacts.pdf, "candidate_report.pdf", "application/pdf")
     except Exception as e:
         st.error(f"PDF Generation Error: {e}")
+
+apply_report_job(report_job)
+dashboard = st.empty()
+if "last_report" in st.session_state:
+    with dashboard.container(): render_dashboard(st.session_state.last_report)
+
+persist_session()
+if METRICS_FILE: REGISTRY.write_textfile(METRICS_FILE, min_interval=METRICS_FILE_INTERVAL)
+startup.finish()
+
+# Check on the background report at the very end, once per run: draw its progress, then rerun
+# shortly. Each run returns quickly, so input is never queued behind the job, and a finished
+# job is applied near the top of the next run by apply_report_job.
+if report_job and report_job.active:
+    show_report_progress(report_job)
+    time.sleep(REPORT_POLL_INTERVAL)
+    st.rerun()
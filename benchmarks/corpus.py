@@ -0,0 +1,63 @@
+"""Synthetic, deterministic resumes for the benchmarks (PDF, DOCX and TXT)."""
+import io
+import random
+
+FIRST = ["Aarav", "Priya", "Rohan", "Sara", "Vikram", "Ananya", "Kabir", "Meera", "Arjun", "Isha"]
+LAST = ["Sharma", "Iyer", "Khan", "Patel", "Reddy", "Das", "Mehta", "Nair", "Gupta", "Bose"]
+SKILLS = ["Python", "Django", "React", "Node.js", "SQL", "PostgreSQL", "Docker", "Kubernetes", "AWS", "Go",
+          "Java", "Spring", "TypeScript", "Redis", "Kafka", "Terraform", "GraphQL", "Pandas", "PyTorch", "Rust"]
+VERBS = ["Built", "Designed", "Migrated", "Optimised", "Led", "Automated", "Scaled", "Refactored"]
+THINGS = ["a payments API", "the search service", "CI pipelines", "a data warehouse", "the mobile backend",
+          "an event-driven billing system", "internal dashboards", "the recommendation engine"]
+
+
+def resume_lines(seed, sections=1):
+    """Plain-text resume; ``sections`` repeats the experience block to grow the document."""
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{seed}@example.com | +91 98{rng.randint(10000000, 99999999)}",
+        f"{rng.randint(1, 15)} years of experience",
+        "",
+        "Skills: " + ", ".join(rng.sample(SKILLS, 6)),
+        "",
+        "Experience",
+    ]
+    for s in range(sections):
+        lines.append(f"Company {s + 1} - Senior Engineer ({2024 - s * 2}-{2026 - s * 2})")
+        for _ in range(8):
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(THINGS)} using {rng.choice(SKILLS)} and {rng.choice(SKILLS)}.")
+    lines += ["", "Education", "B.Tech in Computer Science"]
+    return lines
+
+
+def make_txt(seed, sections=1) -> bytes:
+    return "\n".join(resume_lines(seed, sections)).encode("utf-8")
+
+
+def make_pdf(seed, pages=1) -> bytes:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_font("Arial", size=10)
+    # ~5 experience blocks fill a page
+    lines = resume_lines(seed, sections=max(1, pages * 5))
+    pdf.add_page()
+    for line in lines:
+        if pdf.get_y() > 270:
+            if pdf.page_no() >= pages: break
+            pdf.add_page()
+        pdf.cell(0, 5, line, ln=True)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def make_docx(seed, sections=1) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in resume_lines(seed, sections):
+        document.add_paragraph(line)
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
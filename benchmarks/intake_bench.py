@@ -0,0 +1,101 @@
+"""Correctness and speed of the intake fast path (``talentscout.intake``).
+
+Every labelled answer below either has the value the fast path should save
+without an LLM call, or ``None``: a refusal, hedge or junk answer that must
+go to the model instead of being stored as the field. A ``None`` answer the
+fast path accepts is a misparse and fails the run (exit status 1).
+
+    python -m benchmarks.intake_bench --repeat 2000
+"""
+import argparse
+import sys
+import time
+
+from talentscout.intake import SKIPPED, parse_locally
+
+EVAL_SET = {
+    "Full Name": [
+        ("John Doe", "John Doe"),
+        ("my name is Priya Sharma", "Priya Sharma"),
+        ("Maria de la Cruz", "Maria de la Cruz"),
+        ("asdf qwer", None),
+        ("Rather not", None),
+        ("I forgot", None),
+        ("Hello there", None),
+        ("Not Applicable", None),
+    ],
+    "Email Address": [
+        ("priya.sharma@example.com", "priya.sharma@example.com"),
+        ("it's john@x.com", "john@x.com"),
+        ("I dont want to share", None),
+    ],
+    "Phone Number": [
+        ("+91 98765 43210", "+91 98765 43210"),
+        ("call me at 2024-01-01", None),
+        ("rather not, sorry", None),
+    ],
+    "Years of Experience": [
+        ("5 years", "5 years"),
+        ("none", "0 years"),
+        ("I forgot", None),
+    ],
+    "Desired Position(s)": [
+        ("Senior Backend Engineer", "Senior Backend Engineer"),
+        ("Data Scientist", "Data Scientist"),
+        ("SDE 2", "SDE 2"),
+        ("anything", None),
+        ("Not applicable", None),
+        ("I don't want to say", None),
+        ("ok", None),
+    ],
+    "Current Location": [
+        ("Pune, India", "Pune, India"),
+        ("I live in New York", "New York"),
+        ("Bengaluru", "Bengaluru"),
+        ("I dont want to share", None),
+        ("Rather not", None),
+        ("I forgot", None),
+        ("lol", None),
+        ("Not applicable", None),
+        ("n/a", SKIPPED),
+    ],
+    "Tech Stack": [
+        ("Python, Django, PostgreSQL, Docker", "Python, Django, PostgreSQL, Docker"),
+        ("I am not sure", None),
+        ("forgot", None),
+    ],
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the intake fast path against labelled answers.")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    labelled = [(text, field, expected) for field, cases in EVAL_SET.items() for text, expected in cases]
+    misparsed, missed = [], []
+    for text, field, expected in labelled:
+        result = parse_locally(text, field)
+        got = result.value if result.usable else None
+        if expected is None and got is not None: misparsed.append((field, text, got))
+        elif expected is not None and got != expected: missed.append((field, text, got, expected))
+
+    answers = sum(1 for *_, expected in labelled if expected is not None)
+    print(f"Fast path: {answers - len(missed)}/{answers} answers parsed locally, "
+          f"{len(misparsed)} refusals or junk answers saved as a field")
+    for field, text, got in misparsed:
+        print(f"  MISPARSE  {field:<20} {text!r} -> {got!r}")
+    for field, text, got, expected in missed:
+        print(f"  to LLM    {field:<20} {text!r} -> {got!r} (expected {expected!r})")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for text, field, _ in labelled:
+            parse_locally(text, field)
+    per_call = (time.perf_counter() - started) / (args.repeat * len(labelled))
+    print(f"\nPer answer: {per_call * 1e6:.1f} us")
+    return 1 if misparsed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
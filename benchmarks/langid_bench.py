@@ -0,0 +1,172 @@
+"""Accuracy and speed of ``talentscout.langid`` against the old ``detect_hinglish``.
+
+The labelled messages below are held out from ``langid_samples`` (the model
+never saw them). The old function only answers "Hinglish or not", so it is
+scored on that binary task; the new identifier is scored on the same task
+and on the full six-way one.
+
+    python -m benchmarks.langid_bench --repeat 2000
+"""
+import argparse
+import time
+
+from talentscout.langid import get_identifier, is_hinglish
+
+EVAL_SET = {
+    "English": [
+        "I have seven years of experience, mostly in Java and Spring Boot.",
+        "Why do you want to know my current location?",
+        "My strongest skill is designing REST APIs that are easy to evolve.",
+        "I worked at a fintech startup where we processed card payments.",
+        "Okay sounds good, go ahead with the next one",
+        "I'd add an index on the user id column and check the query plan again.",
+        "We had some issues with memory leaks in the node service last year.",
+        "Could you repeat the question please?",
+        "I am based out of Hyderabad, India.",
+        "Sure, I can explain how garbage collection works in the JVM.",
+        "Honestly I'm not sure, but I think a heap would be the right choice here.",
+        "Thank you so much, I enjoyed the conversation.",
+        # Short replies the old heuristic flagged via "ok", "ho", "ke", "se"...
+        "Ok thanks",
+        "Makes sense to me",
+        "Sure, hope so",
+        "Please see my resume",
+        "Those were the key areas",
+    ],
+    "Hindi": [
+        "मेरे पास जावा में सात साल का अनुभव है।",
+        "आप मेरा वर्तमान पता क्यों जानना चाहते हैं?",
+        "मुझे एपीआई डिज़ाइन करना सबसे अच्छा आता है।",
+        "कृपया सवाल फिर से पूछिए।",
+        "मैं हैदराबाद से हूँ।",
+        "मुझे पक्का नहीं पता, लेकिन मुझे लगता है कि यह सही तरीका है।",
+        "बातचीत के लिए आपका बहुत धन्यवाद।",
+        "पिछले साल हमारी सेवा में मेमोरी की समस्या आई थी।",
+    ],
+    "Spanish": [
+        "Tengo siete años de experiencia, sobre todo con Java y Spring Boot.",
+        "¿Por qué quiere saber dónde vivo actualmente?",
+        "Mi mayor fortaleza es diseñar APIs fáciles de mantener.",
+        "Trabajé en una startup de pagos donde procesábamos tarjetas.",
+        "¿Puede repetir la pregunta, por favor?",
+        "Añadiría un índice en la columna del usuario y revisaría el plan de la consulta.",
+        "Muchas gracias, disfruté mucho la conversación.",
+        "No estoy seguro, pero creo que un montículo sería lo correcto.",
+    ],
+    "French": [
+        "J'ai sept ans d'expérience, surtout avec Java et Spring Boot.",
+        "Pourquoi voulez-vous connaître ma ville actuelle ?",
+        "Ma plus grande force est de concevoir des API faciles à faire évoluer.",
+        "J'ai travaillé dans une startup de paiement où nous traitions des cartes.",
+        "Pouvez-vous répéter la question, s'il vous plaît ?",
+        "J'ajouterais un index sur la colonne utilisateur et je regarderais le plan de requête.",
+        "Merci beaucoup, j'ai apprécié cet échange.",
+        "Je ne suis pas sûr, mais je pense qu'un tas serait le bon choix.",
+    ],
+    "German": [
+        "Ich habe sieben Jahre Erfahrung, vor allem mit Java und Spring Boot.",
+        "Warum möchten Sie meinen aktuellen Wohnort wissen?",
+        "Meine größte Stärke ist es, APIs zu entwerfen, die sich leicht weiterentwickeln lassen.",
+        "Ich habe bei einem Zahlungs-Startup gearbeitet, das Kartenzahlungen verarbeitet hat.",
+        "Können Sie die Frage bitte wiederholen?",
+        "Ich würde einen Index auf die Benutzerspalte legen und den Abfrageplan erneut prüfen.",
+        "Vielen Dank, das Gespräch hat mir gefallen.",
+        "Ich bin mir nicht sicher, aber ich denke, ein Heap wäre hier richtig.",
+    ],
+    "Hinglish": [
+        "Mujhe Java aur Spring Boot mein saat saal ka experience hai.",
+        "Aap meri current location kyun jaanna chahte ho?",
+        "Meri sabse badi strength APIs design karna hai.",
+        "Main ek fintech startup mein kaam karta tha jahan card payments process hote the.",
+        "Kya aap sawaal dobara bol sakte ho?",
+        "Main user id column pe index lagaunga aur query plan phir se dekhunga.",
+        "Pichle saal node service mein memory leak ki problem aayi thi.",
+        "Pakka nahi pata, lekin mujhe lagta hai heap sahi rahega.",
+        "Bahut shukriya, baat karke accha laga.",
+        "Main Hyderabad se hoon, abhi wahi rehta hoon.",
+        "Haan theek hai, agla question poochiye.",
+        "Yaar mujhe ye wala topic utna nahi aata.",
+    ],
+}
+
+
+# Bare names and places answering the intake questions: romanised Indian words, but not a
+# switch to Hinglish. Scored on the binary task only, since they carry no language of their own.
+PROPER_NOUN_ANSWERS = [
+    "Bengaluru", "Ahmedabad", "Hyderabad", "Chandigarh, India", "Priya Sharma", "Rahul Kumar", "Ananya Iyer",
+]
+
+
+def legacy_detect_hinglish(text: str) -> bool:
+    """The app's previous heuristic, kept verbatim for comparison."""
+    hinglish_indicators = {
+        "haan", "nahi", "theek", "ok", "okk", "shukriya", "thanks",
+        "kya", "aap", "mujhe", "apna", "kar", "sakte", "daal", "acha", "chalega",
+        "baat", "karo", "bol", "samajh", "dekh", "main", "maine", "hoon", "ho",
+        "ke", "ka", "ki", "se", "par", "aur", "ya", "toh", "bas", "tha",
+        "sey", "mein", "woh", "ye", "voh", "inko", "unko", "humein", "unhein"
+    }
+    words = text.lower().split()
+    count = sum(1 for w in words if any(w.startswith(h) or w.endswith(h) for h in hinglish_indicators))
+    return count >= len(words) * 0.3
+
+
+def binary_report(predict, labelled):
+    tp = fp = fn = tn = 0
+    for text, lang in labelled:
+        hit, truth = predict(text), lang == "Hinglish"
+        tp += hit and truth
+        fp += hit and not truth
+        fn += truth and not hit
+        tn += not hit and not truth
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    return {"accuracy": (tp + tn) / len(labelled), "precision": precision, "recall": recall, "false_positives": fp}
+
+
+def time_per_call(fn, texts, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - started) / (repeat * len(texts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the language identifier with the old Hinglish heuristic.")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    labelled = [(text, lang) for lang, texts in EVAL_SET.items() for text in texts]
+    texts = [text for text, _ in labelled]
+    identifier = get_identifier()
+
+    binary = labelled + [(text, "English") for text in PROPER_NOUN_ANSWERS]
+    print("Hinglish vs. everything else (including bare names and places)")
+    for name, predict in (("legacy detect_hinglish", legacy_detect_hinglish), ("langid is_hinglish", is_hinglish)):
+        r = binary_report(predict, binary)
+        print(f"  {name:<24} accuracy {r['accuracy']:.1%}  precision {r['precision']:.1%}  "
+              f"recall {r['recall']:.1%}  false positives {r['false_positives']}")
+
+    confusion = {lang: {} for lang in EVAL_SET}
+    for text, lang in labelled:
+        got = identifier.detect(text) or "(none)"
+        confusion[lang][got] = confusion[lang].get(got, 0) + 1
+    correct = sum(row.get(lang, 0) for lang, row in confusion.items())
+    print(f"\nSix-way accuracy (langid): {correct / len(labelled):.1%}")
+    for lang, row in confusion.items():
+        misses = ", ".join(f"{k} x{v}" for k, v in row.items() if k != lang)
+        print(f"  {lang:<9} {row.get(lang, 0)}/{len(EVAL_SET[lang])}" + (f"  (as {misses})" if misses else ""))
+
+    legacy = time_per_call(legacy_detect_hinglish, texts, args.repeat)
+    single = time_per_call(identifier.scores, texts, args.repeat)
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        identifier.scores_many(texts)
+    batch = (time.perf_counter() - started) / (args.repeat * len(texts))
+    print(f"\nPer message: legacy {legacy * 1e6:.1f} us | langid.scores {single * 1e6:.1f} us "
+          f"| langid.scores_many {batch * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Load test: many concurrent scripted candidates against one app replica.
+
+Each simulated candidate is a ``streamlit.testing`` session of the real
+``app.py`` (the same script runs, caches and shared clients a browser
+session would hit), driven through a full interview: resume upload,
+intake answers chosen from what the bot asked, technical answers, the
+report and a few idle reruns. All LLM calls go to the mock Groq server.
+
+Sessions run on threads inside one process, which is one replica: they
+share its ``st.cache_resource`` objects, connection pool and GIL, like
+browser sessions on one Streamlit server. ``--replicas`` starts that many
+worker processes against the same mock and reports each of them.
+
+For every concurrency level in ``--sessions`` it records per-phase turn
+latency, the cost of an idle rerun with the full history on screen, turns
+per second, CPU use and peak RSS per replica, and marks the level where
+throughput stops growing (the saturation point):
+
+    python -m benchmarks.load --sessions 1 2 4 8 16
+    python -m benchmarks.load --sessions 8 --replicas 2 --save benchmarks/results/load.json
+    python -m benchmarks.load --sessions 8 --baseline benchmarks/results/load.json --fail-on-regression
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.run import INTERVIEW_ANSWERS, ROOT, AppSession, compare, follow_script_reruns, summarize  # sets the cache/store env
+from benchmarks import corpus
+from benchmarks.mock_groq import MockConfig, MockGroqServer
+
+PHASES = ("first_load", "resume_upload", "intake_turn", "interview_turn", "report_generate", "idle_rerun")
+TURN_PHASES = ("resume_upload", "intake_turn", "interview_turn", "report_generate")
+# Answers to whatever intake field the bot asks for next
+FIELD_ANSWERS = {
+    "Full Name": "Priya Sharma",
+    "Email Address": "priya.sharma@example.com",
+    "Phone Number": "+91 98765 43210",
+    "Years of Experience": "5 years",
+    "Desired Position": "Senior Backend Engineer",
+    "Current Location": "Pune, India",
+    "Tech Stack": "Python, Django, PostgreSQL, Docker",
+}
+MAX_INTAKE_TURNS = 12
+IDLE_RERUNS = 3
+SATURATION_GAIN = 1.1  # less than 10% more throughput for more sessions = saturated
+
+_candidate_ids = itertools.count()
+
+
+# --- UPLOADS ---
+class FakeUpload:
+    """What ``st.file_uploader`` returns, for a file the scripted candidate "picked"."""
+
+    def __init__(self, name, data, type="text/plain"):
+        self.name, self.type, self._data = name, type, data
+        self.size = len(data)
+
+    def getvalue(self):
+        return self._data
+
+
+def patch_file_uploader():
+    """AppTest (1.28) can't drive ``st.file_uploader``; hand the resume uploader the
+    file a session put in ``session_state["_load_upload"]`` instead."""
+    import streamlit as st
+
+    original = st.file_uploader
+
+    def file_uploader(label, *args, **kwargs):
+        upload = st.session_state.get("_load_upload")
+        if upload is not None and not kwargs.get("accept_multiple_files"):
+            original(label, *args, **kwargs)  # keep the widget tree identical
+            return upload
+        return original(label, *args, **kwargs)
+
+    st.file_uploader = file_uploader
+
+
+def patch_app_test():
+    """Makes ``streamlit.testing`` behave like one server with many sessions.
+
+    AppTest is built for one session at a time: each run installs a fresh
+    mock ``Runtime`` and clears it afterwards (breaking runs on other
+    threads), compiles the script again with a new ``ScriptCache``
+    (concurrent compiles trip a CPython 3.11 AST bug) and polls for the end
+    of the run every 100 ms (which would floor every timing). A real server
+    has one runtime and one script cache, and reports as soon as a run ends.
+    """
+    from unittest.mock import MagicMock
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import local_script_runner
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: runtime)
+    Runtime.exists = classmethod(lambda cls: True)
+
+    script_cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: script_cache
+    follow_script_reruns()  # and don't floor timings at AppTest's 100 ms polling
+    # Setting session_state from the driver thread is expected here
+    logging.getLogger("streamlit.runtime.scriptrunner.script_run_context").setLevel(logging.ERROR)
+
+
+# --- ONE CANDIDATE ---
+class ScriptedCandidate:
+    """A full interview as one app session; records the duration of every script run."""
+
+    def __init__(self, seed, think_ms=0.0):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.think_ms = think_ms
+        self.timings = {phase: [] for phase in PHASES}
+        self.turns = 0
+
+    def _think(self):
+        if self.think_ms: time.sleep(self.rng.uniform(0.5, 1.5) * self.think_ms / 1000)
+
+    def _record(self, phase, seconds):
+        self.timings[phase].append(seconds)
+        if phase in TURN_PHASES: self.turns += 1
+
+    def _answer(self, session):
+        # Answer the field named in the bot's last message (fields pre-filled from the resume are skipped)
+        last = next((m["content"] for m in reversed(session.at.session_state.messages) if m["role"] == "assistant"), "")
+        return next((answer for field, answer in FIELD_ANSWERS.items() if field in last), "Python, Django")
+
+    def run(self):
+        t0 = time.perf_counter()
+        session = AppSession()
+        self._record("first_load", time.perf_counter() - t0)
+
+        self._think()
+        # Resumes differ per candidate, so the parse cache doesn't hide the upload cost
+        session.at.session_state["_load_upload"] = FakeUpload(f"resume_{self.seed}.txt", corpus.make_txt(self.seed, 3))
+        self._record("resume_upload", session.rerun())
+
+        for _ in range(MAX_INTAKE_TURNS):
+            if session.at.session_state.phase != "gathering_info": break
+            self._think()
+            self._record("intake_turn", session.say(self._answer(session)))
+        for answer in INTERVIEW_ANSWERS:
+            self._think()
+            self._record("interview_turn", session.say(answer))
+
+        self._think()
+        self._record("report_generate", session.click("📝 Generate Report"))
+        for _ in range(IDLE_RERUNS):
+            self._record("idle_rerun", session.rerun())
+        return self
+
+
+# --- ONE REPLICA ---
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_replica(sessions, think_ms=0.0, seed=0):
+    """Runs ``sessions`` candidates concurrently in this process; returns raw timings and resource use."""
+    patch_file_uploader()
+    patch_app_test()
+    ScriptedCandidate(-1).run()  # warm-up: lazy imports, cache_resource singletons, connection pool
+    # Unique across levels and replicas, so every upload is a new resume
+    candidates = [ScriptedCandidate(seed * 1_000_000 + next(_candidate_ids), think_ms) for _ in range(sessions)]
+    errors = []
+
+    def run(candidate):
+        try:
+            candidate.run()
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=run, args=(c,), name=f"candidate-{i}") for i, c in enumerate(candidates)]
+    cpu, started = cpu_seconds(), time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    wall = time.perf_counter() - started
+    cpu = cpu_seconds() - cpu
+    return {
+        "sessions": sessions,
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # KiB on Linux
+        "turns": sum(c.turns for c in candidates),
+        "errors": errors,
+        "timings": {phase: [t for c in candidates for t in c.timings[phase]] for phase in PHASES},
+    }
+
+
+def run_replicas(sessions, replicas, think_ms, mock_url, seed=0):
+    """``sessions`` spread over ``replicas`` worker processes (the current one when there's one)."""
+    if replicas == 1: return [run_replica(sessions, think_ms, seed)]
+    per = [sessions // replicas + (1 if i < sessions % replicas else 0) for i in range(replicas)]
+    env = dict(os.environ, GROQ_BASE_URL=mock_url, GROQ_API_KEY="bench")
+    procs = [subprocess.Popen([sys.executable, "-m", "benchmarks.load", "--worker", str(n), "--think-ms", str(think_ms),
+                               "--seed", str(seed * replicas + i + 1)], cwd=ROOT, env=env, stdout=subprocess.PIPE) for i, n in enumerate(per) if n]
+    results = []
+    for proc in procs:
+        out, _ = proc.communicate()
+        if proc.returncode: raise RuntimeError(f"load worker exited with {proc.returncode}")
+        results.append(json.loads(out.decode("utf-8").strip().splitlines()[-1]))
+    return results
+
+
+def level_summary(replicas):
+    """One concurrency level: per-phase latency over every replica, plus throughput and resource use."""
+    wall = max(r["wall_s"] for r in replicas)
+    summary = {
+        "sessions": sum(r["sessions"] for r in replicas),
+        "turns_per_s": round(sum(r["turns"] for r in replicas) / wall, 2) if wall else None,
+        "errors": [e for r in replicas for e in r["errors"]],
+        "replicas": [{"sessions": r["sessions"], "cpu_pct": round(100 * r["cpu_s"] / r["wall_s"], 1),
+                      "max_rss_mb": round(r["max_rss_mb"], 1)} for r in replicas],
+        "phases": {},
+    }
+    for phase in PHASES:
+        samples = [t for r in replicas for t in r["timings"][phase]]
+        if samples: summary["phases"][phase] = summarize(samples, wall, 0)
+    # What a candidate feels on an ordinary chat turn
+    chat = [t for r in replicas for phase in ("intake_turn", "interview_turn") for t in r["timings"][phase]]
+    if chat: summary["phases"]["chat_turn"] = summarize(chat, wall, 0)
+    return summary
+
+
+def find_saturation(levels):
+    """The first level whose throughput gain over the previous one falls under SATURATION_GAIN."""
+    for prev, cur in zip(levels, levels[1:]):
+        if prev["turns_per_s"] and cur["turns_per_s"] < prev["turns_per_s"] * SATURATION_GAIN: return cur["sessions"]
+    return None
+
+
+def flat_results(levels):
+    """``{"<phase>@<sessions>": stats}`` in the shape ``benchmarks.run.compare`` expects."""
+    return {f"{phase}@{level['sessions']}": stats for level in levels for phase, stats in level["phases"].items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive concurrent scripted candidate sessions through app.py.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="concurrency levels to run")
+    parser.add_argument("--replicas", type=int, default=1, help="worker processes sharing the sessions")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between a candidate's turns")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mock time to first byte")
+    parser.add_argument("--tokens-per-second", type=float, default=500.0, help="mock streaming rate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95 slowdown that counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)  # internal: one replica of N sessions
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        # GROQ_BASE_URL is inherited from the parent, which runs the mock
+        print(json.dumps(run_replica(args.worker, args.think_ms, args.seed)))
+        return 0
+
+    config = MockConfig(latency_ms=args.latency_ms, tokens_per_second=args.tokens_per_second, seed=args.seed)
+    levels = []
+    with MockGroqServer(config) as mock:
+        os.environ["GROQ_BASE_URL"] = mock.url
+        os.environ["GROQ_API_KEY"] = "bench"
+        for level, sessions in enumerate(args.sessions):
+            print(f"running {sessions} concurrent session(s) on {args.replicas} replica(s) ...", flush=True)
+            levels.append(level_summary(run_replicas(sessions, args.replicas, args.think_ms, mock.url,
+                                                     seed=args.seed * len(args.sessions) + level)))
+
+    print(f"\n{'sessions':>8}{'turns/s':>9}{'turn p50':>10}{'turn p95':>10}{'rerun p95':>11}{'cpu %':>13}{'rss MB':>13}{'errors':>8}")
+    for level in levels:
+        chat = level["phases"].get("chat_turn", {})
+        rerun = level["phases"].get("idle_rerun", {}).get("p95_ms")
+        cpu = "/".join(f"{r['cpu_pct']:g}" for r in level["replicas"])
+        rss = "/".join(f"{r['max_rss_mb']:.0f}" for r in level["replicas"])
+        print(f"{level['sessions']:>8}{level['turns_per_s']:>9}{chat.get('p50_ms', '-'):>10}{chat.get('p95_ms', '-'):>10}"
+              f"{rerun or '-':>11}{cpu:>13}{rss:>13}{len(level['errors']):>8}")
+    for level in levels:
+        for error in level["errors"][:3]: print(f"  {level['sessions']} sessions: {error}")
+    saturation = find_saturation(levels)
+    print(f"\nSaturation: {f'throughput stops scaling at {saturation} sessions' if saturation else 'not reached'}")
+
+    payload = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "mock": vars(config), "replicas": args.replicas,
+               "levels": levels, "saturation": saturation, "results": flat_results(levels)}
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+        regressions = compare(flat_results(levels), baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Deterministic stand-in for the Groq (OpenAI-compatible) chat completions API.
+
+Serves ``POST /openai/v1/chat/completions`` (the path the Groq SDK uses) and
+``/v1/chat/completions``, with or without ``stream=True``. Replies are picked
+from the prompt so each TalentScout contract gets a well-formed answer:
+resume fields, intake classification, evaluation report, context summary or
+an interview question. Latency, streaming token rate and error injection are
+configurable, and injected errors come from a seeded RNG so runs repeat.
+
+    python -m benchmarks.mock_groq --port 8787 --latency-ms 80 --tokens-per-second 400
+    GROQ_BASE_URL=http://127.0.0.1:8787 streamlit run app.py
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETION_PATHS = ("/openai/v1/chat/completions", "/v1/chat/completions")
+
+QUESTION_BANK = [
+    "Can you explain how you would design a rate limiter for a public REST API, and which data structures you would use?",
+    "How do you find and fix a memory leak in a long-running service written in {stack}?",
+    "Walk me through how you would make a slow database query faster, from diagnosis to rollout.",
+    "What trade-offs do you consider when choosing between a message queue and direct HTTP calls between services?",
+    "How would you structure tests for a feature that depends on a flaky third-party API?",
+]
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 50.0  # time to first byte
+    jitter_ms: float = 0.0
+    tokens_per_second: float = 500.0  # streaming rate; 0 = no pacing
+    error_rate: float = 0.0  # share of requests answered with a 500
+    rate_limit_rate: float = 0.0  # share of requests answered with a 429
+    retry_after: float = 0.2
+    seed: int = 0
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // 4)
+
+
+def _last_user_message(messages):
+    for message in reversed(messages):
+        if message.get("role") == "user": return message.get("content") or ""
+    return ""
+
+
+def _resume_fields(prompt):
+    text = prompt.split("Resume Text:", 1)[-1]
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    email = re.search(r"[\w\.+-]+@[\w\.-]+\.[A-Za-z]{2,}", text)
+    phone = re.search(r"\+?\d[\d \-]{7,}\d", text)
+    years = re.search(r"(\d{1,2})\+?\s+years", text)
+    skills = re.search(r"Skills?:\s*(.+)", text)
+    return {
+        "Full Name": lines[0] if lines else None,
+        "Email Address": email.group(0) if email else None,
+        "Phone Number": phone.group(0).strip() if phone else None,
+        "Years of Experience": years.group(1) if years else None,
+        "Current Location": "Bengaluru, India",
+        "Tech Stack": skills.group(1).strip() if skills else "Python, SQL",
+    }
+
+
+def build_reply(body):
+    """Deterministic reply text for a request body."""
+    messages = body.get("messages") or []
+    prompt = _last_user_message(messages)
+    if "Extract the following fields from the resume" in prompt:
+        return json.dumps(_resume_fields(prompt))
+    if "We are currently asking the candidate for" in prompt:
+        user_input = re.search(r'User Input: "(.*)"', prompt)
+        user_input = user_input.group(1) if user_input else ""
+        if user_input.rstrip().endswith("?"):
+            return json.dumps({
+                "is_answer": False,
+                "extracted_value": None,
+                "response_message": "We use it only to contact you about this application. Could you share it?",
+            })
+        return json.dumps({"is_answer": True, "extracted_value": user_input.strip(), "response_message": None})
+    if "Write technical interview questions" in prompt:
+        skill = re.search(r'for the skill "(.+?)"', prompt)
+        skill = skill.group(1) if skill else "this skill"
+        return json.dumps({level: [q.format(stack=skill) for q in QUESTION_BANK[i:i + 3]]
+                           for i, level in enumerate(("junior", "mid", "senior"))})
+    if "Generate JSON evaluation" in prompt:
+        turns = sum(1 for m in messages if m.get("role") == "user")
+        return json.dumps({
+            "name": "Benchmark Candidate",
+            "position": "Backend Engineer",
+            "tech_stack": "Python, SQL, Docker",
+            "technical_score": 60 + turns % 30,
+            "communication_score": 70,
+            "problem_solving_score": 65,
+            "experience_relevance": 75,
+            "verdict": "Hire",
+            "strengths": ["Clear explanations", "Solid fundamentals"],
+            "improvement_areas": ["System design depth"],
+            "graph_summary": "Balanced profile with strong communication.",
+        })
+    if "running summary" in prompt:
+        return "The candidate answered questions on APIs, databases and testing with reasonable depth."
+    answered = sum(1 for m in messages if m.get("role") == "assistant")
+    return "Good answer. " + QUESTION_BANK[answered % len(QUESTION_BANK)].format(stack="Python")
+
+
+class MockGroqServer:
+    """Runs the mock on a background thread; use as a context manager."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockConfig()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-groq", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _roll(self):
+        """Decides this request's fate: None, 429 or 500."""
+        cfg = self.config
+        with self._rng_lock:
+            self.requests += 1
+            r = self._rng.random()
+            jitter = self._rng.uniform(-cfg.jitter_ms, cfg.jitter_ms) if cfg.jitter_ms else 0.0
+        if r < cfg.rate_limit_rate: return 429, jitter
+        if r < cfg.rate_limit_rate + cfg.error_rate: return 500, jitter
+        return None, jitter
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+            def log_message(self, *args):
+                pass
+
+            def _json(self, status, payload, headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                if self.path.split("?")[0] not in COMPLETION_PATHS:
+                    self._json(404, {"error": {"message": "not found"}})
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                cfg = server.config
+                fate, jitter = server._roll()
+                time.sleep(max(cfg.latency_ms + jitter, 0) / 1000)
+                if fate == 429:
+                    self._json(429, {"error": {"message": "rate limited (mock)", "type": "rate_limit"}},
+                               {"retry-after": str(cfg.retry_after)})
+                    return
+                if fate == 500:
+                    self._json(500, {"error": {"message": "internal error (mock)"}})
+                    return
+                reply = build_reply(body)
+                prompt_tokens = sum(estimate_tokens(m.get("content") or "") for m in body.get("messages") or [])
+                if body.get("stream"):
+                    self._stream(body, reply, prompt_tokens)
+                else:
+                    self._json(200, {
+                        "id": f"mock-{server.requests}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": body.get("model", "mock"),
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": reply}}],
+                        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": estimate_tokens(reply),
+                                  "total_tokens": prompt_tokens + estimate_tokens(reply)},
+                    })
+
+            def _chunk(self, data):
+                payload = f"data: {data}\n\n".encode("utf-8")
+                self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+                self.wfile.flush()
+
+            def _stream(self, body, reply, prompt_tokens):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                base = {"id": f"mock-{server.requests}", "object": "chat.completion.chunk",
+                        "created": int(time.time()), "model": body.get("model", "mock")}
+                pieces = re.findall(r"\S+\s*", reply)
+                delay = 1 / server.config.tokens_per_second if server.config.tokens_per_second else 0
+                for piece in pieces:
+                    if delay: time.sleep(delay)
+                    self._chunk(json.dumps(dict(base, choices=[{"index": 0, "delta": {"content": piece}, "finish_reason": None}])))
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(pieces),
+                         "total_tokens": prompt_tokens + len(pieces)}
+                self._chunk(json.dumps(dict(base, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                                            x_groq={"id": base["id"], "usage": usage})))
+                self._chunk("[DONE]")
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a deterministic mock of the Groq chat completions API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--tokens-per-second", type=float, default=500.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    config = MockConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, tokens_per_second=args.tokens_per_second,
+                        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=args.seed)
+    server = MockGroqServer(config, host=args.host, port=args.port)
+    print(f"Mock Groq API on {server.url} (set GROQ_BASE_URL to this)", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
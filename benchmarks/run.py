@@ -0,0 +1,313 @@
+"""Offline performance benchmarks for TalentScout.
+
+Starts the mock Groq server, points the app at it with GROQ_BASE_URL and
+drives the real code paths: resume text extraction over a synthetic corpus,
+resume parsing through the resilient client, and full Streamlit script runs
+(via ``streamlit.testing``) for the intake loop, streaming interview turns,
+report generation and PDF rendering.
+
+Each scenario reports throughput, p50/p95/p99 latency and peak traced memory.
+Results can be saved and compared against a baseline:
+
+    python -m benchmarks.run --save benchmarks/results/latest.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --fail-on-regression
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
+# Must be set before talentscout modules read them at import time
+os.environ.setdefault("TALENTSCOUT_CACHE_DIR", tempfile.mkdtemp(prefix="talentscout-bench-"))
+os.environ["TALENTSCOUT_SESSION_STORE"] = "memory://"
+
+from benchmarks import corpus  # noqa: E402
+from benchmarks.mock_groq import MockConfig, MockGroqServer  # noqa: E402
+
+INTAKE_ANSWERS = [
+    "hello",
+    "Priya Sharma",
+    "priya.sharma@example.com",
+    "Why do you need my phone number?",  # forces the LLM path
+    "+91 98765 43210",
+    "around five years, mostly backend",  # not locally parseable
+    "Senior Backend Engineer",
+    "Pune, India",
+    "Python, Django, PostgreSQL, Docker",
+]
+INTERVIEW_ANSWERS = [
+    "I would use a token bucket per API key stored in Redis with a TTL.",
+    "I'd take heap snapshots over time and diff them to find growing allocations.",
+    "First EXPLAIN ANALYZE, then add the missing index and roll out behind a flag.",
+    "Queues decouple producers and consumers but add latency and operational cost.",
+]
+SAMPLE_REPORT = {
+    "name": "Priya Sharma", "position": "Senior Backend Engineer", "tech_stack": "Python, Django, PostgreSQL, Docker",
+    "technical_score": 78, "communication_score": 82, "problem_solving_score": 74, "experience_relevance": 80,
+    "verdict": "Hire", "strengths": ["Clear reasoning", "Production experience"],
+    "improvement_areas": ["Distributed systems depth"], "graph_summary": "Strong, balanced profile.",
+}
+
+
+# --- STATS ---
+def percentile(sorted_values, q):
+    if not sorted_values: return None
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def summarize(samples, wall_seconds, peak_bytes):
+    values = sorted(samples)
+    ms = lambda v: round(v * 1000, 2) if v is not None else None
+    return {
+        "count": len(values),
+        "throughput_per_s": round(len(values) / wall_seconds, 2) if wall_seconds else None,
+        "mean_ms": ms(sum(values) / len(values)) if values else None,
+        "p50_ms": ms(percentile(values, 0.50)),
+        "p95_ms": ms(percentile(values, 0.95)),
+        "p99_ms": ms(percentile(values, 0.99)),
+        "peak_mem_mb": round(peak_bytes / 1024 / 1024, 2),
+    }
+
+
+def measure(run_once, iterations):
+    """Times ``run_once() -> [seconds, ...]`` over ``iterations``, then one traced pass for memory."""
+    run_once()  # warm-up: lazy imports, connection pool, caches
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        samples.extend(run_once())
+    wall = time.perf_counter() - started
+    # Separate pass so tracemalloc's overhead doesn't skew the timings
+    tracemalloc.start()
+    try:
+        run_once()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return summarize(samples, wall, peak)
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+# --- SCENARIOS ---
+def extraction_scenarios(iterations):
+    from talentscout.extraction import extract_resume_text
+    from talentscout.resume_parser import RESUME_TEXT_CHARS
+
+    docs = {f"extract_pdf_{p}p": ("pdf", [corpus.make_pdf(seed, p) for seed in range(5)]) for p in (1, 5, 20, 60)}
+    docs.update({f"extract_docx_{s}s": ("docx", [corpus.make_docx(seed, s) for seed in range(5)]) for s in (2, 40)})
+    for name, (kind, files) in docs.items():
+        yield name, lambda kind=kind, files=files: [
+            timed(extract_resume_text, data, kind, max_chars=RESUME_TEXT_CHARS) for data in files
+        ], iterations
+    big = [corpus.make_pdf(seed, 60) for seed in range(2)]
+    yield "extract_pdf_60p_full", lambda: [timed(extract_resume_text, d, "pdf") for d in big], max(1, iterations // 2)
+
+
+def parse_scenario(base_url, iterations):
+    from concurrent.futures import ThreadPoolExecutor
+    from talentscout.llm import ResilientClient
+    from talentscout.resume_parser import parse_resume
+
+    client = ResilientClient(api_key="bench", base_url=base_url, base_delay=0.01)
+    executor = ThreadPoolExecutor(max_workers=8)
+    # 3 experience blocks fit one request; 30 (~15k chars) are parsed as section chunks
+    for name, sections in (("parse_resume", 3), ("parse_resume_long", 30)):
+        texts = [corpus.make_txt(seed, sections).decode("utf-8") for seed in range(10)]
+
+        def run_once(texts=texts):
+            samples = []
+            for text in texts:
+                t0 = time.perf_counter()
+                parse_resume(client, text, "llama-3.1-8b-instant", executor=executor)
+                samples.append(time.perf_counter() - t0)
+            return samples
+
+        yield name, run_once, iterations
+
+
+def pdf_scenario(iterations):
+    from talentscout.pdf_report import generate_pdf_report
+
+    def run_once():
+        return [timed(generate_pdf_report, dict(SAMPLE_REPORT, technical_score=50 + i)) for i in range(5)]
+
+    yield "generate_pdf_report", run_once, iterations
+
+
+def follow_script_reruns():
+    """Makes ``AppTest.run`` wait out ``st.rerun()`` like a browser would.
+
+    AppTest (1.28) returns at the first "stopped for rerun" event and then
+    fails reading the run's end, while the script thread goes on to rerun.
+    Waiting for the thread's SHUTDOWN covers every rerun a run asks for
+    (app.py reruns itself while a report job is in progress).
+    """
+    from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+    from streamlit.testing.v1 import local_script_runner
+
+    def require_widgets_deltas(runner, timeout=3):
+        # AppTest reads the SHUTDOWN event's data next, which follows the last stop event shortly
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if ScriptRunnerEvent.SHUTDOWN in runner.events: return
+            time.sleep(0.002)
+        runner.request_stop()
+        runner.join()
+        raise RuntimeError(f"AppTest script run timed out after {timeout}s)")
+
+    local_script_runner.require_widgets_deltas = require_widgets_deltas
+
+
+class AppSession:
+    """One scripted candidate driving app.py through streamlit.testing."""
+
+    def __init__(self, timeout=60):
+        from streamlit.testing.v1 import AppTest
+
+        follow_script_reruns()
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.at.run()
+
+    def _run(self):
+        # The language selectbox uses format_func, which AppTest (1.28) can't
+        # round-trip by value; re-selecting by index keeps "English".
+        if self.at.selectbox: self.at.selectbox[0].select_index(0)
+        t0 = time.perf_counter()
+        self.at.run()
+        elapsed = time.perf_counter() - t0
+        if self.at.exception: raise RuntimeError(self.at.exception[0].message)
+        return elapsed
+
+    def say(self, text):
+        self.at.chat_input[0].set_value(text)
+        return self._run()
+
+    def click(self, label):
+        next(b for b in self.at.button if b.label == label).click()
+        return self._run()
+
+    def rerun(self):
+        return self._run()
+
+
+def app_scenarios(iterations):
+    phases = {"intake_turn": [], "interview_turn": [], "report_generate": [], "report_rerun": []}
+
+    def session():
+        s = AppSession()
+        phases["intake_turn"] += [s.say(a) for a in INTAKE_ANSWERS]
+        phases["interview_turn"] += [s.say(a) for a in INTERVIEW_ANSWERS]
+        phases["report_generate"].append(s.click("📝 Generate Report"))
+        phases["report_rerun"] += [s.rerun() for _ in range(3)]
+
+    # One session runs all phases; each phase becomes its own scenario
+    started = time.perf_counter()
+    for _ in range(iterations):
+        session()
+    wall = time.perf_counter() - started
+    timings = {key: list(samples) for key, samples in phases.items()}
+    tracemalloc.start()
+    try:
+        session()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    for name, samples in timings.items():
+        result = summarize(samples, wall, peak)
+        result["throughput_per_s"] = None  # phases share the session wall time
+        yield name, result
+
+
+# --- BASELINE ---
+def compare(results, baseline, threshold):
+    """Prints a p95 comparison; returns the scenarios that regressed beyond ``threshold``."""
+    regressions = []
+    print(f"\n{'scenario':<26}{'base p95':>12}{'now p95':>12}{'change':>10}")
+    for name, now in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("p95_ms") or now.get("p95_ms") is None:
+            print(f"{name:<26}{'-':>12}{now.get('p95_ms', '-'):>12}{'new':>10}")
+            continue
+        change = (now["p95_ms"] - base["p95_ms"]) / base["p95_ms"]
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<26}{base['p95_ms']:>12}{now['p95_ms']:>12}{change:>+10.1%}{flag}")
+        if change > threshold: regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run TalentScout's offline benchmarks against a mock Groq API.")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes to run (e.g. extract parse app)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mock time to first byte")
+    parser.add_argument("--tokens-per-second", type=float, default=500.0, help="mock streaming rate")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of mock 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of mock 429s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95 slowdown that counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(latency_ms=args.latency_ms, tokens_per_second=args.tokens_per_second,
+                        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=args.seed)
+    wanted = lambda name: not args.only or any(name.startswith(p) for p in args.only)
+    results = {}
+
+    with MockGroqServer(config) as mock:
+        os.environ["GROQ_BASE_URL"] = mock.url
+        os.environ["GROQ_API_KEY"] = "bench"
+
+        generators = [extraction_scenarios(args.iterations), parse_scenario(mock.url, args.iterations),
+                      pdf_scenario(args.iterations)]
+        for scenarios in generators:
+            for name, run_once, iterations in scenarios:
+                if not wanted(name): continue
+                print(f"running {name} ...", flush=True)
+                results[name] = measure(run_once, iterations)
+
+        if wanted("app") or any(wanted(n) for n in ("intake_turn", "interview_turn", "report_generate", "report_rerun")):
+            print("running app sessions ...", flush=True)
+            for name, result in app_scenarios(args.iterations):
+                if wanted("app") or wanted(name): results[name] = result
+
+    print(f"\n{'scenario':<26}{'n':>6}{'thr/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>9}")
+    for name, r in results.items():
+        print(f"{name:<26}{r['count']:>6}{r['throughput_per_s'] or '-':>9}{r['p50_ms']:>10}{r['p95_ms']:>10}"
+              f"{r['p99_ms']:>10}{r['peak_mem_mb']:>9}")
+
+    payload = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "mock": vars(config), "results": results}
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+        regressions = compare(results, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
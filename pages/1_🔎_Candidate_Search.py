@@ -0,0 +1,78 @@
+import csv
+import io
+import time
+
+import streamlit as st
+
+from talentscout.candidates import NUMERIC_FIELDS, SORT_KEYS, VERDICTS, get_candidate_index
+from talentscout.matching import JobMatcher
+from talentscout.recruiter import recruiter_login
+from talentscout.taxonomy import display_skill
+
+st.set_page_config(page_title="Candidate Search | TalentScout", page_icon="🔎", layout="wide")
+st.markdown("## 🔎 Candidate Search")
+
+# Every candidate's contact details and scores: recruiters only, not whoever opened the interview
+if not recruiter_login(): st.stop()
+
+# Shared with the interview app in this process; refresh() pulls rows other replicas wrote
+index = get_candidate_index()
+index.refresh()
+if not len(index):
+    st.info("No candidates yet. Finish an interview report or run a batch screening to populate the index.")
+    st.stop()
+
+skill_options = [skill for skill, _ in sorted(((s, len(r)) for s, r in index.skills.items() if r), key=lambda x: -x[1])]
+
+with st.sidebar:
+    st.markdown("### Filters")
+    job_description = st.text_area("Job description", help="With 'Match' sorting, ranks candidates by local job fit.")
+    required = st.multiselect("Must know", skill_options, format_func=display_skill)
+    preferred = st.multiselect("Nice to have (ranks by coverage)", skill_options, format_func=display_skill)
+    min_exp, max_exp = st.slider("Years of experience", 0, 30, (0, 30))
+    min_overall = st.slider("Minimum overall score", 0, 100, 0)
+    min_technical = st.slider("Minimum technical score", 0, 100, 0)
+    verdicts = st.multiselect("Verdict", VERDICTS)
+    text = st.text_input("Name, email, position or location contains")
+    sort_by = st.selectbox("Sort by", SORT_KEYS, format_func=lambda k: k.replace("_", " ").capitalize())
+    limit = st.number_input("Show at most", 10, 1000, 100, step=10)
+
+min_scores = {field: value for field, value in (("overall_score", min_overall), ("technical_score", min_technical)) if value}
+job = JobMatcher(job_description) if job_description.strip() else None
+started = time.perf_counter()
+hits = index.search(
+    skills=required, any_skills=preferred,
+    # The full slider range means "don't filter", which also keeps candidates with unknown experience
+    min_experience=min_exp or None, max_experience=max_exp if max_exp < 30 else None,
+    min_scores=min_scores, verdicts=verdicts, text=text or None, sort_by=sort_by, limit=int(limit),
+    job=job.job if job else None,
+)
+elapsed = time.perf_counter() - started
+
+st.caption(f"{len(hits)} shown of {len(index)} candidates · query took {elapsed * 1000:.1f} ms")
+if job:
+    st.caption("Job skills: " + (", ".join(display_skill(s) for s in job.job.skills) or "none recognised")
+               + (f" · {job.job.min_years:g}+ years" if job.job.min_years else ""))
+columns = ("name", "email", "position", "location", *NUMERIC_FIELDS, "verdict", "skills", "source")
+rows = [{c: (", ".join(r.get(c) or []) if c == "skills" else r.get(c)) for c in columns} for r, _ in hits]
+if job and sort_by == "match":
+    columns = ("job_match", "matched_skills", "missing_skills", *columns)
+    rows = [{"job_match": round(score, 1), **job.explain(r.get("skills") or []), **row} for (r, score), row in zip(hits, rows)]
+st.dataframe(rows, hide_index=True, use_container_width=True)
+if rows:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(rows)
+    st.download_button("📥 Download CSV", buf.getvalue(), "candidates.csv", "text/csv")
+
+# Interviewed candidates only: batch-screened ones have no evaluation to print
+evaluated = [r for r, _ in hits if r.get("overall_score") is not None]
+if evaluated and st.button(f"📄 Export {len(evaluated)} evaluation reports (PDF)"):
+    from talentscout.bulk_reports import report_from_record, write_combined_pdf  # heavy: matplotlib, fpdf
+    from talentscout.extraction import get_pool
+
+    with st.spinner("Rendering reports..."):
+        pdf = io.BytesIO()
+        write_combined_pdf([report_from_record(r) for r in evaluated], pdf, get_pool())
+    st.download_button("📥 Download reports PDF", pdf.getvalue(), "candidate_reports.pdf", "application/pdf")
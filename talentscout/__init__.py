@@ -0,0 +1 @@
+"""Reusable building blocks for TalentScout AI: the interview engine behind the Streamlit app and the HTTP API."""
@@ -0,0 +1,499 @@
+"""HTTP API for the interview engine, without Streamlit.
+
+A plain ASGI app (no web framework) over ``engine.InterviewEngine``, so an
+ATS can run interviews itself. Routes, JSON unless noted:
+
+    POST   /v1/sessions                  {"language": "English"} -> new session
+    GET    /v1/sessions/{id}             phase, collected info, transcript, report
+    DELETE /v1/sessions/{id}
+    POST   /v1/sessions/{id}/resume      raw file body, ?filename=cv.pdf
+    POST   /v1/sessions/{id}/messages    {"text": "...", "language": optional}
+    POST   /v1/sessions/{id}/report      the evaluation, once generated
+    GET    /v1/sessions/{id}/report.pdf
+    GET    /healthz, GET /metrics        (metrics are per worker process)
+
+With ``Accept: text/event-stream`` the messages and report routes answer
+with server-sent events instead: ``delta`` for each token of a streamed
+technical turn, ``message`` for each complete assistant message, ``notice``,
+``progress`` for report fields as they validate, then ``done`` carrying the
+session (or ``error``).
+
+Every ``/v1`` request belongs to a tenant: the one its bearer key maps to
+in ``TALENTSCOUT_API_KEYS`` ("acme:key1,globex:key2"), or with no keys
+configured (development) the ``X-Tenant`` header. Sessions are only visible
+to the tenant that created them, and each tenant gets a token bucket of
+``TALENTSCOUT_TENANT_RPM`` requests a minute ("600" or "600,acme=6000").
+
+Engine calls block (LLM, SQLite, PDF parsing), so each worker runs them on
+a bounded thread pool while its event loop keeps serving streams. The
+per-session lock and the report jobs live in the worker's memory, so a
+session's turns and report polls must all reach the same worker. One
+worker is the default; to use more cores, run single-worker instances
+behind a proxy that routes by session id (``--workers N`` shares one port
+with no such affinity, and each worker enforces 1/N of every tenant's limit).
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from .engine import InterviewEngine, next_missing_field
+from .extraction import MAX_FILE_BYTES, ExtractionError
+from .metrics import REGISTRY, span
+
+API_THREADS = int(os.getenv("TALENTSCOUT_API_THREADS", "32"))  # concurrent engine calls per worker
+API_WORKERS = int(os.getenv("TALENTSCOUT_API_WORKERS", "1"))  # set by main() for the worker processes
+MAX_JSON_BYTES = 64 * 1024
+REPORT_POLL_INTERVAL = 0.25
+LANGUAGES = ("English", "Hindi", "Spanish", "French", "German")
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, headers=()):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers
+
+
+# --- TENANTS ---
+def parse_api_keys(spec) -> dict:
+    """``"tenant:key,..."`` -> {key: tenant}."""
+    keys = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        tenant, _, key = item.partition(":")
+        if not tenant or not key: raise ValueError(f"expected tenant:key, got {item!r}")
+        keys[key] = tenant
+    return keys
+
+
+def parse_tenant_limits(spec, default=600):
+    """``"600,acme=6000"`` -> (600, {"acme": 6000}): a default requests-per-minute and per-tenant overrides."""
+    overrides = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        tenant, sep, rate = item.rpartition("=")
+        if sep: overrides[tenant] = float(rate)
+        else: default = float(rate)
+    return default, overrides
+
+
+class TenantRateLimiter:
+    """A token bucket per tenant: ``rate`` requests a minute, bursts of up to ``burst``."""
+
+    def __init__(self, rate, burst=None, overrides=None):
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}
+        self._buckets = {}  # tenant -> (tokens, last refill)
+        self._lock = threading.Lock()
+
+    def acquire(self, tenant, now=None) -> float:
+        """0 if the request may go ahead, else the seconds until it could."""
+        rate = self.overrides.get(tenant, self.rate)
+        if not rate: return 0.0
+        capacity = self.burst or max(rate / 6, 1)  # ten seconds' worth by default
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, last = self._buckets.get(tenant, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * rate / 60)
+            if tokens >= 1:
+                self._buckets[tenant] = (tokens - 1, now)
+                return 0.0
+            self._buckets[tenant] = (tokens, now)
+            return (1 - tokens) * 60 / rate
+
+
+# --- ASGI PLUMBING ---
+class Request:
+    def __init__(self, scope, receive):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.query = {k: v[-1] for k, v in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()}
+        self.headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        self._receive = receive
+
+    @property
+    def wants_events(self) -> bool:
+        return "text/event-stream" in self.headers.get("accept", "")
+
+    async def body(self, limit) -> bytes:
+        chunks, size = [], 0
+        while True:
+            message = await self._receive()
+            if message["type"] == "http.disconnect": raise HTTPError(400, "client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > limit: raise HTTPError(413, f"body larger than {limit} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body"): return b"".join(chunks)
+
+    async def json(self) -> dict:
+        raw = await self.body(MAX_JSON_BYTES)
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            raise HTTPError(400, "body is not valid JSON") from None
+        if not isinstance(payload, dict): raise HTTPError(400, "body must be a JSON object")
+        return payload
+
+
+async def send_body(send, status, body, content_type, headers=()):
+    await send({"type": "http.response.start", "status": status, "headers": [
+        (b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode()),
+        *((k.encode(), str(v).encode()) for k, v in headers),
+    ]})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def send_json(send, status, payload, headers=()):
+    body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+    await send_body(send, status, body, "application/json", headers)
+
+
+class EventStream:
+    """A server-sent event response."""
+
+    def __init__(self, send):
+        self.send = send
+
+    async def start(self):
+        await self.send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"text/event-stream; charset=utf-8"), (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),  # no proxy buffering, tokens should arrive as they are generated
+        ]})
+
+    async def event(self, name, data):
+        payload = json.dumps(data, ensure_ascii=False, default=str)
+        await self.send({"type": "http.response.body", "body": f"event: {name}\ndata: {payload}\n\n".encode("utf-8"),
+                         "more_body": True})
+
+    async def close(self):
+        await self.send({"type": "http.response.body", "body": b""})
+
+
+async def iterate_in_thread(executor, iterator):
+    """Runs a blocking iterator to the end on ``executor``, yielding its items here as they come.
+
+    The iterator is always drained, even if the consumer stops early (a
+    client that disconnects mid-turn still gets its turn saved), and
+    closing this generator waits until it has been.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    done = object()
+
+    def pump():
+        try:
+            for item in iterator: loop.call_soon_threadsafe(queue.put_nowait, item)
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    future = loop.run_in_executor(executor, pump)
+    try:
+        while (item := await queue.get()) is not done:
+            if isinstance(item, BaseException): raise item
+            yield item
+    finally:
+        await future
+
+
+# --- VIEWS ---
+def session_view(state) -> dict:
+    return {
+        "session_id": state["session_sync"].session_id,
+        "phase": state["phase"],
+        "language": state.get("language", "English"),
+        "collected_info": state["collected_info"],
+        "missing_field": next_missing_field(state),
+        "messages": [m for m in state["messages"] if m["role"] != "system"],
+        "intake_stats": state["intake_stats"],
+        "report": state.get("last_report"),
+    }
+
+
+def language_of(payload, default) -> str:
+    language = payload.get("language") or default
+    if language not in LANGUAGES: raise HTTPError(400, f"language must be one of {', '.join(LANGUAGES)}")
+    return language
+
+
+def event_view(event) -> dict:
+    return {"text": event.text}
+
+
+# --- APP ---
+ROUTES = [
+    ("POST", re.compile(r"^/v1/sessions$"), "create_session"),
+    ("GET", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})$"), "get_session"),
+    ("DELETE", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})$"), "delete_session"),
+    ("POST", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})/resume$"), "upload_resume"),
+    ("POST", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})/messages$"), "post_message"),
+    ("POST", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})/report$"), "generate_report"),
+    ("GET", re.compile(r"^/v1/sessions/(?P<sid>[0-9a-f]{32})/report\.pdf$"), "report_pdf"),
+    ("GET", re.compile(r"^/healthz$"), "health"),
+    ("GET", re.compile(r"^/metrics$"), "metrics"),
+]
+
+
+class InterviewAPI:
+    """The ASGI application; one per worker process."""
+
+    def __init__(self, engine=None, api_keys=None, limiter=None, threads=API_THREADS):
+        self._engine = engine
+        self._engine_lock = threading.Lock()
+        self.api_keys = parse_api_keys(os.getenv("TALENTSCOUT_API_KEYS")) if api_keys is None else api_keys
+        if limiter is None:
+            rate, overrides = parse_tenant_limits(os.getenv("TALENTSCOUT_TENANT_RPM"))
+            # Every worker sees a share of the traffic, so each enforces its share of the limit
+            limiter = TenantRateLimiter(rate / API_WORKERS, overrides={t: r / API_WORKERS for t, r in overrides.items()})
+        self.limiter = limiter
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="api")
+        # One turn at a time per session within this worker
+        self._session_locks = weakref.WeakValueDictionary()
+
+    @property
+    def engine(self) -> InterviewEngine:
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None: self._engine = build_engine()
+        return self._engine
+
+    def session_lock(self, session_id) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None: lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http": return
+        request = Request(scope, receive)
+        for method, pattern, name in ROUTES:
+            match = pattern.match(request.path)
+            if match and method == request.method: break
+        else:
+            await send_json(send, 404, {"error": "not found"})
+            return
+        started = False
+
+        async def tracked_send(message):
+            nonlocal started
+            started = True
+            await send(message)
+
+        try:
+            with span(f"api_{name}"):
+                tenant = None
+                if request.path.startswith("/v1/"):
+                    tenant = self.authenticate(request)
+                    wait = self.limiter.acquire(tenant)
+                    if wait: raise HTTPError(429, "rate limit exceeded", headers=[("retry-after", math.ceil(wait))])
+                await getattr(self, name)(request, tracked_send, tenant, **match.groupdict())
+        except HTTPError as e:
+            if not started: await send_json(send, e.status, {"error": str(e)}, e.headers)
+        except Exception as e:
+            if not started: await send_json(send, 500, {"error": f"{type(e).__name__}: {e}"})
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.run(lambda: self.engine)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._engine is not None: self._engine.close()
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def authenticate(self, request) -> str:
+        if not self.api_keys: return request.headers.get("x-tenant") or "default"
+        scheme, _, key = request.headers.get("authorization", "").partition(" ")
+        tenant = self.api_keys.get(key.strip()) if scheme.lower() == "bearer" else None
+        if tenant is None: raise HTTPError(401, "missing or unknown API key", headers=[("www-authenticate", "Bearer")])
+        return tenant
+
+    def load(self, sid, tenant):
+        state = self.engine.load_session(sid)
+        # Another tenant's session is reported as missing, not forbidden
+        if state is None or state.get("tenant") != tenant: raise HTTPError(404, "no such session")
+        return state
+
+    # --- ROUTES ---
+    async def health(self, request, send, tenant):
+        await send_json(send, 200, {"status": "ok"})
+
+    async def metrics(self, request, send, tenant):
+        await send_body(send, 200, REGISTRY.render_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+    async def create_session(self, request, send, tenant):
+        language = language_of(await request.json(), "English")
+
+        def create():
+            state = {"tenant": tenant, "language": language}
+            self.engine.open_session(state)
+            self.engine.sync_system_prompt(state, language)
+            self.engine.persist(state)
+            return session_view(state)
+
+        await send_json(send, 201, await self.run(create))
+
+    async def get_session(self, request, send, tenant, sid):
+        await send_json(send, 200, session_view(await self.run(self.load, sid, tenant)))
+
+    async def delete_session(self, request, send, tenant, sid):
+        async with self.session_lock(sid):
+            await self.run(self.load, sid, tenant)
+            await self.run(self.engine.store.delete, sid)
+        await send_json(send, 200, {"deleted": sid})
+
+    async def upload_resume(self, request, send, tenant, sid):
+        data = await request.body(MAX_FILE_BYTES)
+        if not data: raise HTTPError(400, "empty file")
+
+        def ingest():
+            state = self.load(sid, tenant)
+            if state["resume_uploaded"]: raise HTTPError(409, "a resume was already uploaded")
+            try:
+                found = self.engine.ingest_resume(state, request.query.get("filename", ""), data,
+                                                  request.headers.get("content-type", ""))
+            except ExtractionError as e:
+                raise HTTPError(422, str(e)) from None
+            language = state.get("language", "English")
+            self.engine.sync_system_prompt(state, language)
+            greeting = self.engine.open_with_resume(state, language)
+            self.engine.persist(state)
+            return {"fields": found, "message": greeting, "session": session_view(state)}
+
+        async with self.session_lock(sid):
+            await send_json(send, 200, await self.run(ingest))
+
+    async def post_message(self, request, send, tenant, sid):
+        payload = await request.json()
+        text = str(payload.get("text") or "").strip()
+        if not text: raise HTTPError(400, "text is required")
+        async with self.session_lock(sid):
+            state = await self.run(self.load, sid, tenant)
+            language = language_of(payload, state.get("language", "English"))
+
+            def turn():
+                yield from self.engine.reply(state, text, language)
+                self.engine.persist(state)
+
+            events = iterate_in_thread(self.executor, turn())
+            try:
+                if request.wants_events:
+                    stream = EventStream(send)
+                    await stream.start()
+                    async for event in events:
+                        await stream.event(event.kind, event_view(event))
+                    await stream.event("done", session_view(state))
+                    await stream.close()
+                    return
+                replies, notices, errors = [], [], []
+                async for event in events:
+                    if event.kind == "message": replies.append(event.text)
+                    elif event.kind == "notice": notices.append(event.text)
+                    elif event.kind == "error": errors.append(event.text)
+            finally:
+                # A client that hangs up mid-stream must not free the session while its turn still runs
+                await events.aclose()
+        if errors: raise HTTPError(502, errors[0])
+        await send_json(send, 200, {"messages": replies, "notices": notices, "session": session_view(state)})
+
+    async def generate_report(self, request, send, tenant, sid):
+        async with self.session_lock(sid):
+            state = await self.run(self.load, sid, tenant)
+            job = await self.run(self.engine.start_report, state)
+        if job is None: raise HTTPError(409, "the interview is too short for a report")
+
+        stream = None
+        if request.wants_events:
+            stream = EventStream(send)
+            await stream.start()
+        # The job runs on the engine's report pool; only this request waits for it
+        shown = {}
+        while job.active:
+            if stream and job.partial != shown:
+                shown = job.partial
+                await stream.event("progress", {"stage": job.stage, "fields": shown})
+            await asyncio.sleep(REPORT_POLL_INTERVAL)
+
+        def apply():
+            # Reloaded: the candidate may have kept chatting while the report ran
+            fresh = self.load(sid, tenant)
+            events = self.engine.apply_report(fresh, job)
+            self.engine.persist(fresh)
+            return fresh, events
+
+        async with self.session_lock(sid):
+            state, events = await self.run(apply)
+        notices = [e.text for e in events if e.kind == "notice"]
+        if stream:
+            for notice in notices: await stream.event("notice", {"text": notice})
+            if job.status == "done": await stream.event("done", session_view(state))
+            else: await stream.event("error", {"text": f"Analysis failed: {job.error}"})
+            await stream.close()
+            return
+        if job.status != "done": raise HTTPError(502, f"Analysis failed: {job.error}")
+        await send_json(send, 200, {"report": job.report, "notices": notices, "session": session_view(state)})
+
+    async def report_pdf(self, request, send, tenant, sid):
+        state = await self.run(self.load, sid, tenant)
+        report = state.get("last_report")
+        if not report: raise HTTPError(404, "no report yet")
+        artifacts = await self.run(self.engine.report_cache.get, report)
+        await send_body(send, 200, artifacts.pdf, "application/pdf",
+                        headers=[("content-disposition", 'attachment; filename="candidate_report.pdf"')])
+
+
+def build_engine() -> InterviewEngine:
+    from dotenv import load_dotenv
+    from .llm import ResilientClient
+
+    load_dotenv()
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key: raise RuntimeError("GROQ_API_KEY is not set")
+    return InterviewEngine(ResilientClient(api_key=api_key))
+
+
+app = InterviewAPI()
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the interview engine over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes sharing this port; >1 needs session affinity, which uvicorn doesn't provide")
+    args = parser.parse_args(argv)
+    if args.workers > 1 and os.getenv("TALENTSCOUT_SESSION_STORE", "").startswith("memory://"):
+        parser.error("memory:// sessions aren't shared between workers; use sqlite:/// or redis://")
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise RuntimeError("Install the 'uvicorn' package to serve the API") from e
+    os.environ["TALENTSCOUT_API_WORKERS"] = str(args.workers)  # read by each worker at import
+    uvicorn.run("talentscout.api:app", host=args.host, port=args.port, workers=args.workers,
+                log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Bulk resume screening over a directory, a zip or many uploaded files.
+
+Text extraction runs in the shared process pool, LLM parsing runs through an
+async Groq client with bounded concurrency and a requests/tokens-per-minute
+limiter, and every finished file is appended to a CSV or JSONL table right
+away. Files already marked "ok" in an existing output are skipped, so an
+interrupted batch picks up where it stopped.
+
+    python -m talentscout.batch resumes/ -o results.csv --concurrency 8 --rpm 30 --tpm 6000
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+import zipfile
+from collections import deque
+
+from .context import estimate_tokens
+from .extraction import detect_kind, extract_resume_text, get_pool
+from .metrics import record_usage, span
+from .resume_cache import ResumeCache, file_digest
+from .resume_parser import (RESUME_FIELDS, RESUME_PROMPT_VERSION, RESUME_TEXT_CHARS, merge_resume_results,
+                            plan_resume_requests)
+
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+COMPLETION_TOKEN_ESTIMATE = 300  # parsed-fields JSON is small; used for TPM budgeting
+RESULT_COLUMNS = ["file", "sha256", "status", "error", *RESUME_FIELDS, "elapsed_ms"]
+
+
+# --- INPUTS ---
+def iter_batch_inputs(path):
+    """Yields ``(name, bytes)`` for every resume in a directory, zip or single file."""
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    full = os.path.join(root, name)
+                    with open(full, "rb") as f:
+                        yield os.path.relpath(full, path), f.read()
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                    yield info.filename, zf.read(info)
+    else:
+        with open(path, "rb") as f:
+            yield os.path.basename(path), f.read()
+
+
+# --- RATE LIMITING ---
+class RateLimiter:
+    """Sliding one-minute window over request count and estimated tokens."""
+
+    def __init__(self, rpm=None, tpm=None, window=60.0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self._events = deque()  # (timestamp, tokens)
+        self._tokens = 0
+        self._lock = asyncio.Lock()
+
+    def _expire(self, now):
+        while self._events and now - self._events[0][0] >= self.window:
+            self._tokens -= self._events.popleft()[1]
+
+    def _fits(self, tokens):
+        if self.rpm and len(self._events) >= self.rpm: return False
+        # A single request larger than the whole budget is let through on an empty window
+        if self.tpm and self._events and self._tokens + tokens > self.tpm: return False
+        return True
+
+    async def acquire(self, tokens=0):
+        # Waiters queue on the lock, so slots are granted first come, first served
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if self._fits(tokens):
+                    self._events.append((now, tokens))
+                    self._tokens += tokens
+                    return
+                await asyncio.sleep(max(self._events[0][0] + self.window - now, 0.01))
+
+
+# --- OUTPUT ---
+def read_rows(path):
+    """Yields the rows of an existing CSV or JSONL output."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = csv.DictReader(f) if path.endswith(".csv") else (json.loads(line) for line in f if line.strip())
+        yield from rows
+
+
+def read_completed(path):
+    """Digests of files already screened successfully in an existing output."""
+    if not path or not os.path.exists(path): return set()
+    return {row.get("sha256") for row in read_rows(path) if row.get("status") == "ok"}
+
+
+class ResultWriter:
+    """Appends one row per finished file and flushes, so partial runs are kept."""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.endswith(".csv")
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS, extrasaction="ignore")
+            if new_file: self._csv.writeheader()
+
+    def write(self, row):
+        if self.is_csv:
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def rows_to_csv(rows, columns=None) -> str:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=columns or RESULT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+# --- SCREENING ---
+def _extract(data, kind):
+    # Runs inside a pool worker; no nested page-level pool there
+    return extract_resume_text(data, kind, max_chars=RESUME_TEXT_CHARS, parallel=False)
+
+
+def _result_row(name, digest, fields=None, error=None, started=None):
+    row = {"file": name, "sha256": digest, "status": "error" if error else "ok", "error": error or ""}
+    for field in RESUME_FIELDS:
+        value = (fields or {}).get(field)
+        row[field] = "" if value is None or str(value).lower() == "null" else str(value)
+    row["elapsed_ms"] = round((time.perf_counter() - started) * 1000) if started else 0
+    return row
+
+
+async def screen_resumes(inputs, client, model=DEFAULT_MODEL, concurrency=8, rpm=None, tpm=None,
+                         writer=None, skip=frozenset(), cache=None, pool=None, on_result=None):
+    """Parses every ``(name, bytes)`` in ``inputs`` and returns a count by status.
+
+    ``client`` is an ``AsyncGroq`` (or anything with the same
+    ``chat.completions.create`` coroutine). ``on_result(row)`` is called as
+    each file finishes, in completion order.
+    """
+    loop = asyncio.get_running_loop()
+    pool = pool or get_pool()
+    limiter = RateLimiter(rpm=rpm, tpm=tpm)
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    # Chunks of long resumes run in parallel, but never more than ``concurrency`` calls in flight overall
+    in_flight = asyncio.Semaphore(concurrency)
+    counts = {"ok": 0, "error": 0, "skipped": 0, "cached": 0}
+
+    async def call(stage, request):
+        async with in_flight:
+            await limiter.acquire(estimate_tokens(request["messages"][-1]["content"]) + COMPLETION_TOKEN_ESTIMATE)
+            with span(stage):
+                completion = await client.chat.completions.create(**request)
+        record_usage(stage, completion)
+        return completion.choices[0].message.content
+
+    async def parse(schema, request):
+        result = schema.parse(await call("batch_parse_resume", request))
+        if not result.complete:
+            # Ask again for the missing fields only, not the whole resume
+            try:
+                result = schema.merge(result, await call("batch_parse_resume_fill", schema.follow_up(request, result)))
+            except Exception:
+                pass  # keep what the first call gave, as complete_structured does
+        return result.data
+
+    async def handle(name, data):
+        started = time.perf_counter()
+        digest = file_digest(data)
+        if digest in skip:
+            counts["skipped"] += 1
+            return None
+        try:
+            fields = cache.get_fields(digest, model, RESUME_PROMPT_VERSION) if cache else None
+            if fields is not None:
+                counts["cached"] += 1
+            else:
+                with span("batch_extract_text"):
+                    text = await loop.run_in_executor(pool, _extract, data, detect_kind(name))
+                plan = plan_resume_requests(text, model)
+                results = await asyncio.gather(*(parse(schema, request) for _, schema, request in plan),
+                                               return_exceptions=True)
+                errors = [r for r in results if isinstance(r, Exception)]
+                if len(errors) == len(results): raise errors[0]
+                fields = merge_resume_results(plan, [None if isinstance(r, Exception) else r for r in results], text)
+                if not fields: raise ValueError("no resume fields in the response")
+                if cache and fields: cache.put_fields(digest, model, RESUME_PROMPT_VERSION, fields)
+            row = _result_row(name, digest, fields, started=started)
+        except Exception as e:
+            row = _result_row(name, digest, error=f"{type(e).__name__}: {e}", started=started)
+        counts[row["status"]] += 1
+        return row
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            try:
+                if item is None: return
+                row = await handle(*item)
+                if row is not None:
+                    if writer: writer.write(row)
+                    if on_result: on_result(row)
+            finally:
+                queue.task_done()
+
+    async def feed():
+        # Bounded queue: files are read only as fast as workers free up
+        for item in inputs:
+            await queue.put(item)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(feed())] + [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return counts
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a directory or zip of resumes in bulk.")
+    parser.add_argument("source", help="directory, .zip or single resume file")
+    parser.add_argument("-o", "--output", default="screening_results.jsonl", help=".jsonl or .csv (appended to)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=30, help="requests per minute allowed by the account")
+    parser.add_argument("--tpm", type=int, default=6000, help="tokens per minute allowed by the account")
+    parser.add_argument("--fresh", action="store_true", help="re-screen files already in the output")
+    parser.add_argument("--no-cache", action="store_true", help="skip the on-disk parse cache")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    from groq import AsyncGroq
+
+    load_dotenv()
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key: parser.error("GROQ_API_KEY is not set")
+
+    skip = set() if args.fresh else read_completed(args.output)
+    if skip: print(f"Resuming: {len(skip)} files already done in {args.output}")
+    writer = ResultWriter(args.output)
+
+    def report(row):
+        status = "ok " if row["status"] == "ok" else "ERR"
+        print(f"[{status}] {row['file']} ({row['elapsed_ms']} ms) {row['error']}", flush=True)
+
+    async def run():
+        client = AsyncGroq(api_key=api_key)
+        try:
+            return await screen_resumes(
+                iter_batch_inputs(args.source), client, model=args.model, concurrency=args.concurrency,
+                rpm=args.rpm, tpm=args.tpm, writer=writer, skip=skip,
+                cache=None if args.no_cache else ResumeCache(), on_result=report,
+            )
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    try:
+        counts = asyncio.run(run())
+    finally:
+        writer.close()
+    print(f"Done in {time.perf_counter() - started:.1f}s: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Bulk report export for a hiring round: one combined PDF or a zip of PDFs.
+
+Rendering N reports one by one means N chart figures built from scratch
+and N documents held in memory. Here:
+
+- charts come from one reusable ``pdf_report.RadarChart`` per worker
+  process, rendered on the shared process pool in small batches with only a
+  few batches in flight, so memory stays bounded however many candidates
+  there are;
+- the combined PDF is written by ``StreamingPDF``, which flushes each page
+  (and its chart image) to the output as soon as the next one starts, so
+  only the current page is kept in memory;
+- the document opens with a summary table of every candidate ranked by
+  overall score, followed by one evaluation per candidate in that order.
+
+    python -m talentscout.bulk_reports round.pdf --verdict Hire --verdict Maybe
+    python -m talentscout.bulk_reports round.zip --skill python --min-score 60
+"""
+import argparse
+import re
+import zipfile
+import zlib
+from collections import deque
+
+from .candidates import SCORE_FIELDS, _score
+from .pdf_report import PDFReport, latin1, render_charts, write_candidate
+
+CHART_BATCH = 8  # charts per pool task
+MAX_IN_FLIGHT = 4  # pool tasks submitted ahead of the writer
+SUMMARY_COLUMNS = (  # (title, width in mm)
+    ("#", 10), ("Candidate", 48), ("Position", 40), ("Overall", 16), ("Tech", 14), ("Comm", 14),
+    ("Prob", 14), ("Exp", 14), ("Verdict", 20),
+)
+
+
+def overall_score(report):
+    scores = [s for s in (_score(report.get(f)) for f in SCORE_FIELDS) if s is not None]
+    return round(sum(scores) / len(scores), 1) if scores else None
+
+
+def rank_reports(reports) -> list:
+    """Reports by overall score, best first; unscored ones last, in their original order."""
+    scored = [(overall_score(r), r) for r in reports]
+    return [r for _, r in sorted(scored, key=lambda pair: (pair[0] is None, -(pair[0] or 0)))]
+
+
+def report_from_record(record) -> dict:
+    """The report dict ``pdf_report`` expects, from a candidate index record."""
+    return {
+        "name": record.get("name"),
+        "position": record.get("position"),
+        "tech_stack": record.get("tech_stack"),
+        **{f: record.get(f) for f in SCORE_FIELDS},
+        "verdict": record.get("verdict"),
+        "strengths": record.get("strengths") or [],
+        "improvement_areas": record.get("improvement_areas") or [],
+        "graph_summary": record.get("graph_summary"),
+    }
+
+
+def iter_charts(reports, pool=None, batch=CHART_BATCH, in_flight=MAX_IN_FLIGHT):
+    """Yields one chart per report, in order, rendering ahead on ``pool`` (inline without one)."""
+    reports = list(reports)
+    batches = (reports[i:i + batch] for i in range(0, len(reports), batch))
+    if pool is None:
+        for chunk in batches:
+            yield from render_charts(chunk)
+        return
+    pending = deque()
+    for chunk in batches:
+        pending.append(pool.submit(render_charts, chunk))
+        if len(pending) >= in_flight: yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+# --- STREAMING PDF ---
+class StreamingPDF(PDFReport):
+    """A ``PDFReport`` that writes to ``out`` (binary file-like) page by page.
+
+    FPDF 1.7 keeps every page and image until ``output()``. Here each page is
+    written as soon as the next one is added, along with any images placed so
+    far; the page tree, shared resources and cross-reference table (a few
+    bytes per object) follow at the end.
+    """
+
+    def __init__(self, out, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.out = out
+        self.bytes_written = 0
+        self._flushed = 0  # pages written so far
+        self._kids = []  # page object numbers
+
+    def _out(self, s):
+        if self.state == 2: return super()._out(s)  # page content, kept until the page is flushed
+        if isinstance(s, bytes): s = s.decode("latin-1")
+        data = (str(s) + "\n").encode("latin-1")
+        self.out.write(data)
+        self.bytes_written += len(data)
+
+    def _newobj(self):
+        self.n += 1
+        self.offsets[self.n] = self.bytes_written
+        self._out(f"{self.n} 0 obj")
+
+    def add_page(self, orientation=''):
+        super().add_page(orientation)
+        self._flush(self.page - 1)
+
+    def _flush(self, last_page):
+        state, self.state = self.state, 1  # so _out writes to the stream
+        if not self.bytes_written: self._putheader()
+        for n in range(self._flushed + 1, last_page + 1):
+            self._newobj()
+            self._kids.append(self.n)
+            self._out('<</Type /Page')
+            self._out('/Parent 1 0 R')
+            if n in self.orientation_changes:
+                self._out('/MediaBox [0 0 %.2f %.2f]' % (self.fh_pt, self.fw_pt))
+            self._out('/Resources 2 0 R')
+            self._out(f'/Contents {self.n + 1} 0 R>>')
+            self._out('endobj')
+            content = self.pages[n].encode("latin-1")
+            if self.compress: content = zlib.compress(content)
+            self._newobj()
+            self._out('<<' + ('/Filter /FlateDecode ' if self.compress else '') + f'/Length {len(content)}>>')
+            self._putstream(content)
+            self._out('endobj')
+            self.pages[n] = ''
+        self._flushed = max(self._flushed, last_page)
+        for info in sorted(self.images.values(), key=lambda i: i['i']):
+            if 'data' in info:
+                self._putimage(info)
+                del info['data']
+        self.state = state
+
+    def _enddoc(self):
+        self._flush(self.page)
+        self._putfonts()
+        self.offsets[2] = self.bytes_written
+        self._out('2 0 obj')
+        self._out('<<')
+        self._putresourcedict()
+        self._out('>>')
+        self._out('endobj')
+        w_pt, h_pt = (self.fw_pt, self.fh_pt) if self.def_orientation == 'P' else (self.fh_pt, self.fw_pt)
+        self.offsets[1] = self.bytes_written
+        self._out('1 0 obj')
+        self._out('<</Type /Pages')
+        self._out('/Kids [' + ''.join(f'{kid} 0 R ' for kid in self._kids) + ']')
+        self._out(f'/Count {len(self._kids)}')
+        self._out('/MediaBox [0 0 %.2f %.2f]' % (w_pt, h_pt))
+        self._out('>>')
+        self._out('endobj')
+        self._newobj()
+        self._out('<<')
+        self._putinfo()
+        self._out('>>')
+        self._out('endobj')
+        self._newobj()
+        self._out('<<')
+        self._putcatalog()
+        self._out('>>')
+        self._out('endobj')
+        xref = self.bytes_written
+        self._out('xref')
+        self._out(f'0 {self.n + 1}')
+        self._out('0000000000 65535 f ')
+        for i in range(1, self.n + 1):
+            self._out('%010d 00000 n ' % self.offsets[i])
+        self._out('trailer')
+        self._out('<<')
+        self._puttrailer()
+        self._out('>>')
+        self._out('startxref')
+        self._out(xref)
+        self._out('%%EOF')
+        self.state = 3
+
+    def _putcatalog(self):
+        # FPDF points OpenAction at object 3, which is only the first page when pages come first
+        self._out('/Type /Catalog')
+        self._out('/Pages 1 0 R')
+        self._out('/PageLayout /OneColumn')
+
+    def finish(self) -> int:
+        """Writes the rest of the document; returns the total size in bytes."""
+        self.close()
+        return self.bytes_written
+
+
+def write_summary(pdf, ranked):
+    """The ranked summary table, across as many pages as it needs."""
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', 13)
+    pdf.cell(0, 10, f"Hiring round summary: {len(ranked)} candidates, ranked by overall score", ln=True)
+    pdf.ln(2)
+
+    def heading():
+        pdf.set_font("Arial", 'B', 9)
+        pdf.set_fill_color(230, 230, 230)
+        for title, width in SUMMARY_COLUMNS:
+            pdf.cell(width, 7, title, 1, 0, 'C', 1)
+        pdf.ln()
+        pdf.set_font("Arial", size=9)
+
+    heading()
+    for rank, report in enumerate(ranked, 1):
+        if pdf.get_y() > pdf.page_break_trigger - 7:
+            pdf.add_page()
+            heading()
+        overall = overall_score(report)
+        values = (str(rank), report.get("name") or "N/A", report.get("position") or "",
+                  "" if overall is None else f"{overall:g}",
+                  *("" if _score(report.get(f)) is None else f"{_score(report.get(f)):g}" for f in SCORE_FIELDS),
+                  report.get("verdict") or "")
+        for (title, width), value in zip(SUMMARY_COLUMNS, values):
+            text = latin1(value)
+            while text and pdf.get_string_width(text) > width - 2: text = text[:-1]
+            pdf.cell(width, 6, text, 1, 0, 'L' if title in ("Candidate", "Position") else 'C')
+        pdf.ln()
+
+
+def write_combined_pdf(reports, out, pool=None) -> int:
+    """Streams the ranked summary and every candidate's evaluation to ``out``; returns bytes written."""
+    ranked = rank_reports(reports)
+    pdf = StreamingPDF(out)
+    write_summary(pdf, ranked)
+    for i, (report, chart) in enumerate(zip(ranked, iter_charts(ranked, pool)), 1):
+        write_candidate(pdf, report, chart, image_name=f"radar_{i}")
+    return pdf.finish()
+
+
+def write_report_zip(reports, out, pool=None) -> int:
+    """A zip with the summary PDF and one PDF per candidate, written one file at a time."""
+    ranked = rank_reports(reports)
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        summary = PDFReport()
+        write_summary(summary, ranked)
+        zf.writestr("00_summary.pdf", summary.output(dest="S").encode("latin-1"))
+        for i, (report, chart) in enumerate(zip(ranked, iter_charts(ranked, pool)), 1):
+            pdf = PDFReport()
+            write_candidate(pdf, report, chart)
+            zf.writestr(f"{i:03d}_{slug(report.get('name'))}.pdf", pdf.output(dest="S").encode("latin-1"))
+    return len(ranked)
+
+
+def slug(name) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", name or "candidate").strip("_")[:40] or "candidate"
+
+
+# --- CLI ---
+def main(argv=None):
+    from .candidates import VERDICTS, get_candidate_index
+    from .extraction import get_pool
+
+    parser = argparse.ArgumentParser(description="Export evaluation reports for interviewed candidates.")
+    parser.add_argument("output", help="a .pdf (one combined document) or .zip (one PDF per candidate)")
+    parser.add_argument("--skill", action="append", default=[], help="must know (repeatable)")
+    parser.add_argument("--verdict", action="append", choices=VERDICTS, default=[])
+    parser.add_argument("--min-score", type=float, help="minimum overall score")
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--no-pool", action="store_true", help="render charts in this process")
+    args = parser.parse_args(argv)
+
+    hits = get_candidate_index().search(
+        skills=args.skill, verdicts=args.verdict, sort_by="overall_score", limit=args.limit,
+        min_scores={"overall_score": args.min_score} if args.min_score is not None else None,
+    )
+    # Only interviewed candidates have an evaluation to export
+    reports = [report_from_record(r) for r, _ in hits if r.get("overall_score") is not None]
+    if not reports: parser.exit(1, "no evaluated candidates match\n")
+    pool = None if args.no_pool else get_pool()
+    with open(args.output, "wb") as out:
+        if args.output.lower().endswith(".zip"):
+            write_report_zip(reports, out, pool)
+        else:
+            write_combined_pdf(reports, out, pool)
+    print(f"{len(reports)} reports written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""Searchable index of screened and interviewed candidates.
+
+Every parsed resume (batch screening) and every finished interview report is
+upserted into a SQLite table, one JSON record per candidate, so the data
+outlives the session. ``CandidateIndex`` keeps an in-memory view for
+queries:
+
+- an inverted index ``skill -> set(rows)`` over skills normalised with the
+  bundled ``taxonomy``, so "knows Kubernetes and Go" is a set intersection
+  starting from the rarest skill,
+- NumPy columns for years of experience and the report scores (NaN when
+  unknown), so range filters are one vectorised mask,
+- ``argpartition`` for the top-k, so ranking doesn't sort every match.
+
+Queries over tens of thousands of candidates take milliseconds. The index
+is shared by the app, the search page and the CLI in one process, and
+``refresh()`` picks up rows written by other processes or replicas.
+
+    python -m talentscout.candidates search --skill kubernetes --min-exp 5
+    python -m talentscout.candidates import screening_results.jsonl
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from .taxonomy import canonical_skill, normalize_skills
+
+SCORE_FIELDS = ("technical_score", "communication_score", "problem_solving_score", "experience_relevance")
+NUMERIC_FIELDS = ("experience_years", *SCORE_FIELDS, "overall_score")
+SORT_KEYS = ("match", *NUMERIC_FIELDS, "updated_at")
+VERDICTS = ("Hire", "Maybe", "No Hire")
+TEXT_FIELDS = ("name", "email", "position", "location", "tech_stack")
+
+YEARS_NUMBER_RE = re.compile(r"(\d{1,2}(?:\.\d+)?)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_updated ON candidates (updated_at);
+"""
+
+
+# --- RECORDS ---
+def parse_years(value):
+    """Years of experience as a float ("5+ years" -> 5.0, "fresher" -> 0.0), None if unknown."""
+    if value is None: return None
+    if isinstance(value, (int, float)): return float(value)
+    text = str(value).lower()
+    if re.search(r"\b(?:fresher|none|no experience|zero)\b", text): return 0.0
+    m = YEARS_NUMBER_RE.search(text)
+    return float(m.group(1)) if m else None
+
+
+def _score(value):
+    try:
+        return float(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def candidate_record(collected_info=None, report=None, candidate_id=None, source="interview") -> dict:
+    """Flattens intake fields and/or an evaluation report into one indexable record."""
+    info = {k: v for k, v in (collected_info or {}).items() if v not in (None, "", "Skipped")}
+    report = report or {}
+    email = (info.get("Email Address") or "").strip().lower() or None
+    record = {
+        "name": info.get("Full Name") or report.get("name"),
+        "email": email,
+        "phone": info.get("Phone Number"),
+        "location": info.get("Current Location"),
+        "position": info.get("Desired Position(s)") or report.get("position"),
+        "tech_stack": info.get("Tech Stack") or report.get("tech_stack"),
+        "experience_years": parse_years(info.get("Years of Experience")),
+        "source": source,
+    }
+    record["skills"] = normalize_skills(record["tech_stack"])
+    if report:
+        for field in SCORE_FIELDS:
+            record[field] = _score(report.get(field))
+        scores = [record[f] for f in SCORE_FIELDS if record[f] is not None]
+        record["overall_score"] = round(sum(scores) / len(scores), 1) if scores else None
+        record["verdict"] = report.get("verdict")
+        record["strengths"] = report.get("strengths") or []
+        # Kept so bulk_reports can re-render the evaluation without the transcript
+        record["improvement_areas"] = report.get("improvement_areas") or []
+        record["graph_summary"] = report.get("graph_summary")
+    # The same person from a batch run and an interview should land on one row
+    if email: record["id"] = "email:" + email
+    elif candidate_id: record["id"] = str(candidate_id)
+    else: record["id"] = "anon:" + hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return record
+
+
+# --- STORAGE ---
+class CandidateStore:
+    """Durable ``id -> record`` table; later writes merge over earlier ones."""
+
+    def __init__(self, path=None):
+        if path is None:
+            from .resume_cache import DEFAULT_DIR
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_DIR, "candidates.sqlite3")
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def upsert_many(self, records) -> list:
+        """Merges each record into its stored version; returns the merged records."""
+        now = time.time()
+        merged = []
+        with self._connect() as conn:
+            for record in records:
+                row = conn.execute("SELECT record FROM candidates WHERE id = ?", (record["id"],)).fetchone()
+                current = json.loads(row[0]) if row else {}
+                current.update({k: v for k, v in record.items() if v not in (None, [], "")})
+                current["updated_at"] = now
+                conn.execute(
+                    "INSERT OR REPLACE INTO candidates (id, record, updated_at) VALUES (?, ?, ?)",
+                    (current["id"], json.dumps(current, ensure_ascii=False, default=str), now),
+                )
+                merged.append(current)
+        return merged
+
+    def load_since(self, since=0.0):
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT record, updated_at FROM candidates WHERE updated_at > ? ORDER BY updated_at", (since,)
+            ).fetchall()
+        return [(json.loads(record), updated_at) for record, updated_at in rows]
+
+    def delete(self, candidate_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+
+# --- INDEX ---
+class CandidateIndex:
+    """In-memory inverted + numeric index over candidate records."""
+
+    def __init__(self, store=None, capacity=1024):
+        import numpy as np
+
+        self._np = np
+        self.store = store
+        self.records = []  # row -> record
+        self.rows = {}  # candidate id -> row
+        self.skills = {}  # normalised skill -> set of rows
+        self.numeric = {field: np.full(capacity, np.nan) for field in NUMERIC_FIELDS + ("updated_at",)}
+        self.verdicts = np.full(capacity, -1, dtype=np.int8)  # index into VERDICTS
+        self.haystacks = []  # row -> lowercased searchable text
+        self._terms = {}  # row -> hashed term ids for job matching, filled on demand
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.watermark = 0.0
+        self._lock = threading.RLock()
+        if store is not None: self.refresh()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _grow(self, needed):
+        np = self._np
+        size = len(self.alive)
+        if needed <= size: return
+        while size < needed: size *= 2
+        for field, column in self.numeric.items():
+            grown = np.full(size, np.nan)
+            grown[:len(column)] = column
+            self.numeric[field] = grown
+        alive = np.zeros(size, dtype=bool)
+        alive[:len(self.alive)] = self.alive
+        self.alive = alive
+        verdicts = np.full(size, -1, dtype=np.int8)
+        verdicts[:len(self.verdicts)] = self.verdicts
+        self.verdicts = verdicts
+
+    def _index(self, record):
+        row = self.rows.get(record["id"])
+        if row is None:
+            row = len(self.records)
+            self._grow(row + 1)
+            self.records.append(record)
+            self.haystacks.append("")
+            self.rows[record["id"]] = row
+        else:
+            for skill in self.records[row].get("skills") or []:
+                self.skills.get(skill, set()).discard(row)
+            self.records[row] = record
+        for skill in record.get("skills") or []:
+            self.skills.setdefault(skill, set()).add(row)
+        for field, column in self.numeric.items():
+            value = record.get(field)
+            column[row] = value if isinstance(value, (int, float)) else math.nan
+        self._terms.pop(row, None)
+        verdict = (record.get("verdict") or "").lower()
+        self.verdicts[row] = next((i for i, v in enumerate(VERDICTS) if v.lower() == verdict), -1)
+        self.haystacks[row] = " | ".join(str(record.get(f) or "") for f in TEXT_FIELDS).lower()
+        self.alive[row] = True
+
+    def add(self, *records):
+        """Persists (if backed by a store) and indexes records from ``candidate_record``."""
+        with self._lock:
+            if self.store is not None: records = self.store.upsert_many(records)
+            for record in records:
+                self._index(record)
+
+    def remove(self, candidate_id):
+        with self._lock:
+            row = self.rows.pop(candidate_id, None)
+            if row is None: return
+            for skill in self.records[row].get("skills") or []:
+                self.skills.get(skill, set()).discard(row)
+            self.alive[row] = False
+            if self.store is not None: self.store.delete(candidate_id)
+
+    def refresh(self) -> int:
+        """Indexes rows the store gained since the last refresh; returns how many."""
+        if self.store is None: return 0
+        with self._lock:
+            fresh = self.store.load_since(self.watermark)
+            for record, updated_at in fresh:
+                self._index(record)
+                self.watermark = max(self.watermark, updated_at)
+            return len(fresh)
+
+    def search(self, skills=(), any_skills=(), min_experience=None, max_experience=None, min_scores=None,
+               verdicts=(), text=None, sort_by="match", limit=50, job=None):
+        """Filtered, ranked candidates as ``(record, relevance)`` pairs.
+
+        ``skills`` must all match; ``any_skills`` are optional and rank
+        candidates by how many they have. ``min_scores`` maps a numeric field
+        to its minimum. ``sort_by="match"`` ranks by skill coverage, then by
+        overall score, or by local job match (0-100) when ``job`` (a job
+        description or ``matching.JobProfile``) is given.
+        """
+        np = self._np
+        if sort_by not in SORT_KEYS: raise ValueError(f"sort_by must be one of {SORT_KEYS}")
+        required = [canonical_skill(s) for s in skills if s.strip()]
+        optional = [canonical_skill(s) for s in any_skills if s.strip()]
+        with self._lock:
+            n = len(self.records)
+            mask = self.alive[:n].copy()
+            if required:
+                postings = sorted((self.skills.get(s, set()) for s in required), key=len)
+                hits = set(postings[0]).intersection(*postings[1:])
+                selected = np.zeros(n, dtype=bool)
+                if hits: selected[np.fromiter(hits, dtype=np.intp, count=len(hits))] = True
+                mask &= selected
+            experience = self.numeric["experience_years"][:n]
+            # NaN comparisons are False, so unknown values fail any range filter
+            if min_experience is not None: mask &= experience >= min_experience
+            if max_experience is not None: mask &= experience <= max_experience
+            for field, minimum in (min_scores or {}).items():
+                if field not in self.numeric: raise ValueError(f"unknown score field: {field}")
+                mask &= self.numeric[field][:n] >= minimum
+            if verdicts:
+                wanted = [i for i, v in enumerate(VERDICTS) if v.lower() in {w.lower() for w in verdicts}]
+                mask &= np.isin(self.verdicts[:n], wanted)
+            if text:
+                # Substring match only over rows that survived the cheaper filters
+                needle, haystacks = text.lower(), self.haystacks
+                rows = np.flatnonzero(mask)
+                mask[rows] = np.fromiter((needle in haystacks[row] for row in rows), dtype=bool, count=len(rows))
+
+            rows = np.flatnonzero(mask)
+            if not len(rows): return []
+            overall = np.nan_to_num(self.numeric["overall_score"][rows], nan=-1.0)
+            if sort_by == "match" and job is not None:
+                relevance = self._job_scores(job, rows)
+            elif sort_by == "match":
+                coverage = np.zeros(n)
+                for skill in optional:
+                    posting = self.skills.get(skill)
+                    if posting: coverage[np.fromiter(posting, dtype=np.intp, count=len(posting))] += 1
+                coverage = coverage[rows]
+                relevance = coverage / max(len(optional), 1) + (overall + 1) / 1000
+            else:
+                relevance = np.nan_to_num(self.numeric[sort_by][rows], nan=-math.inf)
+            k = min(limit, len(rows))
+            top = np.argpartition(-relevance, k - 1)[:k]
+            top = top[np.argsort(-relevance[top], kind="stable")]
+            return [(self.records[rows[i]], float(relevance[i])) for i in top]
+
+    def _job_scores(self, job, rows):
+        from .matching import JobMatcher, record_terms
+
+        np = self._np
+        matcher = JobMatcher(job)
+        # Term ids are cached per row; _index drops a row's entry when it changes
+        for row in rows:
+            if row not in self._terms: self._terms[row] = np.array(record_terms(self.records[row], matcher.dim), dtype=np.intp)
+        hits = np.zeros((len(rows), len(matcher.job.skills)), dtype=bool)
+        for j, skill in enumerate(matcher.job.skills):
+            posting = self.skills.get(skill)
+            if posting:
+                column = np.zeros(len(self.records), dtype=bool)
+                column[np.fromiter(posting, dtype=np.intp, count=len(posting))] = True
+                hits[:, j] = column[rows]
+        years = self.numeric["experience_years"][rows]
+        return matcher.score_arrays([self._terms[row] for row in rows], hits, years)["match_score"]
+
+    def stats(self) -> dict:
+        with self._lock:
+            top = sorted(((len(rows), skill) for skill, rows in self.skills.items() if rows), reverse=True)[:10]
+            return {"candidates": len(self.rows), "skills": sum(1 for rows in self.skills.values() if rows),
+                    "top_skills": [(skill, n) for n, skill in top]}
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_candidate_index(path=None) -> CandidateIndex:
+    """Process-wide index over the default store, loaded on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None: _index = CandidateIndex(CandidateStore(path))
+    return _index
+
+
+def records_from_results(path):
+    """Candidate records from a batch screening output (.csv or .jsonl); failed rows are skipped."""
+    from .batch import read_rows
+
+    for row in read_rows(path):
+        if row.get("status") == "ok":
+            yield candidate_record(row, candidate_id="sha256:" + row.get("sha256", ""), source="batch")
+
+
+# --- CLI ---
+def format_row(record, relevance):
+    exp = record.get("experience_years")
+    score = record.get("overall_score")
+    return (f"{(record.get('name') or '?')[:28]:<28} {'' if exp is None else f'{exp:g}y':>5} "
+            f"{'' if score is None else score:>6} {(record.get('verdict') or '')[:8]:<8} "
+            f"{', '.join(record.get('skills') or [])[:60]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search and maintain the candidate index.")
+    parser.add_argument("--db", help="SQLite file (default: .cache/candidates.sqlite3)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search = sub.add_parser("search", help="filtered, ranked query")
+    search.add_argument("--skill", action="append", default=[], help="required skill (repeatable)")
+    search.add_argument("--any-skill", action="append", default=[], help="preferred skill, ranks by coverage")
+    search.add_argument("--min-exp", type=float)
+    search.add_argument("--max-exp", type=float)
+    search.add_argument("--min-score", action="append", default=[], metavar="FIELD=N",
+                        help=f"minimum for one of {', '.join(NUMERIC_FIELDS[1:])}")
+    search.add_argument("--verdict", action="append", default=[], choices=VERDICTS)
+    search.add_argument("--text", help="substring of name, email, position, location or stack")
+    search.add_argument("--sort", default="match", choices=SORT_KEYS)
+    search.add_argument("--limit", type=int, default=20)
+    search.add_argument("--json", action="store_true", help="print JSON lines instead of a table")
+
+    importer = sub.add_parser("import", help="index a batch screening output")
+    importer.add_argument("results", nargs="+", help=".csv or .jsonl from talentscout.batch")
+    sub.add_parser("stats", help="index size and most common skills")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = CandidateIndex(CandidateStore(args.db))
+    loaded = time.perf_counter() - started
+
+    if args.command == "import":
+        for path in args.results:
+            records = list(records_from_results(path))
+            index.add(*records)
+            print(f"Indexed {len(records)} candidates from {path}")
+    elif args.command == "stats":
+        print(json.dumps(dict(index.stats(), load_ms=round(loaded * 1000, 1)), indent=2))
+    else:
+        min_scores = {}
+        for item in args.min_score:
+            field, _, value = item.partition("=")
+            min_scores[field.strip()] = float(value)
+        t0 = time.perf_counter()
+        hits = index.search(skills=args.skill, any_skills=args.any_skill, min_experience=args.min_exp,
+                            max_experience=args.max_exp, min_scores=min_scores, verdicts=args.verdict,
+                            text=args.text, sort_by=args.sort, limit=args.limit)
+        elapsed = time.perf_counter() - t0
+        for record, relevance in hits:
+            print(json.dumps(record, ensure_ascii=False) if args.json else format_row(record, relevance))
+        print(f"{len(hits)} of {len(index)} candidates in {elapsed * 1000:.2f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
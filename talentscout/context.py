@@ -0,0 +1,120 @@
+"""Bounded LLM context: system prompt + running summary + recent turns."""
+
+SUMMARY_PREFIX = "Summary of the earlier interview (older turns are not shown):\n"
+
+SUMMARIZE_PROMPT = """
+You maintain a running summary of a technical screening interview.
+Update the EXISTING SUMMARY with the NEW TURNS below.
+Keep every question asked, the gist of each answer and any notable strengths or gaps.
+Do not invent details. Plain text, at most {max_words} words.
+
+EXISTING SUMMARY:
+{summary}
+
+NEW TURNS:
+{turns}
+"""
+
+
+def estimate_tokens(text) -> int:
+    """Cheap token estimate (~4 chars per token); good enough for budgeting."""
+    if not text: return 0
+    return len(text) // 4 + 1
+
+
+def message_tokens(message) -> int:
+    # +4 covers the per-message role/formatting overhead of chat APIs
+    return estimate_tokens(message.get("content")) + 4
+
+
+def format_turns(messages) -> str:
+    return "\n".join(f"{m['role'].upper()}: {m['content']}" for m in messages)
+
+
+class ConversationContext:
+    """Keeps the prompt sent to the model under a token budget.
+
+    The first message is the system prompt and is always sent. Turns that no
+    longer fit are folded into a running summary, a batch at a time, so the
+    summarizer only ever sees the previous summary plus the newly evicted
+    turns. ``folded`` counts how many history messages the summary covers.
+    """
+
+    def __init__(self, max_tokens=3000, min_recent_messages=4, low_water=0.6, summary_words=150):
+        self.max_tokens = max_tokens
+        self.min_recent_messages = min_recent_messages
+        # After folding, the live window drops to this share of the budget so
+        # the summarizer runs once every few turns rather than on every turn.
+        self.low_water = low_water
+        self.summary_words = summary_words
+        self.summary = ""
+        self.folded = 0
+
+    def reset(self):
+        self.summary = ""
+        self.folded = 0
+
+    def _summary_message(self):
+        if not self.summary: return None
+        return {"role": "system", "content": SUMMARY_PREFIX + self.summary}
+
+    def prepare(self, messages, summarize=None, reserve_tokens=0):
+        """Returns the messages to send for this call.
+
+        ``summarize(previous_summary, turns) -> str`` folds evicted turns into
+        the summary; without it (or if it fails) old turns are simply dropped.
+        ``reserve_tokens`` keeps room for whatever the caller appends.
+        """
+        if not messages: return []
+        system, history = messages[0], messages[1:]
+        # The transcript may have been reset underneath us (new interview)
+        if self.folded > len(history): self.reset()
+
+        live = history[self.folded:]
+        fixed = message_tokens(system) + reserve_tokens
+        summary_msg = self._summary_message()
+        if summary_msg: fixed += message_tokens(summary_msg)
+        budget = max(self.max_tokens - fixed, 0)
+        live_tokens = [message_tokens(m) for m in live]
+
+        if sum(live_tokens) > budget:
+            cut = self._fold_point(live_tokens, int(budget * self.low_water))
+            if cut:
+                evicted = live[:cut]
+                try:
+                    if summarize is None: raise ValueError("no summarizer")
+                    self.summary = summarize(self.summary, evicted) or self.summary
+                    self.folded += cut
+                except Exception:
+                    # Summary unchanged; just leave these turns out of this call
+                    pass
+                live = live[cut:]
+                live_tokens = live_tokens[cut:]
+            # A single huge turn can still overflow; trim from the front
+            while len(live) > self.min_recent_messages and sum(live_tokens) > budget:
+                live, live_tokens = live[1:], live_tokens[1:]
+
+        out = [system]
+        summary_msg = self._summary_message()
+        if summary_msg: out.append(summary_msg)
+        return out + live
+
+    def _fold_point(self, live_tokens, target):
+        """Number of oldest live messages to fold so the rest fits ``target``."""
+        keep_from = len(live_tokens)
+        total = 0
+        while keep_from > 0:
+            t = live_tokens[keep_from - 1]
+            if total + t > target and len(live_tokens) - keep_from >= self.min_recent_messages:
+                break
+            total += t
+            keep_from -= 1
+        return keep_from
+
+
+def build_summarize_prompt(summary, turns, max_words=150) -> str:
+    return SUMMARIZE_PROMPT.format(
+        max_words=max_words,
+        summary=summary or "(none yet)",
+        turns=format_turns(turns),
+    )
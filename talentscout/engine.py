@@ -0,0 +1,430 @@
+"""The interview engine, independent of any UI.
+
+Resume intake, the field-by-field questions, the technical round and the
+evaluation report all work on a session ``state`` mapping: the Streamlit
+app passes ``st.session_state``, ``talentscout.api`` a dict loaded from the
+session store. One ``InterviewEngine`` per process holds what sessions
+share (LLM client, caches, question bank, report jobs) and is safe to call
+from many threads at once; a given session's state must only be used by
+one call at a time.
+
+A candidate message is answered by ``reply``, which appends to the
+transcript and yields ``Event``s as it goes: complete assistant messages,
+token deltas while a technical turn streams, and notices worth showing
+(e.g. an answer that couldn't be interpreted and was saved as typed).
+"""
+import copy
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .candidates import candidate_record, get_candidate_index
+from .context import ConversationContext, build_summarize_prompt
+from .extraction import detect_kind, extract_resume_text
+from .intake import INTAKE_SCHEMA, looks_like_question, parse_locally
+from .langid import is_hinglish
+from .metrics import REGISTRY, record_usage, span
+from .question_bank import QuestionBank, plan_turn
+from .report_jobs import REPORT_PROMPT, ReportJobs
+from .reports import ReportArtifactCache
+from .response_cache import ResponseCache
+from .resume_cache import ResumeCache, file_digest
+from .resume_parser import RESUME_PROMPT_VERSION, RESUME_TEXT_CHARS, parse_resume
+from .session_store import SessionSync, open_session_store
+from .structured import complete_structured
+from .taxonomy import normalize_skills
+
+GREETINGS = {"hi", "hello", "hey", "hii", "hiyo", "hiya", "hola", "namaste"}
+SENSITIVE_FIELDS = {"Email Address", "Phone Number"}
+REQUIRED_FIELDS = ["Full Name", "Email Address", "Phone Number", "Years of Experience", "Desired Position(s)", "Current Location", "Tech Stack"]
+FAST_MODEL = "llama-3.1-8b-instant"
+SMART_MODEL = "llama-3.3-70b-versatile"
+REPORT_CACHE_SIZE = 32
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))  # prompt tokens per LLM call
+SUMMARY_MAX_WORDS = 150
+MIN_REPORT_MESSAGES = 4
+# Per-call deadlines (seconds, retries included) and hedging for latency-critical intake
+PARSE_DEADLINE = 30
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "8"))  # concurrent chunk requests for long resumes, per process
+INTAKE_DEADLINE = 8
+INTAKE_HEDGE_AFTER = 1.5
+CHAT_DEADLINE = 20
+REPORT_DEADLINE = 60
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "2"))  # concurrent report jobs per process
+
+TRANSLATIONS = {
+    "English": {
+        "greeting": "Hello! I'm TalentScout. I've reviewed your resume. Welcome, {name}. I need to clarify a few details. Could you please provide your {field}?",
+        "greeting_full": "Hello! I'm TalentScout. I've reviewed your resume. Welcome, {name}. I see you are skilled in {stack}. Let's dive straight into the technical round.",
+        "greeting_manual": "Hello! I'm TalentScout. Before we begin, could you please tell me your {field}?",
+        "thanks_brief": "Thanks {name} — could you provide your {field}?",
+        "thanks_sensitive": "Thanks {name} — could you provide your {field}? (Confidential)",
+        "phase_transition": "Thanks {name}. I have all your details now. Moving to technical questions on: {stack}.",
+        "invalid_email": "Invalid email format. Please try name@example.com",
+        "invalid_phone": "Invalid phone format. Please enter digits only.",
+    },
+    # ... (Other languages logic preserved) ...
+}
+
+SYSTEM_PROMPT = """
+You are 'TalentScout', an AI recruiter.
+CURRENT LANGUAGE: {language}.
+CANDIDATE INFO KNOWN: {info_summary}
+PROTOCOL:
+1. If all info is known (Tech Stack, etc), START TECHNICAL INTERVIEW immediately.
+2. If info is missing ({next_missing}), ask for it specifically.
+3. If technical interview, ask questions based on: {stack}.
+KEEP RESPONSES CONCISE.
+"""
+
+INTAKE_PROMPT = """
+    You are an AI Interviewer ({language}). 
+    We are currently asking the candidate for: "{field}".
+    User Input: "{user_input}"
+    
+    TASK:
+    1. If the user is providing the answer, extract ONLY the value. Set "is_answer": true.
+    2. If the user is asking a QUESTION (e.g., "Why do you need this?", "What is this for?"):
+       - Explain the reason professionally.
+       - Set "is_answer": false.
+    3. If user says "skip", extracted_value: "Skipped".
+    
+    RETURN JSON ONLY:
+    {{
+        "is_answer": boolean,
+        "extracted_value": string or null,
+        "response_message": string (required if is_answer is false)
+    }}
+    """
+
+
+@dataclass(frozen=True)
+class Event:
+    kind: str  # message | delta | notice | error | report
+    text: str
+
+
+def get_translation(lang, key, field="", name="", stack=""):
+    if lang not in TRANSLATIONS: lang = "English"
+    msg = TRANSLATIONS[lang].get(key, TRANSLATIONS["English"].get(key, ""))
+    return msg.format(field=field, name=name, stack=stack)
+
+
+def is_valid_email(email: str) -> bool:
+    if not email: return False
+    return re.match(r"^[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}$", email.strip()) is not None
+
+
+def is_valid_phone(phone: str) -> bool:
+    if not phone: return False
+    digits = re.sub(r"\D", "", phone)
+    return 7 <= len(digits) <= 15
+
+
+def next_missing_field(state):
+    info = state["collected_info"]
+    return next((field for field in REQUIRED_FIELDS if field not in info), None)
+
+
+def build_system_prompt(language, info):
+    return SYSTEM_PROMPT.format(
+        language=language,
+        info_summary=", ".join([f"{k}: {v}" for k, v in info.items()]),
+        next_missing=next((field for field in REQUIRED_FIELDS if field not in info), None),
+        stack=info.get("Tech Stack", "General"),
+    )
+
+
+class InterviewEngine:
+    """Shared resources and the interview logic; one per process, used by every session."""
+
+    def __init__(self, client, store=None, question_bank=None, response_cache=None, resume_cache=None,
+                 report_jobs=None, report_cache=None, parse_pool=None):
+        self.client = client
+        self.store = store if store is not None else open_session_store()
+        self.question_bank = question_bank or QuestionBank()
+        self.response_cache = response_cache or ResponseCache()
+        self.resume_cache = resume_cache or ResumeCache()
+        self.report_jobs = report_jobs or ReportJobs(max_workers=REPORT_WORKERS)
+        self.report_cache = report_cache or ReportArtifactCache(max_entries=REPORT_CACHE_SIZE)
+        # Long resumes are parsed as section chunks in parallel, bounded across sessions
+        self.parse_pool = parse_pool or ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="parse")
+
+    # --- SESSIONS ---
+    def init_state(self, state):
+        """Fills in whatever a fresh session lacks; existing keys are left alone."""
+        defaults = {
+            "messages": list, "phase": lambda: "gathering_info", "collected_info": dict,
+            "resume_uploaded": lambda: False, "intake_stats": lambda: {"fast": 0, "llm": 0},
+            "context": lambda: ConversationContext(max_tokens=CONTEXT_TOKEN_BUDGET, summary_words=SUMMARY_MAX_WORDS),
+        }
+        for key, make in defaults.items():
+            if key not in state: state[key] = make()
+        return state
+
+    def open_session(self, state, session_id=None) -> bool:
+        """Attaches ``state`` to the store; True if an existing session was restored into it."""
+        self.init_state(state)
+        sync = SessionSync(self.store, session_id)
+        restored = bool(session_id) and sync.restore(state)
+        state["session_sync"] = sync
+        return restored
+
+    def load_session(self, session_id):
+        """A stored session as a fresh state dict, or None if there is none."""
+        state = {}
+        return state if self.open_session(state, session_id) else None
+
+    def persist(self, state):
+        state["session_sync"].flush(state)
+
+    def sync_system_prompt(self, state, language):
+        # Rebuilt only when the candidate info or language changed since the last call
+        key = (language, tuple(state["collected_info"].items()))
+        if not state["messages"]:
+            state["messages"] = [{"role": "system", "content": build_system_prompt(language, state["collected_info"])}]
+        elif state.get("system_prompt_key") != key:
+            state["messages"][0]["content"] = build_system_prompt(language, state["collected_info"])
+        state["system_prompt_key"] = key
+
+    def index_candidates(self, *records):
+        """Adds records to the candidate index; returns a notice if that failed, else None."""
+        try:
+            with span("index_candidates"):
+                get_candidate_index().add(*records)
+        except Exception as e:
+            return f"Couldn't add to candidate search ({type(e).__name__})."
+
+    # --- RESUME ---
+    def ingest_resume(self, state, filename, data, mime="") -> list:
+        """Parses a resume into the collected info; returns the fields it filled."""
+        fields = self.parse_upload(filename, data, mime)
+        found = []
+        if fields:
+            for key, value in fields.items():
+                if value and str(value).lower() != "null" and key in REQUIRED_FIELDS:
+                    state["collected_info"][key] = str(value)
+                    found.append(key)
+            state["resume_uploaded"] = True
+        return found
+
+    def parse_upload(self, filename, data, mime=""):
+        """Returns parsed resume fields, reusing cached text/fields for identical files."""
+        digest = file_digest(data)
+        cache = self.resume_cache
+        fields = cache.get_fields(digest, FAST_MODEL, RESUME_PROMPT_VERSION)
+        if fields is not None: return fields
+
+        text = cache.get_text(digest, RESUME_TEXT_CHARS)
+        if text is None:
+            kind = detect_kind(filename, mime)
+            with span("extract_text"):
+                text = extract_resume_text(data, kind, max_chars=RESUME_TEXT_CHARS)
+            cache.put_text(digest, text, RESUME_TEXT_CHARS)
+
+        # Malformed JSON is repaired locally; only fields still missing are asked for again.
+        # Long resumes go out as section chunks in parallel and are merged locally.
+        fields = parse_resume(self.client, text, FAST_MODEL, deadline=PARSE_DEADLINE, executor=self.parse_pool)
+        if fields: cache.put_fields(digest, FAST_MODEL, RESUME_PROMPT_VERSION, fields)
+        return fields
+
+    def open_with_resume(self, state, language):
+        """The greeting after a resume upload, if the chat hasn't started yet; None otherwise."""
+        if not state["resume_uploaded"] or len(state["messages"]) != 1: return None
+        next_field = next_missing_field(state)
+        name = state["collected_info"].get("Full Name", "Candidate")
+        if next_field:
+            state["phase"] = "gathering_info"
+            msg = get_translation(language, "greeting", field=next_field, name=name)
+        else:
+            state["phase"] = "technical_interview"
+            stack = state["collected_info"].get("Tech Stack", "")
+            msg = self.with_first_question(state, get_translation(language, "greeting_full", name=name, stack=stack), language)
+        state["messages"].append({"role": "assistant", "content": msg})
+        return msg
+
+    def with_first_question(self, state, msg, language):
+        """Appends the first bank question, so the candidate needn't prompt for it."""
+        info = state["collected_info"]
+        # Stack skills the bank lacks get a question set generated in the background for next time
+        self.question_bank.fill_missing(normalize_skills(info.get("Tech Stack")), self.client, SMART_MODEL)
+        turn = plan_turn(self.question_bank, [], info.get("Tech Stack"), info.get("Years of Experience"),
+                         language, seed=state["session_sync"].session_id)
+        return f"{msg}\n\n{turn.text}" if turn.text else msg
+
+    # --- CONVERSATION ---
+    def reply(self, state, text, language="English"):
+        """Answers one candidate message; yields ``Event``s while the transcript grows."""
+        self.sync_system_prompt(state, language)
+        state["messages"].append({"role": "user", "content": text})
+        if state["phase"] == "gathering_info":
+            events = self._intake_turn(state, text, language)
+        else:
+            events = self._technical_turn(state, text, language)
+        for event in events:
+            if event.kind == "message": state["messages"].append({"role": "assistant", "content": event.text})
+            yield event
+
+    def _intake_turn(self, state, text, language):
+        current_field = next_missing_field(state)
+        with span("detect_language"):
+            if is_hinglish(text): language = "Hinglish"
+
+        # Start without a resume
+        if not state["collected_info"] and text.lower() in GREETINGS:
+            yield Event("message", get_translation(language, "greeting_manual", current_field))
+            return
+
+        processed, notice = self.process_user_input(state, text, current_field, language)
+        if notice: yield Event("notice", notice)
+        if not processed["is_answer"]:
+            yield Event("message", processed["response_message"])
+            return
+
+        answer_val = processed.get("extracted_value", text)
+        if current_field == "Email Address" and not is_valid_email(answer_val):
+            yield Event("message", get_translation(language, "invalid_email"))
+            return
+        if current_field == "Phone Number" and not is_valid_phone(answer_val):
+            yield Event("message", get_translation(language, "invalid_phone"))
+            return
+
+        info = state["collected_info"]
+        if current_field: info[current_field] = answer_val
+        next_f = next_missing_field(state)
+        name = info.get("Full Name", "")
+        if next_f:
+            key = "thanks_sensitive" if next_f in SENSITIVE_FIELDS else "thanks_brief"
+            yield Event("message", get_translation(language, key, field=next_f, name=name))
+        else:
+            state["phase"] = "technical_interview"
+            stack = info.get("Tech Stack", "")
+            yield Event("message", self.with_first_question(
+                state, get_translation(language, "phase_transition", name=name, stack=stack), language))
+
+    def _technical_turn(self, state, text, language):
+        info = state["collected_info"]
+        with span("interview_plan"):
+            if is_hinglish(text): language = "Hinglish"
+            turn = plan_turn(self.question_bank, state["messages"], info.get("Tech Stack"),
+                             info.get("Years of Experience"), language, seed=state["session_sync"].session_id)
+        if turn.text:
+            # Next question straight from the bank: no LLM call
+            yield Event("message", turn.text)
+            return
+
+        full_resp = ""
+        try:
+            with span("interview_turn"):
+                turn_started = time.perf_counter()
+                chunk = None
+                instruction = [{"role": "system", "content": turn.instruction}] if turn.instruction else []
+                stream = self.client.stream(
+                    deadline=CHAT_DEADLINE,
+                    model=FAST_MODEL,
+                    messages=state["context"].prepare(
+                        state["messages"], self.summarize_turns, reserve_tokens=len(turn.instruction or "") // 4
+                    ) + instruction,
+                    temperature=0.6,
+                    max_tokens=250
+                )
+                for chunk in stream:
+                    content = chunk.choices[0].delta.content if chunk.choices else None
+                    if content:
+                        if not full_resp: REGISTRY.observe("interview_ttft", time.perf_counter() - turn_started)
+                        full_resp += content
+                        yield Event("delta", content)
+                record_usage("interview_turn", chunk)  # usage rides on the final chunk
+        except Exception as e:
+            yield Event("error", f"Error: {e}")
+            return
+        yield Event("message", full_resp)
+
+    def process_user_input(self, state, user_input, current_field, language="English"):
+        """Interprets an intake answer; returns ``(result, notice or None)``."""
+        stats = state["intake_stats"]
+        # Plain answers ("5 years", an email...) are extracted locally in microseconds
+        with span("intake_local"):
+            local = parse_locally(user_input, current_field)
+        if local.usable:
+            stats["fast"] += 1
+            return {"is_answer": True, "extracted_value": local.value}, None
+        # The reply depends only on the field, language and question, so it is shared across candidates
+        cache_namespace = f"intake:{FAST_MODEL}:{language}:{current_field}"
+        cacheable = looks_like_question(user_input)
+        if cacheable:
+            with span("intake_cache"):
+                cached = self.response_cache.get(cache_namespace, user_input)
+            if cached is not None:
+                stats["fast"] += 1
+                return {"is_answer": False, "extracted_value": None, "response_message": cached}, None
+        stats["llm"] += 1
+
+        prompt = INTAKE_PROMPT.format(language=language, field=current_field, user_input=user_input)
+        try:
+            parsed = complete_structured(self.client, INTAKE_SCHEMA, {
+                "model": FAST_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.3,
+                "response_format": {"type": "json_object"},
+            }, deadline=INTAKE_DEADLINE, stage="intake_llm", hedge_after=INTAKE_HEDGE_AFTER)
+            if "is_answer" not in parsed.data: raise ValueError("no usable intake result")
+            result = parsed.data
+            if cacheable and not result.get("is_answer") and result.get("response_message"):
+                self.response_cache.put(cache_namespace, user_input, result["response_message"])
+            return result, None
+        except Exception as e:
+            # Keep the interview moving: take the raw text as the answer
+            return {"is_answer": True, "extracted_value": user_input}, \
+                f"Couldn't interpret that answer ({type(e).__name__}); saved it as typed."
+
+    def summarize_turns(self, previous_summary, turns):
+        """Folds turns that slid out of the context window into the running summary."""
+        with span("summarize_context"):
+            completion = self.client.complete(
+                deadline=CHAT_DEADLINE,
+                model=FAST_MODEL,
+                messages=[{"role": "user", "content": build_summarize_prompt(previous_summary, turns, SUMMARY_MAX_WORDS)}],
+                temperature=0.2,
+                max_tokens=SUMMARY_MAX_WORDS * 2
+            )
+        record_usage("summarize_context", completion)
+        return completion.choices[0].message.content.strip()
+
+    # --- REPORT ---
+    def start_report(self, state):
+        """Submits the evaluation as a background job; None if the interview is too short."""
+        if len(state["messages"]) < MIN_REPORT_MESSAGES: return None
+        report_request = {"role": "user", "content": REPORT_PROMPT}
+        # Fitting the transcript may call the summarizer, so it runs on the job's worker. It folds
+        # into a copy of the context: the session's own is only touched from the session's thread.
+        context = copy.copy(state["context"])
+
+        def prepare(messages):
+            return context.prepare(messages, self.summarize_turns, reserve_tokens=len(REPORT_PROMPT) // 4) + [report_request]
+
+        job = self.report_jobs.submit(self.client, [dict(m) for m in state["messages"]], SMART_MODEL,
+                                      REPORT_DEADLINE, self.report_cache, prepare=prepare)
+        state["report_job_id"] = job.id
+        return job
+
+    def report_job(self, state):
+        return self.report_jobs.get(state.get("report_job_id"))
+
+    def apply_report(self, state, job) -> list:
+        """Copies a finished job into the session, once per job; returns ``Event``s to show."""
+        if job is None or job.active or state.get("report_job_seen") == job.id: return []
+        state["report_job_seen"] = job.id
+        if job.status != "done": return [Event("error", f"Analysis failed: {job.error}")]
+        state["last_report"] = job.report
+        events = [Event("report", "Report Ready!")]
+        notice = self.index_candidates(candidate_record(state["collected_info"], job.report,
+                                                        candidate_id="session:" + state["session_sync"].session_id))
+        if notice: events.append(Event("notice", notice))
+        return events
+
+    def close(self):
+        self.report_jobs.close()
+        self.parse_pool.shutdown(wait=False)
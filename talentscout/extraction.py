@@ -0,0 +1,155 @@
+"""Resume text extraction as a lazy stream of text chunks.
+
+Every format yields its text piece by piece (PDF pages, DOCX paragraphs, TXT
+lines), so callers can stop as soon as they have enough for the parser.
+Large PDFs are split into page ranges and extracted in a process pool, since
+PyPDF2 is pure Python and would otherwise hold the GIL for the whole file.
+Each worker opens a document once and keeps the reader for its later ranges.
+PyPDF2 and python-docx are imported on first use.
+"""
+import concurrent.futures
+import hashlib
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+MAX_FILE_BYTES = 10 * 1024 * 1024
+TIME_LIMIT_SECONDS = 20.0
+PARALLEL_MIN_PAGES = 16  # below this, pool overhead outweighs the gain
+PAGES_PER_TASK = 8
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+WORKER_READERS = 2  # open documents each pool worker keeps, for concurrent uploads
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class ExtractionError(Exception):
+    """The file is too large, too slow to read, or has no readable text."""
+
+
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        # spawn: workers must not inherit Streamlit's threads and locks
+        _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def detect_kind(filename="", mime="") -> str:
+    name = (filename or "").lower()
+    if mime == PDF_MIME or name.endswith(".pdf"): return "pdf"
+    if "wordprocessingml" in (mime or "") or name.endswith(".docx"): return "docx"
+    return "txt"
+
+
+def _page_text(page) -> str:
+    # extract_text() returns None for image-only pages on some PyPDF2 versions
+    return page.extract_text() or ""
+
+
+_readers = {}  # pool worker only: document digest -> PdfReader, oldest first
+
+
+def _worker_reader(digest, data):
+    reader = _readers.pop(digest, None)
+    if reader is None:
+        import PyPDF2
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+    _readers[digest] = reader
+    while len(_readers) > WORKER_READERS: del _readers[next(iter(_readers))]
+    return reader
+
+
+def _extract_page_range(digest, data, start, stop):
+    reader = _worker_reader(digest, data)
+    return [_page_text(reader.pages[i]) for i in range(start, stop)]
+
+
+def iter_pdf_text(data: bytes, parallel=True, deadline=None):
+    """Yields page text; raises ExtractionError if a page range misses ``deadline`` (monotonic)."""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    num_pages = len(reader.pages)
+    if not parallel or num_pages < PARALLEL_MIN_PAGES or MAX_WORKERS < 2:
+        for page in reader.pages:
+            yield _page_text(page)
+        return
+
+    pool = get_pool()
+    digest = hashlib.sha256(data).hexdigest()
+    ranges = [(s, min(s + PAGES_PER_TASK, num_pages)) for s in range(0, num_pages, PAGES_PER_TASK)]
+    in_flight = []
+    next_range = 0
+    try:
+        while next_range < len(ranges) or in_flight:
+            # Keep a bounded window submitted so an early stop wastes little work
+            while next_range < len(ranges) and len(in_flight) < MAX_WORKERS * 2:
+                in_flight.append(pool.submit(_extract_page_range, digest, data, *ranges[next_range]))
+                next_range += 1
+            # Bounded wait: a stuck worker must not hold the caller past its time limit
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                pages = in_flight[0].result(timeout=remaining)
+            except concurrent.futures.TimeoutError:
+                raise ExtractionError("Text extraction ran past its time limit") from None
+            in_flight.pop(0)
+            yield from pages
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def iter_docx_text(data: bytes):
+    import docx
+    document = docx.Document(io.BytesIO(data))
+    for paragraph in document.paragraphs:
+        yield paragraph.text + "\n"
+
+
+def iter_plain_text(data: bytes):
+    yield from io.StringIO(data.decode("utf-8", errors="replace"))
+
+
+def iter_resume_text(data: bytes, kind: str, parallel=True, deadline=None):
+    """Yields the document's text in reading order, one chunk at a time."""
+    if len(data) > MAX_FILE_BYTES:
+        raise ExtractionError(f"File is larger than {MAX_FILE_BYTES // (1024 * 1024)} MB")
+    if kind == "pdf": return iter_pdf_text(data, parallel=parallel, deadline=deadline)
+    if kind == "docx": return iter_docx_text(data)
+    return iter_plain_text(data)
+
+
+def extract_resume_text(data: bytes, kind: str, max_chars=None, time_limit=TIME_LIMIT_SECONDS, parallel=True) -> str:
+    """Collects text until ``max_chars`` or ``time_limit`` is reached.
+
+    Hitting the time limit returns whatever was read so far; it only raises if
+    nothing readable came out before the deadline. A file with no text at all
+    (a scanned, image-only PDF) raises ``ExtractionError`` too.
+    """
+    deadline = time.monotonic() + time_limit if time_limit else None
+    parts = []
+    size = 0
+    chunks = iter_resume_text(data, kind, parallel=parallel, deadline=deadline)
+    try:
+        for chunk in chunks:
+            if kind == "pdf" and parts: chunk = "\n" + chunk
+            parts.append(chunk)
+            size += len(chunk)
+            if max_chars is not None and size >= max_chars: break
+            if deadline is not None and time.monotonic() > deadline:
+                if size: break
+                raise ExtractionError(f"Text extraction took longer than {time_limit:.0f}s")
+    except ExtractionError:
+        # A pool range that missed the deadline: same rule, keep what came before it
+        if not size: raise ExtractionError(f"Text extraction took longer than {time_limit:.0f}s") from None
+    finally:
+        if hasattr(chunks, "close"): chunks.close()
+    text = "".join(parts)
+    if not text.strip(): raise ExtractionError("No readable text found (is it a scanned or image-only file?)")
+    return text[:max_chars] if max_chars is not None else text
@@ -0,0 +1,241 @@
+"""Deterministic fast path for intake answers.
+
+Most answers during ``gathering_info`` are a bare email, a phone number or
+"5 years", which don't need an LLM round trip. ``parse_locally`` tries a
+field-specific extractor and reports how sure it is; the app only falls back
+to the model when the confidence is below ``FAST_PATH_THRESHOLD``.
+"""
+import re
+from dataclasses import dataclass
+
+from .structured import Field, Schema
+from .taxonomy import SKILLS, canonical_skill
+
+FAST_PATH_THRESHOLD = 0.8
+SKIPPED = "Skipped"
+
+# Reply contract of the LLM intake call; a non-answer must carry the message to show
+INTAKE_SCHEMA = Schema("intake", [
+    Field("is_answer", "bool"),
+    Field("extracted_value", required=False, nullable=True),
+    Field("response_message", required=False, nullable=True),
+], requires=lambda data: ["response_message"] if data.get("is_answer") is False else [])
+
+EMAIL_RE = re.compile(r"[\w\.+-]+@[\w\.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"\+?\(?\d[\d\s\-\.\(\)]{5,}\d")
+YEARS_RE = re.compile(r"^(?:about|around|approx\.?|over|almost|nearly)?\s*(\d{1,2}(?:\.\d)?)\s*(\+)?\s*(?:years?|yrs?|y)?(?:\s+(?:of\s+)?(?:experience|exp))?\.?$")
+NO_EXPERIENCE_RE = re.compile(r"^(?:none|zero|fresher|no experience|fresh graduate|student|0)$")
+# Hedges, refusals and filler: real words that would pass the name/location/position shape checks
+NON_ANSWER_RE = re.compile(
+    r"\b(?:(?:i\s+)?(?:do\s*n'?o?t|dont)\s+(?:know|want\s+to|wanna)|not\s+sure|no\s+idea|none\s+of\s+your|"
+    r"not\s+(?:telling|saying|comfortable|now|applicable)|rather\s+not|forgot|forget|confidential|private|secret|"
+    r"tell\s+me\s+more|why\s+do\s+you|what\s+for)\b|(?:^|\s)n/a\b"
+)
+FILLER_WORDS = {
+    "ok", "okay", "k", "yes", "yeah", "yep", "yup", "no", "nope", "nah", "sure", "fine", "maybe", "hmm", "hm", "um",
+    "uh", "well", "hello", "hi", "hey", "there", "thanks", "thank", "you", "please", "later", "nothing", "whatever",
+    "idk", "cool", "good", "great", "alright", "right", "huh", "what", "again", "sorry", "wait", "one", "sec",
+}
+# Title-cased words that still aren't a name or a place ("I Forgot", "Not Sure")
+STOPWORDS = FILLER_WORDS | {
+    "i", "me", "my", "mine", "it", "is", "am", "a", "an", "the", "not", "rather", "dont", "don't", "want", "to", "share",
+    "anything", "something", "everything", "none", "forgot", "know", "applicable", "lol", "haha", "test", "testing",
+    "asdf", "na", "nil", "null", "unknown", "somewhere", "anywhere", "here", "home", "any", "all",
+}
+# Lowercase joiners allowed inside a title-cased name or place ("Isle of Man", "Maria de la Cruz")
+NAME_JOINERS = {"of", "de", "da", "del", "la", "le", "van", "von", "der", "bin", "al", "upon", "am"}
+# A desired position names a role; "anything" or "asdf" doesn't
+ROLE_WORDS = {
+    "engineer", "engineering", "developer", "dev", "programmer", "architect", "scientist", "analyst", "designer",
+    "manager", "lead", "head", "director", "intern", "internship", "consultant", "administrator", "admin",
+    "specialist", "tester", "researcher", "officer", "cto", "vp", "sde", "swe", "sre", "qa", "devops", "mlops",
+    "frontend", "backend", "fullstack", "full-stack", "stack", "data", "ml", "ai", "security", "cloud", "mobile",
+    "android", "ios", "web", "software", "platform", "infrastructure", "support", "product", "technical", "staff",
+    "principal", "trainee", "associate",
+}
+PHONE_DATE_RE = re.compile(r"^(?:\d{4}[-./]\d{1,2}[-./]\d{1,2}|\d{1,2}[-./]\d{1,2}[-./](?:\d{4}|\d{2}))$")
+SKIP_RE = re.compile(r"^(?:skip|skip it|pass|n/?a|na|none|prefer not to (?:say|answer|share)|rather not say)[.!]?$")
+
+QUESTION_WORDS = {
+    # English
+    "why", "what", "how", "who", "where", "when", "which", "can", "could", "do", "does",
+    "is", "are", "will", "would", "should",
+    # Hindi / Hinglish
+    "kyu", "kyun", "kyon", "kya", "kaise", "kaun", "kab", "kahan",
+    # Spanish / French / German
+    "por", "qué", "que", "cómo", "pourquoi", "quoi", "comment", "warum", "wieso", "was", "wie",
+}
+# Leading phrases people wrap their answers in ("my email is ..."), most specific first
+ANSWER_PREFIXES = [
+    r"(?:i'?m\s+|i\s+am\s+)?(?:applying|looking)\s+for\s+(?:the\s+|a\s+|an\s+)?(?:role|position)?\s*(?:of\s+)?",
+    r"(?:my|the)\s+(?:full\s+)?(?:name|email(?:\s+address)?|e-mail|phone(?:\s+number)?|number|mobile|location|city|"
+    r"tech\s+stack|stack|skills|role|position)\s+(?:is|are|:)\s*",
+    r"i\s+(?:live|stay)\s+in\s+",
+    r"(?:i'?m\s+|i\s+am\s+)?based\s+(?:in|out\s+of)\s+",
+    r"i\s+(?:know|use|work\s+with|work\s+on|am\s+skilled\s+in)\s+",
+    r"(?:it'?s|this\s+is|i\s+am|i'?m|from)\s+",
+]
+ANSWER_PREFIX_RE = re.compile(r"^(?:" + "|".join(ANSWER_PREFIXES) + r")", re.IGNORECASE)
+LIST_SPLIT_RE = re.compile(r"\s*(?:,|;|/|\||\band\b|&|\n)\s*", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class LocalParse:
+    value: object = None
+    confidence: float = 0.0
+    is_question: bool = False
+
+    @property
+    def usable(self) -> bool:
+        return not self.is_question and self.value is not None and self.confidence >= FAST_PATH_THRESHOLD
+
+
+NO_MATCH = LocalParse()
+
+
+def looks_like_question(text: str) -> bool:
+    t = text.strip().lower()
+    if not t: return False
+    if t.endswith("?") or t.startswith("¿"): return True
+    first = re.split(r"[\s,]+", t, maxsplit=1)[0]
+    return first in QUESTION_WORDS and len(t.split()) > 1
+
+
+# Asking, not answering: a question word followed by subject/auxiliary inversion ("what is", "can you").
+# "which" is left out: "which is why..." opens answers far more often than questions
+INVERTED_QUESTION_RE = re.compile(
+    r"^(?:(?:why|what|how|who|where|when)(?:'s|\s+(?:is|are|was|were|am|do|does|did|can|could|would|will|"
+    r"should|shall|may|might|must|has|have|had))|(?:can|could|would|will|should|shall|may|do|does|did|is|are|was|"
+    r"were|am|has|have)\s+(?:you|i|we|they|he|she|it|this|that|these|those|there|the|a|an|my|your|our))\b"
+)
+
+
+def looks_like_direct_question(text: str) -> bool:
+    """Stricter ``looks_like_question`` for the technical round, where answers often open with
+    "When you..." or "What I did...": only a trailing "?" or an inverted question counts."""
+    t = text.strip().lower()
+    if not t: return False
+    if t.endswith("?") or t.startswith("¿"): return True
+    return INVERTED_QUESTION_RE.match(t) is not None
+
+
+def is_non_answer(text: str) -> bool:
+    """A hedge, refusal or filler ("not sure", "none of your business", "ok", "hello there")."""
+    t = text.strip().lower()
+    if NON_ANSWER_RE.search(t): return True
+    words = re.findall(r"[a-z']+", t)
+    return bool(words) and all(w in FILLER_WORDS for w in words)
+
+
+def strip_answer_prefix(text: str) -> str:
+    return ANSWER_PREFIX_RE.sub("", text.strip()).strip(" .!")
+
+
+def _words(text):
+    return text.split()
+
+
+def _title_cased(words) -> bool:
+    """Positive evidence for a name or a place: capitalised words that aren't stopwords."""
+    cores = [w.strip(",.") for w in words]
+    titled = [w for w in cores if w.lower() not in NAME_JOINERS]
+    return bool(titled) and all(w[:1].isupper() and w.lower() not in STOPWORDS for w in titled)
+
+
+def _parse_email(text):
+    found = EMAIL_RE.findall(text)
+    if len(found) != 1: return NO_MATCH
+    email = found[0].rstrip(".")
+    return LocalParse(email, 1.0 if text.strip(" .") == email else 0.9)
+
+
+def _parse_phone(text):
+    found = PHONE_RE.findall(text)
+    if len(found) != 1: return NO_MATCH
+    phone = found[0].strip()
+    if PHONE_DATE_RE.match(phone): return NO_MATCH  # "2024-01-01" is a date, not a number
+    digits = re.sub(r"\D", "", phone)
+    if not 7 <= len(digits) <= 15: return NO_MATCH
+    return LocalParse(phone, 1.0 if text.strip(" .") == phone else 0.85)
+
+
+def _parse_years(text):
+    t = strip_answer_prefix(text).lower()
+    if NO_EXPERIENCE_RE.match(t): return LocalParse("0 years", 0.9)
+    m = YEARS_RE.match(t)
+    if not m: return NO_MATCH
+    years = float(m.group(1))
+    if years > 60: return NO_MATCH
+    shown = m.group(1) + (m.group(2) or "")
+    unit = "year" if years == 1 and not m.group(2) else "years"
+    return LocalParse(f"{shown} {unit}", 0.95)
+
+
+def _parse_name(text):
+    t = strip_answer_prefix(text)
+    words = _words(t)
+    if not 1 <= len(words) <= 4: return NO_MATCH
+    if not all(w.replace("-", "").replace("'", "").replace(".", "").isalpha() for w in words): return NO_MATCH
+    # Single words ("yes", "hello") and uncapitalised ones ("asdf qwer") are too ambiguous to trust
+    confidence = 0.9 if len(words) >= 2 and _title_cased(words) else 0.6
+    return LocalParse(" ".join(w if w[:1].isupper() or w in NAME_JOINERS else w.capitalize() for w in words), confidence)
+
+
+def _parse_location(text):
+    t = strip_answer_prefix(text)
+    words = _words(t)
+    if not 1 <= len(words) <= 5 or any(ch.isdigit() for ch in t): return NO_MATCH
+    if not all(w.strip(",").replace("-", "").replace(".", "").isalpha() for w in words): return NO_MATCH
+    # "lol" or "rather not" has the same shape as "Pune"; only a capitalised place skips the LLM
+    return LocalParse(t, 0.85 if _title_cased(words) else 0.5)
+
+
+def _parse_position(text):
+    t = strip_answer_prefix(text)
+    words = _words(t)
+    if not 1 <= len(words) <= 6: return NO_MATCH
+    if not re.fullmatch(r"[\w\s/\-\+\.&,()#]+", t): return NO_MATCH
+    if not any(w.lower() in ROLE_WORDS for w in re.split(r"[\s/,()&]+", t)): return LocalParse(t, 0.5)
+    return LocalParse(t, 0.85 if len(words) >= 2 else 0.8)
+
+
+def _parse_tech_stack(text):
+    t = strip_answer_prefix(text)
+    items = [i.strip(" .") for i in LIST_SPLIT_RE.split(t) if i.strip(" .")]
+    if not items: return NO_MATCH
+    # Each entry should look like a technology name, not a sentence
+    if any(len(i.split()) > 3 for i in items): return NO_MATCH
+    if not all(re.fullmatch(r"[\w\s\.\+#\-]+", i) for i in items): return NO_MATCH
+    seen, unique = set(), []
+    for i in items:
+        if i.lower() not in seen:
+            seen.add(i.lower())
+            unique.append(i)
+    # "ok" or "I am not sure" is shaped like a stack too; only known technologies skip the LLM
+    if not all(canonical_skill(i) in SKILLS for i in unique): return LocalParse(", ".join(unique), 0.5)
+    return LocalParse(", ".join(unique), 0.95 if len(unique) >= 2 else 0.85)
+
+
+FIELD_PARSERS = {
+    "Full Name": _parse_name,
+    "Email Address": _parse_email,
+    "Phone Number": _parse_phone,
+    "Years of Experience": _parse_years,
+    "Desired Position(s)": _parse_position,
+    "Current Location": _parse_location,
+    "Tech Stack": _parse_tech_stack,
+}
+
+
+def parse_locally(user_input: str, field: str) -> LocalParse:
+    """Extracts ``field`` from ``user_input`` without calling the LLM."""
+    text = (user_input or "").strip()
+    if not text: return NO_MATCH
+    # "none" means no experience, not a skip, when asked for years
+    if field == "Years of Experience" and NO_EXPERIENCE_RE.match(strip_answer_prefix(text).lower()): return _parse_years(text)
+    if SKIP_RE.match(text.lower()): return LocalParse(SKIPPED, 1.0)
+    if looks_like_question(text): return LocalParse(confidence=0.0, is_question=True)
+    if is_non_answer(text): return NO_MATCH
+    parser = FIELD_PARSERS.get(field)
+    if parser is None: return NO_MATCH
+    return parser(text)
@@ -0,0 +1,149 @@
+"""Message-level language identification.
+
+A character n-gram model (orders 1-4 over space-padded words) is compiled
+once from ``langid_samples`` into a lookup index and a ``(n-grams,
+languages)`` log-probability matrix. A word's n-grams are gathered and
+summed with NumPy the first time it is seen and memoised, so classifying a
+message is a single pass of dictionary hits and vector adds, whose cost
+grows with message length rather than with a list of indicator words.
+``scores`` returns a probability per language: every sidebar language plus
+``"Hinglish"`` (romanised Hindi).
+"""
+import re
+import threading
+
+from .langid_samples import SAMPLES
+
+LANGUAGES = tuple(SAMPLES)
+MAX_ORDER = 4
+# Messages with fewer usable n-grams than this are too short to call
+MIN_NGRAMS = 6
+HINGLISH_THRESHOLD = 0.6
+# Switching the interview language takes a sentence: a bare name or city ("Bengaluru",
+# "Priya Sharma") reads as romanised Hindi but is an answer, not a language choice
+HINGLISH_MIN_WORDS = 3
+WORD_CACHE_SIZE = 50_000
+
+_NON_LETTERS = re.compile(r"[^\wऀ-ॿ]+|[\d_]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercased letters with single spaces between words."""
+    return _NON_LETTERS.sub(" ", text.lower()).strip()
+
+
+def word_ngrams(word: str, max_order=MAX_ORDER):
+    padded = f" {word} "
+    return [padded[i:i + n] for n in range(1, max_order + 1) for i in range(len(padded) - n + 1)
+            if padded[i:i + n] != " "]
+
+
+def ngrams(text: str, max_order=MAX_ORDER):
+    return [gram for word in normalize(text).split() for gram in word_ngrams(word, max_order)]
+
+
+class LanguageIdentifier:
+    """Naive Bayes over character n-grams, compiled to an index + matrix."""
+
+    def __init__(self, samples=SAMPLES, max_order=MAX_ORDER, alpha=0.1, sharpness=1.0):
+        import numpy as np
+
+        self.languages = tuple(samples)
+        self.max_order = max_order
+        self.sharpness = sharpness
+        counts = [{} for _ in self.languages]
+        for column, text in zip(counts, samples.values()):
+            for gram in ngrams(text, max_order):
+                column[gram] = column.get(gram, 0) + 1
+        vocabulary = sorted(set().union(*counts))
+        self.index = {gram: i for i, gram in enumerate(vocabulary)}
+        # Last row is for n-grams never seen in training
+        table = np.zeros((len(vocabulary) + 1, len(self.languages)))
+        for j, column in enumerate(counts):
+            table[[self.index[gram] for gram in column], j] = list(column.values())
+        totals = table.sum(axis=0)
+        table += alpha
+        self.log_probs = np.log(table / (totals + alpha * (len(vocabulary) + 1))).astype(np.float32)
+        self.unknown = len(vocabulary)
+        self._zero = np.zeros(len(self.languages), dtype=np.float32)
+        self._words = {}
+        self._np = np
+
+    def _word(self, word):
+        """(summed log-probs, n-gram count) for one word, memoised."""
+        hit = self._words.get(word)
+        if hit is None:
+            get, unknown = self.index.get, self.unknown
+            ids = [get(gram, unknown) for gram in word_ngrams(word, self.max_order)]
+            hit = (self.log_probs[ids].sum(axis=0), len(ids))
+            if len(self._words) >= WORD_CACHE_SIZE: self._words.clear()
+            self._words[word] = hit
+        return hit
+
+    def _loglik(self, text):
+        total, n = self._zero, 0
+        for word in normalize(text).split():
+            vector, count = self._word(word)
+            total = total + vector
+            n += count
+        return total, n
+
+    def _posterior(self, loglik, n):
+        # Mean log-likelihood per n-gram, sharpened with length: long messages
+        # get confident without collapsing to 0/1, short ones stay uncertain
+        np = self._np
+        z = loglik / np.maximum(n, 1) * self.sharpness * np.sqrt(np.minimum(n, 40))
+        z = np.exp(z - z.max(axis=-1, keepdims=True))
+        return z / z.sum(axis=-1, keepdims=True)
+
+    def _as_dict(self, probs, n):
+        if n < MIN_NGRAMS: return {lang: 1 / len(self.languages) for lang in self.languages}
+        return {lang: float(p) for lang, p in zip(self.languages, probs)}
+
+    def scores(self, text: str) -> dict:
+        """Probability per language; uniform when the text has nothing to go on."""
+        loglik, n = self._loglik(text)
+        return self._as_dict(self._posterior(loglik, n), n)
+
+    def scores_many(self, texts) -> list:
+        """``scores`` for a batch, with one posterior computation for all texts."""
+        np = self._np
+        pairs = [self._loglik(t) for t in texts]
+        if not pairs: return []
+        logliks = np.stack([p[0] for p in pairs])
+        counts = np.array([p[1] for p in pairs])
+        probs = self._posterior(logliks, counts[:, None])
+        return [self._as_dict(row, n) for row, n in zip(probs, counts)]
+
+    def detect(self, text: str, min_confidence=0.0):
+        """Most likely language, or None below ``min_confidence`` / for very short text."""
+        scores = self.scores(text)
+        lang = max(scores, key=scores.get)
+        if scores[lang] <= 1 / len(self.languages) or scores[lang] < min_confidence: return None
+        return lang
+
+
+_identifier = None
+_lock = threading.Lock()
+
+
+def get_identifier() -> LanguageIdentifier:
+    """Process-wide identifier, compiled on first use (a few ms)."""
+    global _identifier
+    if _identifier is None:
+        with _lock:
+            if _identifier is None: _identifier = LanguageIdentifier()
+    return _identifier
+
+
+def language_scores(text: str) -> dict:
+    return get_identifier().scores(text)
+
+
+def detect_language(text: str, min_confidence=0.0):
+    return get_identifier().detect(text, min_confidence)
+
+
+def is_hinglish(text: str, threshold=HINGLISH_THRESHOLD) -> bool:
+    if len(normalize(text).split()) < HINGLISH_MIN_WORDS: return False
+    return language_scores(text).get("Hinglish", 0.0) >= threshold
@@ -0,0 +1,143 @@
+"""Seed text for the language identifier's character n-gram profiles.
+
+Short, chat-style lines of the kind candidates type during an interview,
+one block per language offered in the sidebar plus romanised Hindi
+("Hinglish"). Keep technical terms in every language: candidates use them
+verbatim whatever they write in, so they shouldn't pull towards English.
+"""
+
+SAMPLES = {
+    "English": """
+        Hello, my name is Rahul and I am applying for the backend developer role.
+        I have around five years of experience working with Python and Django.
+        Could you please tell me why you need my phone number?
+        I live in Bangalore and I am open to relocating for the right opportunity.
+        Sure, my email address is the one on my resume.
+        In my last project we moved a monolith to microservices running on Kubernetes.
+        I would start by profiling the slow endpoint and checking the database queries.
+        We used Redis as a cache in front of PostgreSQL to cut the response time.
+        Honestly I have not worked with Kafka much, but I know the basic concepts.
+        The main trade-off is consistency against availability when the network fails.
+        I think unit tests should be fast and integration tests should cover the real flow.
+        Thanks, that makes sense. What is the next question?
+        I prefer not to share that right now, can we skip it?
+        Yes, I am comfortable with React and TypeScript on the frontend.
+        I led a team of four engineers and handled code reviews and releases.
+        We deployed everything with Docker and a CI pipeline on GitHub Actions.
+        Okay, I am ready whenever you are. Let's get started with the technical round.
+        To be honest I would need to look that up, but this is how I would approach it.
+        The bug was caused by a race condition between two workers writing the same row.
+        No problem at all, thank you for your time today.
+        What does the team look like and how do you run your sprints?
+        I usually write the design document first and then break the work into tasks.
+    """,
+    "Hindi": """
+        नमस्ते, मेरा नाम राहुल है और मैं बैकएंड डेवलपर की भूमिका के लिए आवेदन कर रहा हूँ।
+        मेरे पास पायथन और जैंगो के साथ लगभग पाँच साल का अनुभव है।
+        क्या आप बता सकते हैं कि आपको मेरा फ़ोन नंबर क्यों चाहिए?
+        मैं बैंगलोर में रहता हूँ और सही अवसर के लिए स्थान बदलने को तैयार हूँ।
+        ज़रूर, मेरा ईमेल पता वही है जो मेरे रिज़्यूमे में लिखा है।
+        पिछले प्रोजेक्ट में हमने पूरे सिस्टम को छोटी सेवाओं में बाँटा था।
+        मैं सबसे पहले धीमे हिस्से की जाँच करूँगा और डेटाबेस की क्वेरी देखूँगा।
+        हमने जवाब का समय कम करने के लिए कैश का इस्तेमाल किया।
+        सच कहूँ तो मैंने इस पर ज़्यादा काम नहीं किया है, लेकिन मुझे बुनियादी बातें पता हैं।
+        धन्यवाद, यह समझ में आता है। अगला सवाल क्या है?
+        मैं अभी यह जानकारी साझा नहीं करना चाहता, क्या हम इसे छोड़ सकते हैं?
+        हाँ, मुझे फ्रंटएंड पर काम करने में कोई दिक्कत नहीं है।
+        मैंने चार इंजीनियरों की टीम का नेतृत्व किया और कोड की समीक्षा की।
+        ठीक है, मैं तैयार हूँ। चलिए तकनीकी दौर शुरू करते हैं।
+        गड़बड़ी दो प्रक्रियाओं के एक साथ एक ही पंक्ति लिखने की वजह से हुई थी।
+        आपके समय के लिए बहुत बहुत शुक्रिया।
+        टीम कैसी है और आप काम की योजना कैसे बनाते हैं?
+        मैं पहले डिज़ाइन लिखता हूँ और फिर काम को छोटे हिस्सों में बाँटता हूँ।
+    """,
+    "Spanish": """
+        Hola, me llamo Rahul y estoy postulando para el puesto de desarrollador backend.
+        Tengo unos cinco años de experiencia trabajando con Python y Django.
+        ¿Podría decirme por qué necesita mi número de teléfono?
+        Vivo en Madrid y estoy dispuesto a mudarme por la oportunidad adecuada.
+        Claro, mi correo electrónico es el que aparece en mi currículum.
+        En mi último proyecto migramos un monolito a microservicios en Kubernetes.
+        Empezaría perfilando el endpoint lento y revisando las consultas a la base de datos.
+        Usamos Redis como caché delante de PostgreSQL para reducir el tiempo de respuesta.
+        Sinceramente no he trabajado mucho con Kafka, pero conozco los conceptos básicos.
+        La principal compensación es la consistencia frente a la disponibilidad.
+        Creo que las pruebas unitarias deben ser rápidas y las de integración cubrir el flujo real.
+        Gracias, tiene sentido. ¿Cuál es la siguiente pregunta?
+        Prefiero no compartir eso ahora, ¿podemos saltarlo?
+        Sí, me siento cómodo con React y TypeScript en el frontend.
+        Dirigí un equipo de cuatro ingenieros y me encargué de las revisiones de código.
+        Desplegábamos todo con Docker y un pipeline de integración continua.
+        Vale, estoy listo cuando quiera. Empecemos con la parte técnica.
+        El error se debía a una condición de carrera entre dos procesos que escribían la misma fila.
+        No hay problema, muchas gracias por su tiempo hoy.
+        ¿Cómo es el equipo y cómo organizan los sprints?
+    """,
+    "French": """
+        Bonjour, je m'appelle Rahul et je postule pour le poste de développeur backend.
+        J'ai environ cinq ans d'expérience avec Python et Django.
+        Pourriez-vous me dire pourquoi vous avez besoin de mon numéro de téléphone ?
+        J'habite à Lyon et je suis prêt à déménager pour la bonne opportunité.
+        Bien sûr, mon adresse e-mail est celle qui figure sur mon CV.
+        Dans mon dernier projet, nous avons migré un monolithe vers des microservices sur Kubernetes.
+        Je commencerais par profiler le point d'accès lent et vérifier les requêtes à la base de données.
+        Nous avons utilisé Redis comme cache devant PostgreSQL pour réduire le temps de réponse.
+        Honnêtement, je n'ai pas beaucoup travaillé avec Kafka, mais je connais les concepts de base.
+        Le principal compromis est la cohérence face à la disponibilité.
+        Je pense que les tests unitaires doivent être rapides et que les tests d'intégration couvrent le vrai parcours.
+        Merci, c'est logique. Quelle est la question suivante ?
+        Je préfère ne pas partager cela maintenant, pouvons-nous passer ?
+        Oui, je suis à l'aise avec React et TypeScript côté frontend.
+        J'ai dirigé une équipe de quatre ingénieurs et je m'occupais des revues de code.
+        Nous déployions tout avec Docker et une chaîne d'intégration continue.
+        D'accord, je suis prêt quand vous voulez. Commençons la partie technique.
+        Le bug venait d'une situation de concurrence entre deux processus qui écrivaient la même ligne.
+        Aucun problème, merci beaucoup pour votre temps aujourd'hui.
+        Comment est l'équipe et comment organisez-vous les sprints ?
+    """,
+    "German": """
+        Hallo, mein Name ist Rahul und ich bewerbe mich auf die Stelle als Backend-Entwickler.
+        Ich habe etwa fünf Jahre Erfahrung mit Python und Django.
+        Können Sie mir sagen, warum Sie meine Telefonnummer brauchen?
+        Ich wohne in Berlin und bin bereit, für die richtige Gelegenheit umzuziehen.
+        Natürlich, meine E-Mail-Adresse steht in meinem Lebenslauf.
+        In meinem letzten Projekt haben wir einen Monolithen auf Microservices in Kubernetes umgestellt.
+        Ich würde zuerst den langsamen Endpunkt profilieren und die Datenbankabfragen prüfen.
+        Wir haben Redis als Cache vor PostgreSQL eingesetzt, um die Antwortzeit zu senken.
+        Ehrlich gesagt habe ich nicht viel mit Kafka gearbeitet, aber ich kenne die Grundlagen.
+        Der wichtigste Kompromiss ist Konsistenz gegenüber Verfügbarkeit.
+        Ich finde, Unit-Tests sollten schnell sein und Integrationstests den echten Ablauf abdecken.
+        Danke, das ergibt Sinn. Was ist die nächste Frage?
+        Das möchte ich gerade lieber nicht angeben, können wir das überspringen?
+        Ja, ich arbeite gern mit React und TypeScript im Frontend.
+        Ich habe ein Team von vier Ingenieuren geleitet und mich um Code-Reviews gekümmert.
+        Wir haben alles mit Docker und einer CI-Pipeline ausgeliefert.
+        Okay, ich bin bereit, wann immer Sie wollen. Fangen wir mit dem technischen Teil an.
+        Der Fehler entstand durch eine Wettlaufsituation zwischen zwei Prozessen, die dieselbe Zeile schrieben.
+        Kein Problem, vielen Dank für Ihre Zeit heute.
+        Wie sieht das Team aus und wie plant ihr eure Sprints?
+    """,
+    "Hinglish": """
+        Haan ji, mera naam Rahul hai aur main backend developer ke role ke liye apply kar raha hoon.
+        Mujhe Python aur Django mein lagbhag paanch saal ka experience hai.
+        Aapko mera phone number kyun chahiye, thoda bata sakte ho?
+        Main Bangalore mein rehta hoon aur sahi opportunity ke liye shift ho sakta hoon.
+        Theek hai, mera email wahi hai jo resume mein diya hai.
+        Pichle project mein humne monolith ko microservices mein tod diya tha.
+        Main pehle slow endpoint ko profile karunga aur database queries check karunga.
+        Humne response time kam karne ke liye Redis ka cache lagaya tha.
+        Sach bolun toh Kafka pe zyada kaam nahi kiya, par basics pata hain.
+        Acha samajh gaya, toh agla sawaal kya hai?
+        Abhi yeh share nahi karna chahta, kya hum isko skip kar sakte hain?
+        Haan bilkul, React aur TypeScript ke saath mujhe koi dikkat nahi hai.
+        Maine chaar engineers ki team ko lead kiya aur code review bhi karta tha.
+        Theek hai bhai, main ready hoon, chalo technical round shuru karte hain.
+        Bug isliye aaya kyunki do workers ek hi row ko ek saath likh rahe the.
+        Koi baat nahi, aapka bahut bahut shukriya.
+        Team kaisi hai aur aap log sprint kaise plan karte ho?
+        Mujhe nahi pata yaar, lekin main aise approach karunga.
+        Kya main apna resume dobara upload kar sakta hoon?
+        Mera experience zyada tar backend aur APIs pe hai.
+        Accha chalega, aage badhte hain.
+    """,
+}
@@ -0,0 +1,190 @@
+"""Resilient wrapper around the Groq chat completions API.
+
+Every LLM call in the app goes through ``ResilientClient``, which adds:
+
+- a per-call deadline that bounds the total time across retries,
+- jittered exponential backoff on 429/5xx/connection errors that honours
+  ``retry-after`` and ``x-ratelimit-reset-*`` headers,
+- a circuit breaker that fails fast while the provider is clearly down,
+- optional hedging: a duplicate request if the first is slow to answer,
+- one pooled ``httpx.Client`` shared by every call and session.
+
+The Groq SDK and httpx are only imported when the first call is made, so
+constructing the client costs nothing at app start-up.
+"""
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 3
+BASE_DELAY = 0.5
+MAX_DELAY = 8.0
+
+RESET_HEADERS = ("retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+DURATION_RE = re.compile(r"(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+(?:\.\d+)?)ms)?$")
+
+
+class LLMError(Exception):
+    """The call could not be completed within its deadline/retry budget."""
+
+
+class CircuitOpenError(LLMError):
+    """Calls are short-circuited because the provider keeps failing."""
+
+
+def parse_duration(value):
+    """Seconds from '7.66s', '2m59.56s', '120ms' or a bare number; None if unknown."""
+    if value is None: return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    m = DURATION_RE.match(value)
+    if not m or not any(m.groups()): return None
+    h, mins, s, ms = (float(g) if g else 0.0 for g in m.groups())
+    return h * 3600 + mins * 60 + s + ms / 1000
+
+
+def retry_after(error):
+    """Longest wait the provider asked for in its rate-limit headers, if any."""
+    response = getattr(error, "response", None)
+    if response is None: return None
+    waits = [parse_duration(response.headers.get(h)) for h in RESET_HEADERS]
+    waits = [w for w in waits if w is not None]
+    return max(waits) if waits else None
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures, retries after ``reset_timeout``."""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None: return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout: return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        # Half-open lets calls through; the first result closes or re-opens it
+        return self.state != "open"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def retryable_errors():
+    import groq
+    # APITimeoutError is a subclass of APIConnectionError
+    return (groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError)
+
+
+class ResilientClient:
+    def __init__(self, api_key, base_url=None, timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES,
+                 base_delay=BASE_DELAY, max_delay=MAX_DELAY, breaker=None, max_connections=20, hedge_workers=8):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_connections = max_connections
+        self.breaker = breaker or CircuitBreaker()
+        self.http_client = None
+        self._raw = None
+        self._retryable = ()
+        self._init_lock = threading.Lock()
+        self._hedge_pool = ThreadPoolExecutor(max_workers=hedge_workers, thread_name_prefix="llm-hedge")
+
+    @property
+    def raw(self):
+        """The underlying ``groq.Groq`` client, built on first use."""
+        if self._raw is None:
+            with self._init_lock:
+                if self._raw is None:
+                    import groq
+                    import httpx
+                    self.http_client = httpx.Client(
+                        limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                        timeout=self.timeout,
+                    )
+                    self._retryable = retryable_errors()
+                    # Retries are ours, so the SDK's own retry loop is switched off
+                    self._raw = groq.Groq(api_key=self.api_key, base_url=self.base_url, http_client=self.http_client, max_retries=0)
+        return self._raw
+
+    def complete(self, deadline=None, hedge_after=None, **kwargs):
+        """``chat.completions.create(**kwargs)`` with retries inside ``deadline`` seconds.
+
+        With ``hedge_after``, an identical request is raced against the first
+        one if it hasn't answered after that many seconds.
+        """
+        return self._call(kwargs, deadline, hedge_after)
+
+    def stream(self, deadline=None, **kwargs):
+        """Opens a streaming completion. Only opening the stream is retried;
+        once tokens flow, a failure surfaces to the caller mid-stream."""
+        return self._call(dict(kwargs, stream=True), deadline, None)
+
+    def _call(self, kwargs, deadline, hedge_after):
+        if not self.breaker.allow():
+            raise CircuitOpenError("LLM provider is unavailable, please try again shortly")
+        end = time.monotonic() + (deadline or self.timeout * (self.max_retries + 1))
+        raw = self.raw
+        attempt = 0
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0: raise LLMError("LLM call timed out")
+            timeout = min(self.timeout, remaining)
+            try:
+                if hedge_after is not None and hedge_after < timeout:
+                    result = self._hedged(kwargs, timeout, hedge_after)
+                else:
+                    result = raw.chat.completions.create(timeout=timeout, **kwargs)
+                self.breaker.record_success()
+                return result
+            except self._retryable as e:
+                self.breaker.record_failure()
+                if attempt >= self.max_retries or not self.breaker.allow(): raise
+                backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                delay = max(backoff, retry_after(e) or 0)
+                if delay >= end - time.monotonic(): raise
+                time.sleep(delay)
+                attempt += 1
+
+    def _hedged(self, kwargs, timeout, hedge_after):
+        create = self.raw.chat.completions.create
+        futures = {self._hedge_pool.submit(create, timeout=timeout, **kwargs)}
+        done, _ = wait(futures, timeout=hedge_after)
+        if not done:
+            futures.add(self._hedge_pool.submit(create, timeout=max(timeout - hedge_after, 0.1), **kwargs))
+        error = None
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()  # the loser finishes in the background and is dropped
+                error = future.exception()
+        raise error
+
+    def close(self):
+        self._hedge_pool.shutdown(wait=False)
+        if self.http_client is not None: self.http_client.close()
@@ -0,0 +1,244 @@
+"""Local, deterministic candidate-to-job matching (no LLM call).
+
+A job description is parsed into canonical skills (via ``taxonomy``), a
+minimum years-of-experience requirement and its words. Each candidate's
+skills and position are hashed into a fixed-width term vector (CRC32
+buckets, so the same input always lands in the same place). Three signals
+are combined into a 0-100 ``match_score``:
+
+- skill coverage: the share of the job's skills the candidate has, each
+  skill weighted by its IDF over the pool being scored (rare asks count
+  more),
+- similarity: TF-IDF cosine between the candidate and job term vectors,
+- experience fit: candidate years over the required years, capped at 1
+  (0 when the years are unknown).
+
+The pool is kept as sparse (row, term, count) triples and the similarity is
+one sparse matrix-vector product (weighted ``bincount``s), so scoring costs
+O(terms), not O(candidates x DIM): thousands of candidates take a few
+milliseconds and the term matrix is never materialised.
+
+    python -m talentscout.matching job.txt screening_results.csv -o ranked.csv
+"""
+import argparse
+import csv
+import math
+import re
+import sys
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .taxonomy import display_skill, extract_skills, normalize_skills
+
+DIM = 1024
+WEIGHTS = {"skills": 0.55, "similarity": 0.30, "experience": 0.15}
+# No years on record scores like zero years: a blank must never outrank a real but short career
+UNKNOWN_EXPERIENCE_FIT = 0.0
+
+# "minimum 3 years" / "3+ years of (professional) experience", as opposed to "1 year of Kubernetes"
+YEARS_CONTEXT_BEFORE_RE = re.compile(r"(?:minimum|min\.?|at\s+least|requires?|required)\W*$", re.IGNORECASE)
+YEARS_CONTEXT_AFTER_RE = re.compile(r"^\W*(?:of\s+)?(?:[\w+#.-]+\s+){0,2}(?:experience|exp)\b", re.IGNORECASE)
+YEARS_REQUIRED_RE = re.compile(r"(\d{1,2})\s*(?:\+|-\s*\d{1,2}|to\s+\d{1,2})?\s*(?:\+\s*)?(?:years?|yrs?)", re.IGNORECASE)
+WORD_RE = re.compile(r"[a-z][a-z0-9\+#]+")
+STOPWORDS = {
+    "the", "and", "for", "with", "our", "you", "your", "are", "will", "have", "has", "this", "that", "from", "who",
+    "team", "work", "working", "years", "year", "experience", "role", "job", "must", "should", "strong", "good",
+    "knowledge", "skills", "ability", "able", "plus", "nice", "etc", "into", "across", "using", "use", "we", "in",
+    "of", "to", "a", "an", "on", "or", "as", "be", "is", "at", "by", "it", "any", "all", "least", "including",
+}
+MATCH_COLUMNS = ["match_score", "skill_coverage", "similarity", "experience_fit", "matched_skills", "missing_skills"]
+
+
+@dataclass
+class JobProfile:
+    text: str
+    skills: list = field(default_factory=list)  # canonical keys, in order of mention
+    min_years: float = None
+
+    @classmethod
+    def parse(cls, text, skills=None, min_years=None):
+        if skills is None: skills = extract_skills(text)
+        if min_years is None: min_years = required_years(text)
+        return cls(text=text or "", skills=list(skills), min_years=min_years)
+
+
+def required_years(text):
+    """The job's overall years requirement: the largest figure tied to "experience" or
+    "minimum", else the largest figure, so a per-tool "1 year of X" doesn't lower it."""
+    text = text or ""
+    found, tied = [], []
+    for m in YEARS_REQUIRED_RE.finditer(text):
+        years = float(m.group(1))
+        found.append(years)
+        if YEARS_CONTEXT_BEFORE_RE.search(text[max(m.start() - 20, 0):m.start()]) or YEARS_CONTEXT_AFTER_RE.match(text[m.end():m.end() + 40]):
+            tied.append(years)
+    return max(tied or found) if found else None
+
+
+def words(text):
+    return [w for w in WORD_RE.findall((text or "").lower()) if w not in STOPWORDS]
+
+
+@lru_cache(maxsize=65536)
+def bucket(term: str, dim=DIM) -> int:
+    return zlib.crc32(term.encode("utf-8")) % dim
+
+
+def record_skills(record):
+    return record.get("skills") or normalize_skills(record.get("tech_stack") or record.get("Tech Stack"))
+
+
+@lru_cache(maxsize=16384)
+def _skill_terms(skill, dim):
+    # A skill is a term of its own and, as words, overlaps a job that names it in prose
+    return (bucket(f"s:{skill}", dim), *(bucket(f"w:{w}", dim) for w in words(skill)))
+
+
+@lru_cache(maxsize=16384)
+def _position_terms(position, dim):
+    return tuple(bucket(f"w:{w}", dim) for w in words(position))
+
+
+def record_terms(record, dim=DIM):
+    """Hashed term ids for a candidate record (``candidates.candidate_record`` shape or a batch row)."""
+    position = record.get("position") or record.get("Desired Position(s)") or ""
+    terms = list(_position_terms(position, dim))
+    for skill in record_skills(record):
+        terms.extend(_skill_terms(skill, dim))
+    return terms
+
+
+def job_terms(job, dim=DIM):
+    terms = [f"s:{s}" for s in job.skills] + [f"w:{w}" for w in words(job.text)]
+    return [bucket(t, dim) for t in terms]
+
+
+class JobMatcher:
+    def __init__(self, job, dim=DIM, weights=None):
+        import numpy as np
+
+        self._np = np
+        self.job = job if isinstance(job, JobProfile) else JobProfile.parse(job)
+        self.dim = dim
+        self.weights = dict(WEIGHTS, **(weights or {}))
+        self.query = np.bincount(job_terms(self.job, dim), minlength=dim).astype(np.float32)
+
+    def score_arrays(self, term_rows, hits, years):
+        """Scores a pool given per-row term ids, a ``(rows, job skills)`` bool matrix and years (NaN if unknown).
+
+        Returns a dict of float arrays: match_score (0-100), skill_coverage,
+        similarity and experience_fit (0-1).
+        """
+        np = self._np
+        n, dim = len(term_rows), self.dim
+        if not n: return {k: np.zeros(0) for k in ("match_score", "skill_coverage", "similarity", "experience_fit")}
+        lengths = np.fromiter((len(t) for t in term_rows), dtype=np.intp, count=n)
+        cols = np.concatenate([np.asarray(t, dtype=np.intp) for t in term_rows])
+        rows = np.repeat(np.arange(n), lengths)
+
+        # Sparse (row, term) -> count pairs; nothing here is O(rows x DIM)
+        pairs, counts = np.unique(rows * dim + cols, return_counts=True)
+        pair_rows, pair_cols = pairs // dim, pairs % dim
+        df = np.bincount(pair_cols, minlength=dim) + (self.query > 0)
+        idf = np.log((n + 1) / (df + 1)) + 1
+        q = np.log1p(self.query) * idf
+        q_norm = float(np.linalg.norm(q)) or 1.0
+        values = np.log1p(counts) * idf[pair_cols]
+        # Sparse matrix-vector product and row norms as two weighted bincounts
+        dots = np.bincount(pair_rows, weights=values * q[pair_cols], minlength=n)
+        norms = np.sqrt(np.bincount(pair_rows, weights=values * values, minlength=n))
+        similarity = dots / (np.maximum(norms, 1e-9) * q_norm)
+
+        hits = np.asarray(hits, dtype=bool).reshape(n, len(self.job.skills))
+        if self.job.skills:
+            skill_idf = np.log((n + 1) / (hits.sum(axis=0) + 1)) + 1
+            coverage = hits @ skill_idf / skill_idf.sum()
+        else:
+            coverage = similarity
+
+        years = np.asarray(years, dtype=np.float64)
+        if self.job.min_years:
+            experience = np.clip(years / self.job.min_years, 0, 1)
+            experience = np.where(np.isnan(experience), UNKNOWN_EXPERIENCE_FIT, experience)
+        else:
+            experience = np.ones(n)
+
+        w = self.weights
+        score = 100 * (w["skills"] * coverage + w["similarity"] * similarity + w["experience"] * experience)
+        return {"match_score": score, "skill_coverage": coverage, "similarity": similarity, "experience_fit": experience}
+
+    def score(self, records) -> list:
+        """One result dict per record, in input order (see ``MATCH_COLUMNS``)."""
+        from .candidates import parse_years
+
+        skill_sets = [set(record_skills(r)) for r in records]
+        hits = [[s in have for s in self.job.skills] for have in skill_sets]
+        years = [parse_years(r.get("experience_years", r.get("Years of Experience"))) for r in records]
+        arrays = self.score_arrays([record_terms(r, self.dim) for r in records], hits,
+                                   [math.nan if y is None else y for y in years])
+        results = []
+        for i, have in enumerate(skill_sets):
+            results.append({
+                "match_score": round(float(arrays["match_score"][i]), 1),
+                "skill_coverage": round(float(arrays["skill_coverage"][i]), 3),
+                "similarity": round(float(arrays["similarity"][i]), 3),
+                "experience_fit": round(float(arrays["experience_fit"][i]), 3),
+                **self.explain(have),
+            })
+        return results
+
+    def explain(self, skills) -> dict:
+        have = set(skills)
+        return {
+            "matched_skills": ", ".join(display_skill(s) for s in self.job.skills if s in have),
+            "missing_skills": ", ".join(display_skill(s) for s in self.job.skills if s not in have),
+        }
+
+
+def rank_candidates(job, records, top=None) -> list:
+    """``(record, result)`` pairs, best match first."""
+    results = JobMatcher(job).score(records)
+    ranked = sorted(zip(records, results), key=lambda pair: -pair[1]["match_score"])
+    return ranked[:top] if top else ranked
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank screened candidates against a job description, locally.")
+    parser.add_argument("job", help="job description text file ('-' for stdin)")
+    parser.add_argument("results", nargs="?", help="batch screening output (.csv/.jsonl); default: the candidate index")
+    parser.add_argument("-o", "--output", help="write the ranked rows as CSV here")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    job_text = sys.stdin.read() if args.job == "-" else open(args.job, encoding="utf-8").read()
+    job = JobProfile.parse(job_text)
+    print(f"Job skills: {', '.join(display_skill(s) for s in job.skills) or '(none found)'}; "
+          f"min years: {job.min_years if job.min_years is not None else '-'}", file=sys.stderr)
+
+    if args.results:
+        from .batch import read_rows
+        records = [row for row in read_rows(args.results) if row.get("status", "ok") == "ok"]
+    else:
+        from .candidates import get_candidate_index
+        index = get_candidate_index()
+        records = [index.records[row] for row in index.rows.values()]
+    ranked = rank_candidates(job, records, top=None if args.output else args.top)
+
+    if args.output:
+        columns = list(dict.fromkeys([*MATCH_COLUMNS, *(k for r, _ in ranked for k in r)]))
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows({**record, **result} for record, result in ranked)
+        print(f"Wrote {len(ranked)} ranked candidates to {args.output}", file=sys.stderr)
+    else:
+        for record, result in ranked:
+            name = record.get("name") or record.get("Full Name") or record.get("file") or "?"
+            print(f"{result['match_score']:>6} {name[:30]:<30} matched: {result['matched_skills'] or '-'}"
+                  f" | missing: {result['missing_skills'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Low-overhead latency and token instrumentation.
+
+Stages are timed with ``span("stage")`` and LLM usage is recorded with
+``record_usage("stage", completion)``. Everything lands in one in-process
+registry of histograms and counters (a lock and a bisect per observation),
+which can be rendered in the Prometheus text format, written to a file for
+a textfile collector or served over HTTP on ``/metrics``.
+"""
+import bisect
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PREFIX = "talentscout"
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Bucket-interpolated estimate, the same way Prometheus' histogram_quantile works."""
+        if not self.count: return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets): return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.stages = {}  # stage -> Histogram of seconds
+        self.errors = {}  # stage -> count
+        self.tokens = {}  # (stage, "prompt" | "completion") -> count
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()  # one textfile write at a time per process
+        self._exported = 0.0
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            hist = self.stages.get(stage)
+            if hist is None: hist = self.stages[stage] = Histogram(self.buckets)
+            hist.observe(seconds)
+
+    def count_error(self, stage):
+        with self._lock:
+            self.errors[stage] = self.errors.get(stage, 0) + 1
+
+    def add_tokens(self, stage, prompt=0, completion=0):
+        with self._lock:
+            if prompt: self.tokens[(stage, "prompt")] = self.tokens.get((stage, "prompt"), 0) + prompt
+            if completion: self.tokens[(stage, "completion")] = self.tokens.get((stage, "completion"), 0) + completion
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            # st.rerun()/st.stop() unwind via exceptions too; only count real failures
+            if isinstance(e, Exception) and type(e).__module__.split(".")[0] != "streamlit":
+                self.count_error(stage)
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def record_usage(self, stage, response):
+        """Adds prompt/completion tokens from a completion or a final stream chunk."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            # Groq reports streaming usage on the last chunk under x_groq
+            usage = getattr(getattr(response, "x_groq", None), "usage", None)
+        if usage is None: return
+        self.add_tokens(stage, getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0)
+
+    def snapshot(self):
+        """Per-stage summary rows for display."""
+        with self._lock:
+            rows = []
+            for stage, hist in sorted(self.stages.items()):
+                rows.append({
+                    "stage": stage,
+                    "count": hist.count,
+                    "errors": self.errors.get(stage, 0),
+                    "avg_ms": round(hist.sum / hist.count * 1000, 1),
+                    "p50_ms": round(hist.quantile(0.5) * 1000, 1),
+                    "p95_ms": round(hist.quantile(0.95) * 1000, 1),
+                    "prompt_tokens": self.tokens.get((stage, "prompt"), 0),
+                    "completion_tokens": self.tokens.get((stage, "completion"), 0),
+                })
+            return rows
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            lines = [
+                f"# HELP {PREFIX}_stage_seconds Time spent in each pipeline stage.",
+                f"# TYPE {PREFIX}_stage_seconds histogram",
+            ]
+            for stage, hist in sorted(self.stages.items()):
+                cumulative = 0
+                for le, n in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+                    cumulative += n
+                    lines.append(f'{PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{PREFIX}_stage_seconds_sum{{stage="{stage}"}} {hist.sum:.6f}')
+                lines.append(f'{PREFIX}_stage_seconds_count{{stage="{stage}"}} {hist.count}')
+            lines += [
+                f"# HELP {PREFIX}_stage_errors_total Stage executions that raised.",
+                f"# TYPE {PREFIX}_stage_errors_total counter",
+            ]
+            lines += [f'{PREFIX}_stage_errors_total{{stage="{s}"}} {n}' for s, n in sorted(self.errors.items())]
+            lines += [
+                f"# HELP {PREFIX}_llm_tokens_total LLM tokens by stage and kind.",
+                f"# TYPE {PREFIX}_llm_tokens_total counter",
+            ]
+            lines += [
+                f'{PREFIX}_llm_tokens_total{{stage="{s}",kind="{k}"}} {n}' for (s, k), n in sorted(self.tokens.items())
+            ]
+            return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path, min_interval=0.0) -> bool:
+        """Atomically writes the Prometheus text (for node_exporter's textfile collector).
+
+        Skips the write if another thread is already writing or the last one
+        was under ``min_interval`` seconds ago. Returns whether it wrote; a
+        failed write is swallowed, since metrics must never break the caller.
+        """
+        if not self._export_lock.acquire(blocking=False): return False
+        tmp = None
+        try:
+            if time.monotonic() - self._exported < min_interval: return False
+            # A unique temp file per write: other processes (replicas) export to the same path
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".metrics-", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render_prometheus())
+            os.chmod(tmp, 0o644)  # mkstemp's 0600 would hide it from the collector
+            os.replace(tmp, path)
+            tmp = None
+            self._exported = time.monotonic()
+            return True
+        except OSError:
+            return False
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            self._export_lock.release()
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serves ``/metrics`` from a daemon thread; returns the server. Local-only unless ``host`` says otherwise."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.errors.clear()
+            self.tokens.clear()
+
+
+# Process-wide registry shared by the app, the helpers and all sessions
+REGISTRY = MetricsRegistry()
+span = REGISTRY.span
+record_usage = REGISTRY.record_usage
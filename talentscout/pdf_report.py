@@ -0,0 +1,201 @@
+"""Candidate report rendering: radar chart and PDF document.
+
+Imports numpy, matplotlib and fpdf at module level, so import it lazily
+(``talentscout.reports`` does) to keep them off the app's cold-start path.
+"""
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+
+# No GUI backend is ever needed; pick Agg before matplotlib is first imported
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+from fpdf import FPDF
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+CHART_COLOR = '#4A90E2'
+
+
+def latin1(value) -> str:
+    """FPDF core fonts only speak latin-1, so replace anything else."""
+    return str(value).encode('latin-1', 'replace').decode('latin-1')
+
+
+# --- RADAR CHART ---
+CHART_LABELS = {
+    "technical_score": "Tech",
+    "communication_score": "Comm",
+    "problem_solving_score": "Prob Solv",
+    "experience_relevance": "Exp Fit",
+}
+
+
+@dataclass(frozen=True)
+class ChartImage:
+    width: int
+    height: int
+    rgb: bytes
+    deflated: bool = False  # rgb already zlib-compressed
+
+    def deflate(self) -> "ChartImage":
+        if self.deflated: return self
+        return ChartImage(self.width, self.height, zlib.compress(self.rgb), deflated=True)
+
+
+class RadarChart:
+    """One radar figure reused for many charts.
+
+    Axes, grid and labels are drawn once and kept as a background bitmap;
+    each chart restores it and draws only the score polygon. A bare Figure
+    (no pyplot) keeps this free of global state, but an instance is not
+    thread-safe: use ``radar_chart`` for one per thread.
+    """
+
+    def __init__(self, categories, size=5):
+        self.categories = tuple(categories)
+        angles = np.linspace(0, 2 * np.pi, len(self.categories), endpoint=False).tolist()
+        self.angles = angles + angles[:1]
+
+        self.fig = Figure(figsize=(size, size))
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.ax = self.fig.add_subplot(polar=True)
+        zeros = [0] * len(self.angles)
+        self._fill = ax.fill(self.angles, zeros, color=CHART_COLOR, alpha=0.15, animated=True)[0]
+        self._line = ax.plot(self.angles, zeros, color=CHART_COLOR, linewidth=2, animated=True)[0]
+        ax.set_ylim(0, 100)
+        ax.set_yticks([20, 40, 60, 80, 100])
+        ax.set_yticklabels(["20", "40", "60", "80", "100"], color="grey", size=8)
+        ax.set_xticks(self.angles[:-1])
+        ax.set_xticklabels(self.categories, size=10)
+        self.fig.tight_layout()
+        self.canvas.draw()  # animated artists are left out of the background
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def render(self, values) -> ChartImage:
+        values = [float(v or 0) for v in values]
+        values += values[:1]
+        self._line.set_data(self.angles, values)
+        self._fill.set_xy(np.column_stack([self.angles, values]))
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self._fill)
+        self.ax.draw_artist(self._line)
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        height, width = rgba.shape[:2]
+        return ChartImage(width=width, height=height, rgb=rgba[..., :3].tobytes())
+
+
+_charts = threading.local()
+
+
+def radar_chart(categories) -> RadarChart:
+    """This thread's chart template for ``categories``."""
+    templates = _charts.__dict__.setdefault("templates", {})
+    key = tuple(categories)
+    if key not in templates: templates[key] = RadarChart(key)
+    return templates[key]
+
+
+def create_radar_chart(scores) -> ChartImage:
+    """Draws the competency radar chart in memory and returns raw RGB pixels."""
+    return radar_chart(scores.keys()).render(scores.values())
+
+
+def report_scores(data) -> dict:
+    return {label: data.get(field, 0) for field, label in CHART_LABELS.items()}
+
+
+def render_charts(reports, deflate=True) -> list:
+    """Charts for many reports; the unit of work for a process pool in bulk export."""
+    charts = [create_radar_chart(report_scores(r)) for r in reports]
+    return [c.deflate() for c in charts] if deflate else charts
+
+
+# --- PDF ---
+class PDFReport(FPDF):
+    def header(self):
+        self.set_font('Arial', 'B', 15)
+        self.cell(0, 10, 'TalentScout AI - Candidate Evaluation', 0, 1, 'C')
+        self.ln(5)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Arial', 'I', 8)
+        self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
+
+    def memory_image(self, name, chart: ChartImage, x=None, y=None, w=0, h=0):
+        """Places an in-memory RGB image without round-tripping through a file."""
+        if name not in self.images:
+            # Same info dict FPDF builds in _parsepng, so _putimages embeds it as-is.
+            self.images[name] = {
+                'w': chart.width,
+                'h': chart.height,
+                'cs': 'DeviceRGB',
+                'bpc': 8,
+                'f': 'FlateDecode',
+                'data': chart.rgb if chart.deflated else zlib.compress(chart.rgb),
+                'i': len(self.images) + 1,
+            }
+        self.image(name, x=x, y=y, w=w, h=h)
+
+
+def write_candidate(pdf, data, chart=None, image_name="radar_chart"):
+    """Adds one candidate's evaluation to ``pdf``, starting on a new page."""
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+
+    # Details
+    pdf.cell(0, 10, f"Candidate Name: {latin1(data.get('name') or 'N/A')}", ln=True)
+    pdf.cell(0, 10, f"Position: {latin1(data.get('position') or 'N/A')}", ln=True)
+
+    # Tech Stack (wrapped)
+    pdf.ln(2)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, "Tech Stack:", ln=True)
+    pdf.set_font("Arial", size=11)
+    pdf.multi_cell(0, 7, latin1(data.get('tech_stack') or 'N/A'))
+
+    pdf.ln(5)
+
+    # Verdict
+    verdict = data.get('verdict') or 'Pending'
+    color = (0, 128, 0) if "Hire" in verdict else (255, 0, 0)
+    pdf.set_text_color(*color)
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, f"VERDICT: {latin1(verdict)}", ln=True)
+    pdf.set_text_color(0, 0, 0)
+
+    # Graph + Summary
+    pdf.memory_image(image_name, chart or create_radar_chart(report_scores(data)), x=60, y=None, w=90)
+
+    # Add Graph Summary
+    pdf.ln(5)
+    pdf.set_font("Arial", 'I', 11)
+    pdf.set_text_color(100, 100, 100)  # Grey color for explanation
+    summary_text = f"Graph Interpretation: {data.get('graph_summary') or 'Analysis of core competencies.'}"
+    pdf.multi_cell(0, 7, latin1(summary_text), align='C')
+    pdf.set_text_color(0, 0, 0)  # Reset color
+
+    # Strengths
+    pdf.ln(10)
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, "Strengths:", ln=True)
+    pdf.set_font("Arial", size=11)
+    for s in data.get('strengths') or []:
+        pdf.cell(0, 7, f"- {latin1(s)}", ln=True)
+
+    # Improvements
+    pdf.ln(5)
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, "Improvements:", ln=True)
+    pdf.set_font("Arial", size=11)
+    for i in data.get('improvement_areas') or []:
+        pdf.cell(0, 7, f"- {latin1(i)}", ln=True)
+
+
+def generate_pdf_report(data, chart=None):
+    pdf = PDFReport()
+    write_candidate(pdf, data, chart)
+    return pdf.output(dest="S").encode("latin-1")
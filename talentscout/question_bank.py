@@ -0,0 +1,256 @@
+"""Graded technical questions per skill, picked locally during the interview.
+
+Most candidates share a handful of skills, so asking the LLM to invent each
+question from scratch is wasted work. The bank holds question sets per
+canonical skill (``taxonomy``) and difficulty: a bundled seed set plus
+sets generated once by the LLM and stored in SQLite, so every later
+candidate with that skill reuses them.
+
+``plan_turn`` decides each interview turn from the transcript alone: the
+next unasked bank question (rotating through the candidate's stack, at the
+difficulty their experience suggests), or an LLM turn when one is really
+needed: a clarifying question from the candidate, a follow-up on a
+substantial answer, a non-English interview or an exhausted bank.
+
+    python -m talentscout.question_bank generate elixir terraform
+    python -m talentscout.question_bank stats
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .candidates import parse_years
+from .intake import looks_like_direct_question
+from .question_bank_seed import SEED_QUESTIONS
+from .resume_cache import DEFAULT_DIR
+from .taxonomy import SKILLS, display_skill, normalize_skills
+
+DIFFICULTIES = ("junior", "mid", "senior")
+QUESTIONS_PER_INTERVIEW = 6
+FOLLOW_UP_MIN_WORDS = 25  # answers at least this long earn an LLM follow-up...
+MAX_FOLLOW_UPS = 2  # ...this many times per interview
+QUESTIONS_PER_LEVEL = 3  # when generating a set for a new skill
+ACKNOWLEDGEMENTS = ("Thanks, got it.", "Thanks for the detail.", "Understood.", "Good, thank you.", "Okay, noted.")
+CLOSING = ("That's all the technical questions I have. Thank you! You can click \"📝 Generate Report\" in the "
+           "sidebar for your evaluation, or ask me anything about the role.")
+
+CLARIFY_INSTRUCTION = ("The candidate asked a question. Answer it briefly and helpfully, then restate the last "
+                       "technical question you asked. Do not ask a new question.")
+FOLLOW_UP_INSTRUCTION = ("Briefly acknowledge the candidate's answer, then ask exactly ONE short follow-up question "
+                         "that probes deeper into what they just said. Do not change topic.")
+
+GENERATE_PROMPT = """
+Write technical interview questions for the skill "{skill}".
+Give {n} questions for each level: junior, mid and senior.
+Each question is one or two sentences, answerable verbally in a few minutes, and does not need code to be written.
+RETURN JSON ONLY: {{"junior": [string], "mid": [string], "senior": [string]}}
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    skill TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    question TEXT NOT NULL,
+    source TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (skill, difficulty, question)
+);
+"""
+
+
+def difficulty_for(years) -> str:
+    years = parse_years(years)
+    if years is None: return "mid"
+    if years < 2: return "junior"
+    return "mid" if years < 5 else "senior"
+
+
+class QuestionBank:
+    """Seed questions plus LLM-generated sets persisted in SQLite, cached in memory."""
+
+    def __init__(self, path=None, seed=SEED_QUESTIONS):
+        if path is None:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_DIR, "questions.sqlite3")
+        self.path = path
+        self.seed = seed
+        self._sets = None  # skill -> difficulty -> [question]
+        self._lock = threading.Lock()
+        self._pending = set()  # skills being generated
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="question-bank")
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _load(self):
+        with self._lock:
+            if self._sets is not None: return self._sets
+            sets = {skill: {d: list(qs) for d, qs in levels.items()} for skill, levels in self.seed.items()}
+            with self._connect() as conn:
+                for skill, difficulty, question in conn.execute(
+                        "SELECT skill, difficulty, question FROM questions ORDER BY created_at"):
+                    level = sets.setdefault(skill, {}).setdefault(difficulty, [])
+                    if question not in level: level.append(question)
+            self._sets = sets
+            return sets
+
+    def skills(self) -> set:
+        return set(self._load())
+
+    def questions(self, skill, difficulty=None) -> list:
+        levels = self._load().get(skill, {})
+        if difficulty: return list(levels.get(difficulty, ()))
+        return [q for d in DIFFICULTIES for q in levels.get(d, ())]
+
+    def add(self, skill, sets, source="llm") -> int:
+        """Stores ``{difficulty: [question]}`` for a skill; returns how many were new."""
+        now = time.time()
+        rows = [(skill, d, q.strip(), source, now) for d, qs in sets.items() if d in DIFFICULTIES
+                for q in qs if isinstance(q, str) and q.strip()]
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO questions VALUES (?, ?, ?, ?, ?)", rows)
+            added = conn.total_changes - before
+        with self._lock:
+            self._sets = None
+        return added
+
+    def generate(self, skill, client, model, n=QUESTIONS_PER_LEVEL) -> int:
+        """One LLM call that writes a graded set for ``skill`` and stores it."""
+        from .metrics import record_usage, span
+
+        with span("question_bank_generate"):
+            completion = client.complete(
+                model=model,
+                messages=[{"role": "user", "content": GENERATE_PROMPT.format(skill=display_skill(skill), n=n)}],
+                temperature=0.4,
+                response_format={"type": "json_object"},
+            )
+        record_usage("question_bank_generate", completion)
+        return self.add(skill, json.loads(completion.choices[0].message.content))
+
+    def fill_missing(self, skills, client, model):
+        """Generates sets for taxonomy skills the bank lacks, in the background, once per skill."""
+        known = self.skills()
+        for skill in skills:
+            with self._lock:
+                if skill in known or skill not in SKILLS or skill in self._pending: continue
+                self._pending.add(skill)
+            self._pool.submit(self._fill, skill, client, model)
+
+    def _fill(self, skill, client, model):
+        try:
+            self.generate(skill, client, model)
+        except Exception:
+            pass  # the interview falls back to LLM questions for this skill
+        finally:
+            with self._lock:
+                self._pending.discard(skill)
+
+    def next_question(self, stack, years=None, asked=(), seed=""):
+        """``(skill, question)`` for the next turn, or None if the bank has nothing left.
+
+        Skills are taken in turn from the candidate's stack, starting at the
+        difficulty their experience suggests and moving to the nearest other
+        level once that runs out. ``seed`` varies the pick between candidates.
+        """
+        skills = [s for s in normalize_skills(stack) if self.questions(s)]
+        if not skills: return None
+        asked = set(asked)
+        level = DIFFICULTIES.index(difficulty_for(years))
+        levels = sorted(DIFFICULTIES, key=lambda d: abs(DIFFICULTIES.index(d) - level))
+        start = len(asked)
+        for offset in range(len(skills)):
+            skill = skills[(start + offset) % len(skills)]
+            for difficulty in levels:
+                fresh = [q for q in self.questions(skill, difficulty) if q not in asked]
+                if fresh:
+                    return skill, fresh[zlib.crc32(f"{seed}:{skill}:{start}".encode("utf-8")) % len(fresh)]
+        return None
+
+
+@dataclass(frozen=True)
+class InterviewTurn:
+    kind: str  # bank | closing | clarify | follow_up | llm
+    text: str = None  # local reply, for bank and closing turns
+    instruction: str = None  # extra system instruction for LLM turns
+    skill: str = None
+
+
+def plan_turn(bank, messages, stack, years=None, language="English", seed="") -> InterviewTurn:
+    """Decides the reply to the candidate's latest message without calling the LLM."""
+    if language != "English": return InterviewTurn("llm")
+    answer = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+    if looks_like_direct_question(answer): return InterviewTurn("clarify", instruction=CLARIFY_INSTRUCTION)
+
+    bank_questions = {q for skill in normalize_skills(stack) for q in bank.questions(skill)}
+    replies = [m["content"] for m in messages if m["role"] == "assistant"]
+    asked, follow_ups, closed, last_was_bank = [], 0, False, False
+    for reply in replies:
+        found = next((q for q in bank_questions if q in reply), None)
+        if found: asked.append(found)
+        elif last_was_bank: follow_ups += 1
+        closed = closed or reply == CLOSING
+        last_was_bank = found is not None
+
+    if closed: return InterviewTurn("llm")
+    if last_was_bank and len(answer.split()) >= FOLLOW_UP_MIN_WORDS and follow_ups < MAX_FOLLOW_UPS:
+        return InterviewTurn("follow_up", instruction=FOLLOW_UP_INSTRUCTION)
+    if len(asked) >= QUESTIONS_PER_INTERVIEW: return InterviewTurn("closing", text=CLOSING)
+    picked = bank.next_question(stack, years, asked, seed)
+    if picked is None: return InterviewTurn("llm")
+    skill, question = picked
+    ack = ACKNOWLEDGEMENTS[len(replies) % len(ACKNOWLEDGEMENTS)] + " " if asked else ""
+    return InterviewTurn("bank", text=f"{ack}Next, on {display_skill(skill)}: {question}", skill=skill)
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or extend the technical question bank.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gen = sub.add_parser("generate", help="generate and store graded questions for skills (one LLM call each)")
+    gen.add_argument("skills", nargs="+")
+    gen.add_argument("--model", default="llama-3.3-70b-versatile")
+    gen.add_argument("--force", action="store_true", help="also for skills the bank already covers")
+    sub.add_parser("stats", help="questions per skill and difficulty")
+    show = sub.add_parser("show", help="print the questions for a skill")
+    show.add_argument("skill")
+    args = parser.parse_args(argv)
+
+    bank = QuestionBank()
+    if args.command == "stats":
+        for skill in sorted(bank.skills()):
+            counts = " ".join(f"{d}={len(bank.questions(skill, d))}" for d in DIFFICULTIES)
+            print(f"{display_skill(skill):<30} {counts}")
+    elif args.command == "show":
+        skill = normalize_skills([args.skill])[0]
+        for d in DIFFICULTIES:
+            for q in bank.questions(skill, d):
+                print(f"[{d}] {q}")
+    else:
+        from dotenv import load_dotenv
+        from .llm import ResilientClient
+
+        load_dotenv()
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key: parser.error("GROQ_API_KEY is not set")
+        client = ResilientClient(api_key=api_key)
+        known = bank.skills()
+        for skill in normalize_skills(args.skills):
+            if skill in known and not args.force:
+                print(f"{display_skill(skill)}: already in the bank (use --force to add more)")
+                continue
+            print(f"{display_skill(skill)}: {bank.generate(skill, client, args.model)} questions added")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""Bundled technical questions, keyed by canonical skill (see ``taxonomy``) and difficulty."""
+
+SEED_QUESTIONS = {
+    "python": {
+        "junior": [
+            "What is the difference between a list and a tuple in Python, and when would you pick each?",
+            "How do you handle exceptions in Python? Walk me through try/except/else/finally.",
+            "What does a Python virtual environment give you, and how do you create one?",
+        ],
+        "mid": [
+            "How do generators differ from returning a list, and where have they helped you?",
+            "Explain how decorators work and describe one you have written.",
+            "What is the GIL, and how does it affect threads versus processes for CPU-bound work?",
+        ],
+        "senior": [
+            "How would you profile and speed up a slow Python service in production?",
+            "When would you choose asyncio over threads or multiprocessing, and what are the pitfalls?",
+            "How do you structure and package a large Python codebase so several teams can work on it?",
+        ],
+    },
+    "javascript": {
+        "junior": [
+            "What is the difference between let, const and var?",
+            "Explain the difference between == and === with an example.",
+        ],
+        "mid": [
+            "How does the event loop work, and where do promises and setTimeout callbacks run?",
+            "What is a closure, and where have you used one deliberately?",
+            "How do you handle errors in async/await code?",
+        ],
+        "senior": [
+            "How would you track down a memory leak in a long-running JavaScript application?",
+            "How do you keep bundle size and start-up time under control in a large front end?",
+        ],
+    },
+    "typescript": {
+        "junior": [
+            "What does TypeScript add over JavaScript, and what does it not protect you from at runtime?",
+            "What is the difference between an interface and a type alias?",
+        ],
+        "mid": [
+            "How do generics help you, and can you describe a generic function you've written?",
+            "What are union types and type narrowing? Give an example.",
+        ],
+        "senior": [
+            "How would you migrate a large JavaScript codebase to TypeScript incrementally?",
+            "How do you model API contracts so the front end and back end stay in sync?",
+        ],
+    },
+    "java": {
+        "junior": [
+            "What is the difference between an abstract class and an interface in Java?",
+            "How do equals() and hashCode() relate, and why does it matter for HashMap?",
+        ],
+        "mid": [
+            "How do you make code thread-safe in Java? Compare synchronized, locks and concurrent collections.",
+            "Explain checked versus unchecked exceptions and how you decide which to use.",
+            "How do streams differ from plain loops, and when do you avoid them?",
+        ],
+        "senior": [
+            "How would you diagnose high GC pause times in a JVM service?",
+            "How do you design a Java service for graceful shutdown and zero-downtime deploys?",
+        ],
+    },
+    "go": {
+        "junior": [
+            "What are goroutines and channels, and how do they work together?",
+            "How does error handling in Go differ from exceptions?",
+        ],
+        "mid": [
+            "How do you use context.Context for cancellation and timeouts?",
+            "When would you use a mutex instead of a channel?",
+        ],
+        "senior": [
+            "How would you find and fix a goroutine leak in a production service?",
+            "How do you structure a large Go project and its package boundaries?",
+        ],
+    },
+    "c++": {
+        "junior": [
+            "What is the difference between a pointer and a reference in C++?",
+            "What does RAII mean, and why is it important?",
+        ],
+        "mid": [
+            "Explain move semantics and when std::move actually helps.",
+            "When would you use unique_ptr, shared_ptr or weak_ptr?",
+        ],
+        "senior": [
+            "How do you find and fix undefined behaviour or memory corruption in a large C++ codebase?",
+            "How do you reason about cache locality when optimising hot C++ code?",
+        ],
+    },
+    "c#": {
+        "junior": [
+            "What is the difference between a class and a struct in C#?",
+            "What are properties, and how do they differ from public fields?",
+        ],
+        "mid": [
+            "How does async/await work in C#, and what is a deadlock risk with .Result?",
+            "How do you use LINQ, and when can it hurt performance?",
+        ],
+        "senior": [
+            "How would you diagnose thread-pool starvation in an ASP.NET Core service?",
+            "How do you design dependency injection and module boundaries in a large .NET solution?",
+        ],
+    },
+    "sql": {
+        "junior": [
+            "What is the difference between INNER JOIN and LEFT JOIN?",
+            "What is the difference between WHERE and HAVING?",
+        ],
+        "mid": [
+            "How do indexes speed up queries, and when can they slow things down?",
+            "How would you find the second-highest salary per department?",
+            "What are window functions, and when have you used one?",
+        ],
+        "senior": [
+            "How do you approach a slow query in production? Walk me through reading the execution plan.",
+            "How do transaction isolation levels differ, and which anomalies does each allow?",
+        ],
+    },
+    "react": {
+        "junior": [
+            "What is the difference between props and state in React?",
+            "Why does React need a key on list items?",
+        ],
+        "mid": [
+            "How does useEffect work, and what goes wrong with its dependency array?",
+            "How do you avoid unnecessary re-renders in a React app?",
+            "How do you decide between local state, context and a state library?",
+        ],
+        "senior": [
+            "How would you architect a large React application that several teams work on?",
+            "How do you approach server-side rendering or streaming, and what trade-offs come with it?",
+        ],
+    },
+    "angular": {
+        "junior": [
+            "What are components, modules and services in Angular?",
+            "How does data binding work in Angular templates?",
+        ],
+        "mid": [
+            "How does change detection work, and when would you use OnPush?",
+            "How do you use RxJS observables for HTTP calls and avoid subscription leaks?",
+        ],
+        "senior": [
+            "How would you improve the load time of a large Angular application?",
+            "How do you structure state management in a complex Angular app?",
+        ],
+    },
+    "vue": {
+        "junior": [
+            "What are computed properties, and how do they differ from methods?",
+            "How do parent and child components communicate in Vue?",
+        ],
+        "mid": [
+            "How does Vue's reactivity system track dependencies?",
+            "When would you use the Composition API instead of the Options API?",
+        ],
+        "senior": [
+            "How do you organise state and modules in a large Vue application?",
+            "How would you profile and fix a slow Vue page?",
+        ],
+    },
+    "node.js": {
+        "junior": [
+            "What makes Node.js non-blocking, and what kind of work blocks it?",
+            "How do you manage dependencies and scripts with npm?",
+        ],
+        "mid": [
+            "How do you handle CPU-heavy work in a Node.js service?",
+            "How do streams work in Node.js, and when are they better than reading a whole file?",
+        ],
+        "senior": [
+            "How would you debug latency spikes in a Node.js API under load?",
+            "How do you design graceful shutdown and error handling for a Node.js service?",
+        ],
+    },
+    "django": {
+        "junior": [
+            "Walk me through what happens when a request hits a Django view.",
+            "What are Django migrations, and how do you create and apply them?",
+        ],
+        "mid": [
+            "What is the N+1 query problem, and how do select_related and prefetch_related help?",
+            "How do you handle database migrations safely in a production environment?",
+        ],
+        "senior": [
+            "How would you scale a Django application that is hitting database limits?",
+            "How do you structure background jobs and caching around a Django app?",
+        ],
+    },
+    "flask": {
+        "junior": [
+            "How do routes and view functions work in Flask?",
+            "How do you read query parameters and JSON bodies in a Flask request?",
+        ],
+        "mid": [
+            "How do you structure a larger Flask app with blueprints and an app factory?",
+            "How do you manage database sessions and transactions in Flask?",
+        ],
+        "senior": [
+            "How would you deploy and scale a Flask service in production?",
+            "How do you add authentication and rate limiting to a Flask API?",
+        ],
+    },
+    "fastapi": {
+        "junior": [
+            "How does FastAPI use type hints and Pydantic models for validation?",
+            "What is the difference between a path parameter and a query parameter in FastAPI?",
+        ],
+        "mid": [
+            "How does dependency injection work in FastAPI, and what have you used it for?",
+            "When should an endpoint be async def versus def in FastAPI?",
+        ],
+        "senior": [
+            "How would you find why a FastAPI service slows down under concurrent load?",
+            "How do you version and document a public FastAPI API?",
+        ],
+    },
+    "spring boot": {
+        "junior": [
+            "What does Spring Boot auto-configuration do for you?",
+            "How do you define a REST endpoint in Spring Boot?",
+        ],
+        "mid": [
+            "How does @Transactional work, and what are its common pitfalls?",
+            "How do you manage configuration across environments in Spring Boot?",
+        ],
+        "senior": [
+            "How would you reduce start-up time and memory use of a Spring Boot service?",
+            "How do you make Spring Boot microservices resilient to downstream failures?",
+        ],
+    },
+    "postgresql": {
+        "junior": [
+            "What is a primary key versus a unique constraint in PostgreSQL?",
+            "How do you inspect a table's structure and indexes in PostgreSQL?",
+        ],
+        "mid": [
+            "How do you use EXPLAIN ANALYZE to understand a slow query?",
+            "What is VACUUM, and why does PostgreSQL need it?",
+        ],
+        "senior": [
+            "How would you add a column or index to a very large, busy PostgreSQL table without downtime?",
+            "How do you plan replication, backups and failover for PostgreSQL?",
+        ],
+    },
+    "mongodb": {
+        "junior": [
+            "How does a MongoDB document model differ from relational tables?",
+            "How do you query and update nested fields in MongoDB?",
+        ],
+        "mid": [
+            "How do you decide between embedding and referencing documents?",
+            "How do indexes work in MongoDB, and how do you check a query uses one?",
+        ],
+        "senior": [
+            "How do you choose a shard key, and what goes wrong with a bad one?",
+            "How do you handle transactions and consistency requirements in MongoDB?",
+        ],
+    },
+    "redis": {
+        "junior": [
+            "What is Redis typically used for, and which data types does it offer?",
+            "How do key expiry and TTLs work in Redis?",
+        ],
+        "mid": [
+            "How would you implement a cache-aside pattern with Redis, and how do you handle invalidation?",
+            "How would you build a rate limiter with Redis?",
+        ],
+        "senior": [
+            "How do you handle Redis persistence, eviction policies and failover in production?",
+            "How do you prevent a cache stampede when a hot key expires?",
+        ],
+    },
+    "docker": {
+        "junior": [
+            "What is the difference between a Docker image and a container?",
+            "Walk me through the main instructions in a Dockerfile.",
+        ],
+        "mid": [
+            "How do you keep Docker images small and builds fast?",
+            "How do containers talk to each other, and how do you persist data with volumes?",
+        ],
+        "senior": [
+            "How do you harden container images for production security?",
+            "How do you debug a container that works locally but fails in production?",
+        ],
+    },
+    "kubernetes": {
+        "junior": [
+            "What are pods, deployments and services in Kubernetes?",
+            "How do you check why a pod is not starting?",
+        ],
+        "mid": [
+            "How do liveness and readiness probes differ, and what happens if they are misconfigured?",
+            "How do you manage configuration and secrets in Kubernetes?",
+            "How do resource requests and limits affect scheduling and throttling?",
+        ],
+        "senior": [
+            "How would you design autoscaling for a service with spiky traffic on Kubernetes?",
+            "How do you roll out changes safely across clusters, and how do you roll back?",
+        ],
+    },
+    "aws": {
+        "junior": [
+            "Which AWS services have you used, and what did you use each for?",
+            "What is the difference between S3 and EBS storage?",
+        ],
+        "mid": [
+            "How do IAM roles and policies work, and how do you apply least privilege?",
+            "How would you design a highly available web application on AWS?",
+        ],
+        "senior": [
+            "How do you keep AWS costs under control as a system grows?",
+            "How do you plan disaster recovery across regions on AWS?",
+        ],
+    },
+    "kafka": {
+        "junior": [
+            "What are topics, partitions and consumer groups in Kafka?",
+            "How does Kafka differ from a traditional message queue?",
+        ],
+        "mid": [
+            "How do you get at-least-once or exactly-once processing with Kafka?",
+            "How do you choose the number of partitions and a partition key?",
+        ],
+        "senior": [
+            "How do you handle consumer lag and rebalancing storms in production?",
+            "How do you evolve message schemas without breaking consumers?",
+        ],
+    },
+    "machine learning": {
+        "junior": [
+            "What is the difference between supervised and unsupervised learning?",
+            "What is overfitting, and how do you detect it?",
+        ],
+        "mid": [
+            "How do you choose an evaluation metric for an imbalanced classification problem?",
+            "How do you handle missing values and feature scaling in a pipeline?",
+        ],
+        "senior": [
+            "How do you monitor a model in production for data drift and degraded performance?",
+            "How do you decide whether a problem needs ML at all, and how do you run an experiment to prove value?",
+        ],
+    },
+    "git": {
+        "junior": [
+            "What is the difference between git merge and git rebase?",
+            "How do you undo a commit that has not been pushed yet?",
+        ],
+        "mid": [
+            "How do you resolve a merge conflict, and how do you avoid them?",
+            "What branching strategy has your team used, and why?",
+        ],
+        "senior": [
+            "How do you find which commit introduced a bug in a large history?",
+            "How would you set up branching and release flow for several teams shipping daily?",
+        ],
+    },
+    "rest": {
+        "junior": [
+            "What do the main HTTP methods mean in a REST API?",
+            "Which HTTP status codes do you use most, and for what?",
+        ],
+        "mid": [
+            "How do you design pagination and filtering for a REST endpoint?",
+            "How do you make a POST endpoint safe to retry?",
+        ],
+        "senior": [
+            "How do you version a public API without breaking existing clients?",
+            "How do you design rate limiting and error contracts for a public API?",
+        ],
+    },
+    "microservices": {
+        "junior": [
+            "What are the main benefits and costs of microservices compared with a monolith?",
+        ],
+        "mid": [
+            "How do services communicate, and when do you choose synchronous calls over events?",
+            "How do you handle a transaction that spans several services?",
+        ],
+        "senior": [
+            "How would you break up a monolith into services, and where would you start?",
+            "How do you trace and debug a request that crosses many services?",
+        ],
+    },
+    "system design": {
+        "junior": [
+            "What does it mean for a system to scale horizontally versus vertically?",
+        ],
+        "mid": [
+            "How would you design a URL shortener? Focus on storage and read traffic.",
+            "Where would you add caching in a read-heavy web application, and how would you invalidate it?",
+        ],
+        "senior": [
+            "Design a notification system that sends millions of messages a day across channels.",
+            "How do you reason about consistency versus availability when designing a distributed system?",
+        ],
+    },
+    "data structures": {
+        "junior": [
+            "When would you use a hash map instead of a list?",
+            "What is Big-O notation, and what is the complexity of searching a sorted array?",
+        ],
+        "mid": [
+            "How would you detect a cycle in a linked list?",
+            "How would you find the k most frequent elements in a large list?",
+        ],
+        "senior": [
+            "How would you design an LRU cache with O(1) operations?",
+            "How would you find the top-k items in a stream too large to fit in memory?",
+        ],
+    },
+    "linux": {
+        "junior": [
+            "How do you find which process is using a port or most of the CPU on Linux?",
+            "How do file permissions work in Linux?",
+        ],
+        "mid": [
+            "How do you investigate a server that is running out of disk or memory?",
+            "How do you read and search logs efficiently from the command line?",
+        ],
+        "senior": [
+            "How do you diagnose high load average when CPU usage looks low?",
+            "How do you tune a Linux host for a high-connection network service?",
+        ],
+    },
+}
@@ -0,0 +1,36 @@
+"""Recruiter-only access for the Streamlit UI.
+
+Candidate search and batch screening run in the same Streamlit server as
+the candidate-facing interview, so they ask for ``RECRUITER_PASSWORD``
+(from ``st.secrets`` or the environment) first. With no password
+configured the tools stay locked rather than open. Signing in lasts for
+the browser session.
+"""
+import hmac
+import os
+
+import streamlit as st
+from dotenv import load_dotenv
+
+
+def recruiter_password():
+    # load_if_toml_exists() avoids the on-page "No secrets files found" error for .env-only setups
+    if st.secrets.load_if_toml_exists() and "RECRUITER_PASSWORD" in st.secrets:
+        return st.secrets["RECRUITER_PASSWORD"]
+    load_dotenv()
+    return os.getenv("RECRUITER_PASSWORD")
+
+
+def recruiter_login(key="recruiter_password") -> bool:
+    """Asks for the recruiter password until it is given; True once this session has signed in."""
+    if st.session_state.get("recruiter"): return True
+    password = recruiter_password()
+    if not password:
+        st.info("🔒 Recruiter tools are locked: set RECRUITER_PASSWORD in secrets or the environment.")
+        return False
+    entered = st.text_input("Recruiter password", type="password", key=key)
+    if entered and hmac.compare_digest(entered.encode("utf-8"), str(password).encode("utf-8")):
+        st.session_state.recruiter = True
+        return True
+    if entered: st.error("Wrong password.")
+    return False
@@ -0,0 +1,183 @@
+"""Background report generation.
+
+A report is one slow ``SMART_MODEL`` call over the transcript followed by
+the chart + PDF render. ``ReportJobs`` runs both on a small thread pool so
+the Streamlit script returns at once and the candidate can keep chatting;
+the session only keeps the job id and polls it on each rerun.
+
+The evaluation is streamed through the incremental parser in
+``structured``, so each field is validated as it arrives (``job.partial``)
+and scores show up before the call completes. Jobs are keyed by a hash of
+the request: submitting the same transcript again (a double click, a second
+tab) returns the job that is already queued, running or done instead of
+starting another call.
+"""
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .candidates import SCORE_FIELDS
+from .metrics import REGISTRY, record_usage, span
+from .structured import Field, Schema, StreamingObject
+
+REPORT_PROMPT = """
+Generate JSON evaluation.
+Fields: name, position, tech_stack,
+technical_score (0-100), communication_score (0-100), problem_solving_score (0-100), experience_relevance (0-100),
+verdict (Hire/No Hire/Maybe), strengths (list), improvement_areas (list),
+graph_summary (1 brief sentence explaining what the scores mean for this candidate).
+"""
+REPORT_SCHEMA = Schema("report", [
+    Field("name"), Field("position"), Field("tech_stack"),
+    *(Field(score, "score") for score in SCORE_FIELDS),
+    Field("verdict", "enum", choices=("Hire", "No Hire", "Maybe")),
+    Field("strengths", "list"), Field("improvement_areas", "list"),
+    Field("graph_summary"),
+])
+
+
+def request_key(messages, model) -> str:
+    payload = json.dumps([model, messages], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stream_report(client, messages, model, deadline=None, on_fields=None) -> dict:
+    """Streams the JSON evaluation, calling ``on_fields(new_fields)`` as each
+    field completes and validates.
+
+    Fields still missing or invalid at the end are requested once more on
+    their own. Falls back to one blocking call if the provider rejects
+    streaming in JSON mode (HTTP 400).
+    """
+    request = dict(model=model, messages=messages, response_format={"type": "json_object"})
+    with span("report_llm"):
+        started = time.perf_counter()
+        try:
+            stream = client.stream(deadline=deadline, **request)
+        except Exception as e:
+            if getattr(e, "status_code", None) != 400: raise
+            stream = None
+        if stream is None:
+            completion = client.complete(deadline=deadline, **request)
+            record_usage("report_llm", completion)
+            result = REPORT_SCHEMA.parse(completion.choices[0].message.content)
+        else:
+            parsed, chunk = StreamingObject(REPORT_SCHEMA), None
+            for chunk in stream:
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    if not parsed.parser.buffer: REGISTRY.observe("report_ttft", time.perf_counter() - started)
+                    new = parsed.feed(content)
+                    if new and on_fields: on_fields(new)
+            record_usage("report_llm", chunk)  # usage rides on the final chunk
+            result = parsed.result()
+    if not result.complete:
+        try:
+            with span("report_llm_fill"):
+                completion = client.complete(deadline=deadline, **REPORT_SCHEMA.follow_up(request, result))
+            record_usage("report_llm_fill", completion)
+            result = REPORT_SCHEMA.merge(result, completion.choices[0].message.content)
+        except Exception:
+            if not result.data: raise  # otherwise a partial report beats none
+    if not result.data: raise ValueError("the evaluation came back empty")
+    return result.data
+
+
+@dataclass
+class ReportJob:
+    id: str
+    key: str
+    status: str = "queued"  # queued | running | done | error
+    stage: str = "Queued"
+    partial: dict = field(default_factory=dict)  # fields parsed so far
+    report: dict = None
+    artifacts: object = None  # reports.ReportArtifacts, pre-rendered
+    error: str = None
+    submitted: float = field(default_factory=time.monotonic)
+    finished: float = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.submitted
+
+
+class ReportJobs:
+    """Process-wide report job queue shared by every session."""
+
+    def __init__(self, max_workers=2, keep=256):
+        self.keep = keep
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+        self._jobs = OrderedDict()  # id -> ReportJob, oldest first
+        self._by_key = {}  # request key -> job id
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def submit(self, client, messages, model, deadline=None, artifact_cache=None, prepare=None) -> ReportJob:
+        """Starts a job, or returns the existing one for an identical request (unless it failed).
+
+        ``prepare(messages)``, if given, builds the final prompt on the worker
+        (it may summarize, which is an LLM call); jobs are keyed by the
+        messages before it.
+        """
+        key = request_key(messages, model)
+        with self._lock:
+            existing = self._jobs.get(self._by_key.get(key))
+            if existing is not None and existing.status != "error": return existing
+            job = ReportJob(id=uuid.uuid4().hex, key=key)
+            self._jobs[job.id] = job
+            self._by_key[key] = job.id
+            self._prune()
+        self._pool.submit(self._run, job, client, messages, model, deadline, artifact_cache, prepare)
+        return job
+
+    def _prune(self):
+        # Forget the oldest finished jobs; running ones are always kept
+        for job_id in [j.id for j in self._jobs.values() if not j.active][:max(len(self._jobs) - self.keep, 0)]:
+            job = self._jobs.pop(job_id)
+            if self._by_key.get(job.key) == job_id: del self._by_key[job.key]
+
+    def _run(self, job, client, messages, model, deadline, artifact_cache, prepare=None):
+        job.status = "running"
+
+        def on_fields(fields):
+            job.partial = {**job.partial, **fields}
+
+        try:
+            with span("report_job"):
+                if prepare is not None:
+                    job.stage = "Summarizing earlier turns"
+                    messages = prepare(messages)
+                job.stage = "Evaluating transcript"
+                report = stream_report(client, messages, model, deadline, on_fields=on_fields)
+                job.partial = report
+                if artifact_cache is not None:
+                    job.stage = "Rendering charts and PDF"
+                    try:
+                        job.artifacts = artifact_cache.get(report)
+                    except Exception:
+                        pass  # the dashboard renders on demand and reports the error there
+                job.report = report
+                job.status, job.stage = "done", "Done"
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status, job.stage = "error", "Failed"
+        finally:
+            job.finished = time.monotonic()
+
+    def close(self):
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,65 @@
+"""Cache of rendered report artifacts (PDF and JSON downloads)."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .metrics import span
+
+
+def report_fingerprint(report) -> str:
+    """Stable content hash of a report dict (key order does not matter)."""
+    payload = json.dumps(report, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ReportArtifacts:
+    pdf: bytes
+    json: bytes
+
+
+class ReportArtifactCache:
+    """Bounded LRU of rendered PDF/JSON downloads, keyed by report content.
+
+    Streamlit reruns the whole script on every interaction, so without this the
+    chart and PDF would be rebuilt each time the dashboard is on screen.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, report) -> ReportArtifacts:
+        key = report_fingerprint(report)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        from .pdf_report import generate_pdf_report  # heavy: numpy, matplotlib, fpdf
+
+        # Render outside the lock; a rare duplicate render beats blocking other sessions.
+        with span("generate_pdf_report"):
+            pdf = generate_pdf_report(report)
+        artifacts = ReportArtifacts(pdf=pdf, json=json.dumps(report, indent=2).encode("utf-8"))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = artifacts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return artifacts
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,139 @@
+"""Exact + fuzzy cache of LLM replies to deterministic prompts.
+
+Some calls depend only on a short user text within a fixed context, and
+candidates phrase those texts almost identically: "why do you need my phone
+number?" during intake gets the same explanation every time. Replies are
+stored per ``namespace`` (model, language, field...) under the normalised
+text. A lookup tries the exact text first, then the most similar stored text
+in the namespace by character-trigram Jaccard similarity, accepted at or
+above ``threshold``.
+
+Namespaces are small (tens to hundreds of entries), so the fuzzy pass is a
+linear scan over in-memory trigram sets, refreshed from SQLite periodically
+so replicas share what they learn.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from .resume_cache import DEFAULT_DIR
+
+DEFAULT_THRESHOLD = 0.75
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+MAX_PER_NAMESPACE = 500
+REFRESH_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    namespace TEXT NOT NULL,
+    text TEXT NOT NULL,
+    completion TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, text)
+);
+"""
+
+
+def normalize_text(text) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", (text or "").lower())).strip()
+
+
+def trigrams(normalized) -> frozenset:
+    padded = f" {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def jaccard(a, b) -> float:
+    if not a or not b: return 0.0
+    return len(a & b) / len(a | b)
+
+
+class ResponseCache:
+    def __init__(self, path=None, threshold=DEFAULT_THRESHOLD, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_per_namespace=MAX_PER_NAMESPACE):
+        if path is None:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_DIR, "responses.sqlite3")
+        self.path = path
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_per_namespace = max_per_namespace
+        self.hits = {"exact": 0, "fuzzy": 0, "miss": 0}
+        self._namespaces = {}  # namespace -> (loaded_at, {text: (trigrams, completion)})
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _entries(self, namespace):
+        now = time.time()
+        with self._lock:
+            cached = self._namespaces.get(namespace)
+            if cached and now - cached[0] < REFRESH_SECONDS: return cached[1]
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT text, completion FROM responses WHERE namespace = ? AND created_at >= ?",
+                (namespace, now - self.ttl_seconds if self.ttl_seconds else 0),
+            ).fetchall()
+        entries = {text: (trigrams(text), completion) for text, completion in rows}
+        with self._lock:
+            self._namespaces[namespace] = (now, entries)
+        return entries
+
+    def lookup(self, namespace, text, fuzzy=True):
+        """``(completion, similarity)`` for the best stored match, or ``(None, 0.0)``."""
+        key = normalize_text(text)
+        if not key: return None, 0.0
+        entries = self._entries(namespace)
+        match, similarity = (key, 1.0) if key in entries else (None, 0.0)
+        if match is None and fuzzy:
+            grams = trigrams(key)
+            for stored, (stored_grams, _) in entries.items():
+                score = jaccard(grams, stored_grams)
+                if score > similarity: match, similarity = stored, score
+            if similarity < self.threshold: match = None
+        with self._lock:
+            self.hits["miss" if match is None else "exact" if similarity == 1.0 else "fuzzy"] += 1
+        if match is None: return None, 0.0
+        with self._connect() as conn:
+            conn.execute("UPDATE responses SET hits = hits + 1 WHERE namespace = ? AND text = ?", (namespace, match))
+        return entries[match][1], similarity
+
+    def get(self, namespace, text, fuzzy=True):
+        return self.lookup(namespace, text, fuzzy)[0]
+
+    def put(self, namespace, text, completion: str):
+        key = normalize_text(text)
+        if not key: return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (namespace, text, completion, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, completion, now),
+            )
+            # Keep each namespace bounded: drop the least-hit, oldest entries
+            conn.execute(
+                """DELETE FROM responses WHERE namespace = ? AND text NOT IN (
+                       SELECT text FROM responses WHERE namespace = ? ORDER BY hits DESC, created_at DESC LIMIT ?)""",
+                (namespace, namespace, self.max_per_namespace),
+            )
+        with self._lock:
+            cached = self._namespaces.get(namespace)
+            if cached: cached[1][key] = (trigrams(key), completion)
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+        with self._lock:
+            self._namespaces.clear()
+
+    def stats(self):
+        with self._connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"entries": count, **self.hits}
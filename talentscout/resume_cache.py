@@ -0,0 +1,112 @@
+"""On-disk, content-addressed cache for resume extraction and parsing.
+
+Entries are keyed by the SHA-256 of the uploaded file bytes, so re-uploading
+the same resume (or starting a new interview with it) skips both extraction
+and the LLM parse. Parsed fields are additionally keyed by model name and
+prompt version, so changing either naturally misses the old entries.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+DEFAULT_DIR = os.getenv("TALENTSCOUT_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache"))
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResumeCache:
+    """SQLite store with TTL expiry and LRU eviction by entry count and bytes."""
+
+    def __init__(self, path=None, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        if path is None:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+            path = os.path.join(DEFAULT_DIR, "resumes.sqlite3")
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # A connection per call keeps this safe across Streamlit's script threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    # --- raw key/value ---
+    def get(self, key):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None: return None
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def put(self, key, value: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        if self.ttl_seconds:
+            conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,))
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes: return
+        # Walk least-recently-used first until both limits hold
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if count <= self.max_entries and total <= self.max_bytes: break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self):
+        with self._connect() as conn:
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": count, "bytes": total}
+
+    # --- resume helpers ---
+    def get_text(self, digest, variant=""):
+        return self.get(f"text:{digest}:{variant}")
+
+    def put_text(self, digest, text, variant=""):
+        self.put(f"text:{digest}:{variant}", text)
+
+    def get_fields(self, digest, model, prompt_version):
+        value = self.get(f"parse:{digest}:{model}:{prompt_version}")
+        return json.loads(value) if value is not None else None
+
+    def put_fields(self, digest, model, prompt_version, fields):
+        self.put(f"parse:{digest}:{model}:{prompt_version}", json.dumps(fields))
@@ -0,0 +1,109 @@
+"""Resume parsing prompt and response handling, shared by the app and batch mode.
+
+Resumes up to ``RESUME_PROMPT_CHARS`` are parsed in one call. Longer ones
+are split by ``resume_sections`` into chunks that each ask only for the
+fields that section can answer; the chunks run concurrently and their
+answers are merged locally, so a long CV costs about the latency of one call.
+"""
+from functools import lru_cache
+
+from .resume_sections import ALL_FIELDS, Chunk, merge_fields, plan_chunks
+from .structured import Field, Schema, complete_structured
+
+RESUME_PROMPT_CHARS = 4000  # resume text per parse request; longer resumes are parsed in chunks
+RESUME_TEXT_CHARS = 24000  # resume text extracted at all; extraction stops here
+RESUME_MAX_CHUNKS = 6
+RESUME_PROMPT_VERSION = "2"  # bump when the parsing prompt changes to invalidate cached parses
+RESUME_FIELDS = ["Full Name", "Email Address", "Phone Number", "Years of Experience", "Current Location", "Tech Stack"]
+# Every key must be present; null means "not in the resume"
+RESUME_SCHEMA = Schema("resume", [Field(name, nullable=True) for name in RESUME_FIELDS])
+
+
+@lru_cache(maxsize=None)
+def resume_schema(fields=tuple(RESUME_FIELDS)) -> Schema:
+    """``RESUME_SCHEMA`` restricted to ``fields`` (for a chunk that can only answer some of them)."""
+    if set(fields) == set(RESUME_FIELDS): return RESUME_SCHEMA
+    return Schema("resume_chunk", [RESUME_SCHEMA.fields[name] for name in RESUME_FIELDS if name in fields])
+
+
+def build_resume_prompt(text, max_chars=RESUME_PROMPT_CHARS, fields=RESUME_FIELDS) -> str:
+    # "Desired Position" is left out on purpose so the bot asks for it later.
+    keys = ", ".join(f'"{name}"' for name in RESUME_FIELDS if name in fields)
+    part = "" if set(fields) == set(RESUME_FIELDS) else "\n    - The text is one section of a longer resume."
+    stack = "\n    - If \"Tech Stack\" is scattered, combine it into a comma-separated string." if "Tech Stack" in fields else ""
+    return f"""
+    Extract the following fields from the resume text below.
+    Return ONLY valid JSON.
+    Keys: {keys}.
+    
+    IMPORTANT: 
+    - DO NOT extract "Desired Position". We will ask the user for this.{stack}
+    - If a field is missing, use null.{part}
+    
+    Resume Text:
+    {text[:max_chars]}
+    """
+
+
+def resume_request(text, model, max_chars=RESUME_PROMPT_CHARS, fields=RESUME_FIELDS) -> dict:
+    """Keyword arguments for ``chat.completions.create`` (sync or async client)."""
+    return {
+        "model": model,
+        "messages": [{"role": "user", "content": build_resume_prompt(text, max_chars, fields)}],
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def plan_resume_requests(text, model) -> list:
+    """``(chunk, schema, request)`` for each parse call ``text`` needs: one for a short resume."""
+    if len(text) <= RESUME_PROMPT_CHARS:
+        chunks = [Chunk("header", ALL_FIELDS, text)]
+    else:
+        chunks = plan_chunks(text, RESUME_PROMPT_CHARS, RESUME_MAX_CHUNKS)
+    return [(chunk, resume_schema(tuple(chunk.fields)), resume_request(chunk.text, model, fields=chunk.fields))
+            for chunk in chunks]
+
+
+def merge_resume_results(plan, results, text="") -> dict:
+    """Fields from the per-request results (``None`` where a request failed), in ``RESUME_FIELDS`` order."""
+    if len(plan) == 1: return results[0] or {}
+    merged = merge_fields([chunk for chunk, _, _ in plan], results, text)
+    if not any(merged.values()): return {}
+    return {name: merged.get(name) for name in RESUME_FIELDS}
+
+
+def parse_resume(client, text, model, deadline=None, executor=None) -> dict:
+    """Parses ``text`` with a ``ResilientClient``, running chunk requests on ``executor``.
+
+    A failed chunk only loses the fields it would have answered; raises if
+    every request failed or nothing usable came back.
+    """
+    plan = plan_resume_requests(text, model)
+    stage = "parse_resume" if len(plan) == 1 else "parse_resume_chunk"
+
+    def run(schema, request):
+        return complete_structured(client, schema, request, deadline=deadline, stage=stage).data
+
+    if executor is None or len(plan) == 1:
+        futures = None
+    else:
+        futures = [executor.submit(run, schema, request) for _, schema, request in plan]
+    results, errors = [], []
+    for i, (_, schema, request) in enumerate(plan):
+        try:
+            results.append(futures[i].result() if futures else run(schema, request))
+        except Exception as e:
+            results.append(None)
+            errors.append(e)
+    if len(errors) == len(plan): raise errors[0]
+    fields = merge_resume_results(plan, results, text)
+    if not fields: raise ValueError("no resume fields in the response")
+    return fields
+
+
+def parse_resume_response(content) -> dict:
+    """Parsed fields from a (possibly malformed) reply; raises ValueError if nothing usable came back."""
+    result = RESUME_SCHEMA.parse(content)
+    if not result.data: raise ValueError("no resume fields in the response")
+    return result.data
@@ -0,0 +1,209 @@
+"""Section-aware chunking and a local merge for long resumes.
+
+A multi-page CV doesn't fit one small parse prompt, and cutting it at a
+fixed length drops the skills and experience that senior candidates list
+further down. Instead the text is split at its section headers
+("Experience", "Technical Skills", "Education"...) and each chunk is sent
+only with the fields it can answer:
+
+- the top of the resume (plus any summary/contact section): every field,
+- skills, projects and certifications: the tech stack,
+- experience: years of experience and the tech stack,
+- education, references and the like: nothing (not sent at all).
+
+The chunks are parsed in parallel and ``merge_fields`` combines the
+answers deterministically: the first non-null value for contact fields,
+the union of skills (deduplicated through ``taxonomy``), and for years of
+experience the larger of what the model read and what the experience
+section's date ranges add up to. Parse latency stays about one call however
+long the resume is, since the chunks run concurrently.
+"""
+import re
+import time
+from dataclasses import dataclass
+
+from .candidates import parse_years
+from .intake import EMAIL_RE, PHONE_RE
+from .taxonomy import SKILL_SPLIT_RE, canonical_skill
+
+CONTACT_FIELDS = ("Full Name", "Email Address", "Phone Number", "Current Location")
+ALL_FIELDS = (*CONTACT_FIELDS, "Years of Experience", "Tech Stack")
+MAX_STACK_ITEMS = 30
+
+SECTION_HEADERS = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "about me", "objective",
+                "career objective", "overview", "career summary"],
+    "contact": ["contact", "contact information", "contact details", "personal details", "personal information"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "career history", "relevant experience", "internships", "internship"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies", "competencies",
+               "technologies", "tech stack", "tools", "tools and technologies", "technical expertise", "expertise"],
+    "projects": ["projects", "personal projects", "key projects", "academic projects", "open source"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses", "training"],
+    "education": ["education", "academic background", "qualifications", "academic qualifications"],
+    "other": ["achievements", "awards", "publications", "interests", "hobbies", "languages", "references",
+              "volunteering", "declaration", "activities", "extracurricular activities"],
+}
+HEADER_KINDS = {alias: kind for kind, aliases in SECTION_HEADERS.items() for alias in aliases}
+HEADER_RE = re.compile(
+    r"^\s*(?:[#*•\-=]+\s*)?(" + "|".join(sorted(map(re.escape, HEADER_KINDS), key=len, reverse=True)) + r")\s*[:\-–]?\s*$",
+    re.IGNORECASE,
+)
+# Which fields a section can answer; sections not listed are not sent
+SECTION_FIELDS = {
+    "header": ALL_FIELDS,
+    "summary": ALL_FIELDS,
+    "contact": CONTACT_FIELDS,
+    "skills": ("Tech Stack",),
+    "projects": ("Tech Stack",),
+    "certifications": ("Tech Stack",),
+    "experience": ("Years of Experience", "Tech Stack"),
+}
+
+MONTHS = {m: i for i, m in enumerate(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+_DATE = (r"(?:(?P<{p}m>" + "|".join(MONTHS) + r")[a-z]*\.?[ \t]+|(?P<{p}n>\d{{1,2}})[/\-.])?"
+         r"(?P<{p}y>(?:19|20)\d{{2}})\b")
+DATE_RANGE_RE = re.compile(
+    r"\b" + _DATE.format(p="s") + r"[ \t]*(?:-|–|—|to|till|until)[ \t]*(?:(?P<now>present|current|now|date|today|ongoing)\b|"
+    + _DATE.format(p="e") + ")",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class Section:
+    kind: str  # header (text before the first heading) or a SECTION_HEADERS key
+    text: str
+
+
+@dataclass
+class Chunk:
+    kind: str
+    fields: tuple
+    text: str
+
+
+def split_sections(text) -> list:
+    """The resume as consecutive sections; the first one is whatever precedes the first heading."""
+    sections = [Section("header", "")]
+    lines = []
+    for line in (text or "").splitlines():
+        m = HEADER_RE.match(line) if len(line) <= 60 else None
+        if m:
+            sections[-1].text = "\n".join(lines).strip()
+            sections.append(Section(HEADER_KINDS[m.group(1).lower()], ""))
+            lines = []
+        else:
+            lines.append(line)
+    sections[-1].text = "\n".join(lines).strip()
+    return [s for s in sections if s.text or s.kind == "header"]
+
+
+def windows(text, max_chars) -> list:
+    """``text`` cut into pieces of at most ``max_chars``, at line breaks where possible."""
+    pieces, current = [], ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current: pieces.append(current)
+            pieces.append(line[:max_chars])
+            current, line = "", line[max_chars:]
+        if len(current) + len(line) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current.strip(): pieces.append(current)
+    return [p.strip() for p in pieces if p.strip()]
+
+
+def plan_chunks(text, max_chars, max_chunks=6) -> list:
+    """Chunks to parse, most important first: the top of the resume, skills, then experience."""
+    sections = split_sections(text)
+    if len(sections) == 1:
+        # No recognisable headings: the top gets every field, the rest is read for stack and years
+        parts = windows(text, max_chars)
+        return [Chunk("header" if i == 0 else "body", ALL_FIELDS if i == 0 else SECTION_FIELDS["experience"], part)
+                for i, part in enumerate(parts)][:max_chunks]
+
+    grouped = {}
+    for section in sections:
+        if section.kind in SECTION_FIELDS:
+            grouped.setdefault(SECTION_FIELDS[section.kind], []).append(section)
+    if not sections[0].text:
+        # The resume opens with a heading; its first lines still carry the name
+        grouped.setdefault(ALL_FIELDS, []).insert(0, Section("header", text[:600]))
+
+    chunks = []
+    for fields in (ALL_FIELDS, CONTACT_FIELDS, ("Tech Stack",), SECTION_FIELDS["experience"]):
+        group = grouped.get(fields)
+        if not group: continue
+        joined = "\n\n".join(s.text for s in group)
+        pieces = windows(joined, max_chars)
+        # Only the first window of the top matters for contact fields
+        if fields == ALL_FIELDS: pieces = pieces[:1]
+        chunks += [Chunk(group[0].kind, fields, piece) for piece in pieces]
+    return chunks[:max_chunks]
+
+
+def experience_years(text, now=None):
+    """Years covered by the date ranges in ``text`` (overlaps counted once), None if there are none."""
+    now = now or time.localtime()
+    today = now.tm_year + (now.tm_mon - 1) / 12
+    spans = []
+    for m in DATE_RANGE_RE.finditer(text or ""):
+        start = _point(m, "s")
+        end = today if m.group("now") else _point(m, "e", end=True)
+        if start is None or end is None or not (1960 <= start <= end <= today + 1): continue
+        spans.append((start, min(end, today)))
+    if not spans: return None
+    spans.sort()
+    total, (cur_start, cur_end) = 0.0, spans[0]
+    for start, end in spans[1:]:
+        if start > cur_end:
+            total += cur_end - cur_start
+            cur_start, cur_end = start, end
+        else:
+            cur_end = max(cur_end, end)
+    return round(total + cur_end - cur_start, 1)
+
+
+def _point(m, prefix, end=False):
+    year = int(m.group(f"{prefix}y"))
+    month = m.group(f"{prefix}m")
+    month = MONTHS.get(month[:3].lower()) if month else (int(m.group(f"{prefix}n")) if m.group(f"{prefix}n") else None)
+    if month is None or not 1 <= month <= 12: return float(year)  # "2016 - 2019" reads as three years
+    return year + (month - (0 if end else 1)) / 12
+
+
+def merge_fields(chunks, results, text="") -> dict:
+    """Combines per-chunk field dicts (``None`` for a failed chunk) in chunk order."""
+    merged = {}
+    for field in CONTACT_FIELDS:
+        merged[field] = next((r[field] for c, r in zip(chunks, results) if r and field in c.fields and r.get(field)), None)
+    # Cheap local fallbacks for contact details the chunks missed
+    if not merged["Email Address"]:
+        m = EMAIL_RE.search(text)
+        merged["Email Address"] = m.group(0) if m else None
+    if not merged["Phone Number"]:
+        # Only near the contact details: elsewhere date ranges look like numbers too
+        m = PHONE_RE.search("\n".join(c.text for c in chunks if "Phone Number" in c.fields))
+        merged["Phone Number"] = m.group(0).strip() if m and 7 <= len(re.sub(r"\D", "", m.group(0))) <= 15 else None
+
+    stack, seen = [], set()
+    for c, r in zip(chunks, results):
+        for item in SKILL_SPLIT_RE.split((r or {}).get("Tech Stack") or ""):
+            item = item.strip(" .")
+            key = canonical_skill(item)
+            if item and key not in seen and key not in ("null", "none"):
+                seen.add(key)
+                stack.append(item)
+    merged["Tech Stack"] = ", ".join(stack[:MAX_STACK_ITEMS]) or None
+
+    stated = [(parse_years(r.get("Years of Experience")), r.get("Years of Experience"))
+              for c, r in zip(chunks, results) if r and "Years of Experience" in c.fields]
+    stated = [(years, raw) for years, raw in stated if years is not None]
+    dated = experience_years("\n".join(c.text for c in chunks if c.kind == "experience"))
+    best = max(stated, default=(None, None), key=lambda pair: pair[0])
+    if dated is not None and (best[0] is None or dated > best[0]):
+        best = (dated, f"{dated:g}")
+    merged["Years of Experience"] = best[1]
+    return merged
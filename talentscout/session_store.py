@@ -0,0 +1,275 @@
+"""Persistent interview sessions, so a restart or a hop to another replica
+doesn't lose the candidate's progress.
+
+Two backends share one small interface:
+
+- ``SQLiteSessionStore`` (default) for a single host or a shared volume,
+- ``RedisSessionStore`` over anything Redis-compatible (``rpush``/``lrange``/
+  ``hset``/``hgetall``/``expire``/``delete``). ``InMemoryRedis`` is a local
+  stand-in with that interface, for development and tests.
+
+Transcript messages are appended one row/list entry per turn and state
+fields are upserted one key at a time, so a turn never rewrites the whole
+session. ``SessionSync`` tracks what has already been written for a live
+session (Streamlit or API) and flushes only the difference.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+PERSISTED_FIELDS = ("phase", "collected_info", "resume_uploaded", "last_report", "intake_stats", "language", "tenant")
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+class SQLiteSessionStore:
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS session_messages (
+        session_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (session_id, seq)
+    );
+    CREATE TABLE IF NOT EXISTS session_fields (
+        session_id TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (session_id, key)
+    );
+    CREATE INDEX IF NOT EXISTS session_fields_updated ON session_fields (updated_at);
+    """
+
+    def __init__(self, path, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+        self.prune()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def append_messages(self, session_id, start_seq, messages):
+        now = time.time()
+        rows = [(session_id, start_seq + i, m["role"], m["content"], now) for i, m in enumerate(messages)]
+        with self._connect() as conn:
+            # Another replica may have written the same turn first; keep the first copy
+            conn.executemany(
+                "INSERT OR IGNORE INTO session_messages (session_id, seq, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("UPDATE session_fields SET updated_at = ? WHERE session_id = ?", (now, session_id))
+
+    def set_fields(self, session_id, fields):
+        now = time.time()
+        rows = [(session_id, key, _dumps(value), now) for key, value in fields.items()]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO session_fields (session_id, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def load(self, session_id):
+        with self._connect() as conn:
+            fields = conn.execute("SELECT key, value FROM session_fields WHERE session_id = ?", (session_id,)).fetchall()
+            messages = conn.execute(
+                "SELECT role, content FROM session_messages WHERE session_id = ? ORDER BY seq", (session_id,)
+            ).fetchall()
+        if not fields and not messages: return None
+        return {
+            "fields": {key: json.loads(value) for key, value in fields},
+            "messages": [{"role": role, "content": content} for role, content in messages],
+        }
+
+    def delete(self, session_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM session_messages WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM session_fields WHERE session_id = ?", (session_id,))
+
+    def prune(self):
+        """Drops sessions with no activity for longer than the TTL."""
+        if not self.ttl_seconds: return
+        cutoff = time.time() - self.ttl_seconds
+        with self._connect() as conn:
+            stale = "SELECT session_id FROM session_fields GROUP BY session_id HAVING MAX(updated_at) < ?"
+            conn.execute(f"DELETE FROM session_messages WHERE session_id IN ({stale})", (cutoff,))
+            conn.execute(f"DELETE FROM session_fields WHERE session_id IN ({stale})", (cutoff,))
+
+
+class RedisSessionStore:
+    """Same interface over a Redis-compatible client (``redis.Redis`` or ``InMemoryRedis``)."""
+
+    def __init__(self, client, prefix="talentscout:session", ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _keys(self, session_id):
+        return f"{self.prefix}:{session_id}:messages", f"{self.prefix}:{session_id}:fields"
+
+    def _touch(self, *keys):
+        if self.ttl_seconds:
+            for key in keys:
+                self.client.expire(key, int(self.ttl_seconds))
+
+    def append_messages(self, session_id, start_seq, messages):
+        messages_key, fields_key = self._keys(session_id)
+        if not messages: return
+        # Lists have no seq column; skip entries another replica already pushed
+        already = self.client.llen(messages_key)
+        fresh = messages[max(already - start_seq, 0):]
+        if fresh:
+            self.client.rpush(messages_key, *[_dumps({"role": m["role"], "content": m["content"]}) for m in fresh])
+        self._touch(messages_key, fields_key)
+
+    def set_fields(self, session_id, fields):
+        messages_key, fields_key = self._keys(session_id)
+        self.client.hset(fields_key, mapping={key: _dumps(value) for key, value in fields.items()})
+        self._touch(messages_key, fields_key)
+
+    def load(self, session_id):
+        messages_key, fields_key = self._keys(session_id)
+        fields = self.client.hgetall(fields_key)
+        messages = self.client.lrange(messages_key, 0, -1)
+        if not fields and not messages: return None
+        decode = lambda v: v.decode("utf-8") if isinstance(v, bytes) else v
+        return {
+            "fields": {decode(k): json.loads(decode(v)) for k, v in fields.items()},
+            "messages": [json.loads(decode(m)) for m in messages],
+        }
+
+    def delete(self, session_id):
+        self.client.delete(*self._keys(session_id))
+
+
+class InMemoryRedis:
+    """Minimal thread-safe stand-in for the Redis commands the store uses."""
+
+    def __init__(self):
+        self._data = {}
+        self._expiry = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key, default):
+        expires = self._expiry.get(key)
+        if expires is not None and expires < time.monotonic():
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+        return self._data.setdefault(key, default)
+
+    def rpush(self, key, *values):
+        with self._lock:
+            items = self._get(key, [])
+            items.extend(values)
+            return len(items)
+
+    def llen(self, key):
+        with self._lock:
+            return len(self._get(key, []))
+
+    def lrange(self, key, start, end):
+        with self._lock:
+            items = self._get(key, [])
+            return list(items[start:] if end == -1 else items[start:end + 1])
+
+    def hset(self, key, mapping):
+        with self._lock:
+            self._get(key, {}).update(mapping)
+            return len(mapping)
+
+    def hgetall(self, key):
+        with self._lock:
+            return dict(self._get(key, {}))
+
+    def expire(self, key, seconds):
+        with self._lock:
+            self._expiry[key] = time.monotonic() + seconds
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+                self._expiry.pop(key, None)
+            return len(keys)
+
+
+def open_session_store(url=None):
+    """Builds a store from a URL: ``sqlite:///path``, ``redis://...`` or ``memory://``."""
+    url = url or os.getenv("TALENTSCOUT_SESSION_STORE", "")
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("Install the 'redis' package to use a Redis session store") from e
+        return RedisSessionStore(redis.Redis.from_url(url))
+    if url.startswith("memory://"):
+        return RedisSessionStore(InMemoryRedis())
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+    else:
+        from .resume_cache import DEFAULT_DIR
+        os.makedirs(DEFAULT_DIR, exist_ok=True)
+        path = os.path.join(DEFAULT_DIR, "sessions.sqlite3")
+    return SQLiteSessionStore(path)
+
+
+class SessionSync:
+    """Mirrors one session's state into a store, writing only what changed.
+
+    ``messages[0]`` is the system prompt, which the app rebuilds from the state, so
+    only the turns after it are persisted.
+    """
+
+    def __init__(self, store, session_id=None):
+        self.store = store
+        self.session_id = session_id or new_session_id()
+        self._persisted_messages = 0
+        self._snapshots = {}
+
+    def restore(self, state) -> bool:
+        """Loads the stored session into ``state``; False if there is none."""
+        saved = self.store.load(self.session_id)
+        if saved is None: return False
+        fields = saved["fields"]
+        for key in PERSISTED_FIELDS:
+            if key in fields: state[key] = fields[key]
+        state["messages"] = [{"role": "system", "content": ""}] + saved["messages"]
+        context = fields.get("context")
+        if context and "context" in state:
+            state["context"].summary = context.get("summary", "")
+            state["context"].folded = context.get("folded", 0)
+        self._persisted_messages = len(saved["messages"])
+        self._snapshots = {key: _dumps(value) for key, value in fields.items()}
+        return True
+
+    def flush(self, state):
+        turns = [m for m in state.get("messages", [])[1:] if m["role"] != "system"]
+        if len(turns) > self._persisted_messages:
+            self.store.append_messages(self.session_id, self._persisted_messages, turns[self._persisted_messages:])
+            self._persisted_messages = len(turns)
+
+        current = {key: state[key] for key in PERSISTED_FIELDS if key in state}
+        if "context" in state:
+            current["context"] = {"summary": state["context"].summary, "folded": state["context"].folded}
+        changed = {}
+        for key, value in current.items():
+            snapshot = _dumps(value)
+            if self._snapshots.get(key) != snapshot:
+                changed[key] = value
+                self._snapshots[key] = snapshot
+        if changed: self.store.set_fields(self.session_id, changed)
@@ -0,0 +1,77 @@
+"""Cold-start profiling for the app, enabled with ``TALENTSCOUT_STARTUP_PROFILE=1``.
+
+``begin()`` wraps ``__import__`` so every module that is loaded for the
+first time is timed (top-level imports only, children are included in their
+parent's time), and ``mark()`` records named startup phases. ``finish()``
+prints the breakdown to stderr once per process, at the end of the first
+script run. Imports that happen later (lazy ones, e.g. the PDF stack on the
+first report) are reported by ``report()`` whenever it is called again.
+"""
+import builtins
+import os
+import sys
+import threading
+import time
+
+ENABLED = os.getenv("TALENTSCOUT_STARTUP_PROFILE", "").lower() not in ("", "0", "false", "no")
+
+_original_import = builtins.__import__
+_local = threading.local()
+_imports = []  # (module, seconds, seconds since start)
+_phases = []  # (label, seconds since start)
+_started = None
+_reported = False
+
+
+def _resolve(name, globals, level):
+    if not level: return name
+    package = (globals or {}).get("__package__") or ""
+    base = package.rsplit(".", level - 1)[0] if level > 1 else package
+    return f"{base}.{name}" if name else base
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    depth = getattr(_local, "depth", 0)
+    module = _resolve(name, globals, level)
+    if depth or module in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    _local.depth = depth + 1
+    t0 = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _local.depth = depth
+        t1 = time.perf_counter()
+        _imports.append((module, t1 - t0, t0 - _started))
+
+
+def begin():
+    """Starts timing imports. Safe to call on every rerun; only the first counts."""
+    global _started
+    if not ENABLED or _started is not None: return
+    _started = time.perf_counter()
+    builtins.__import__ = _timed_import
+
+
+def mark(label):
+    if ENABLED and not _reported and _started is not None:
+        _phases.append((label, time.perf_counter() - _started))
+
+
+def report() -> str:
+    lines = ["TalentScout startup profile", "  phases (ms since start):"]
+    lines += [f"    {label:<24}{at * 1000:>9.1f}" for label, at in _phases]
+    lines.append("  first-time imports (ms, slowest first):")
+    for module, seconds, at in sorted(_imports, key=lambda i: -i[1]):
+        if seconds >= 0.001:
+            lines.append(f"    {module:<40}{seconds * 1000:>9.1f}   at +{at * 1000:.0f}")
+    return "\n".join(lines)
+
+
+def finish():
+    """Prints the profile once, at the end of the first script run."""
+    global _reported
+    if not ENABLED or _reported or _started is None: return
+    mark("first run complete")
+    _reported = True
+    print(report(), file=sys.stderr, flush=True)
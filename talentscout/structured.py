@@ -0,0 +1,355 @@
+"""Structured LLM output: schemas, tolerant JSON parsing and partial retries.
+
+The JSON the models return is usually valid, but not always: code fences
+or prose around it, trailing commas, Python literals, single quotes, or an
+object cut off by ``max_tokens``. Throwing the whole reply away on the
+first ``json.loads`` error means paying for the same call again. Instead:
+
+- ``IncrementalJSONParser`` walks the text once, character by character,
+  and yields each top-level member as soon as it is complete, which also
+  serves streamed replies (the report shows scores while it generates),
+- ``repair_json`` fixes the common malformations locally,
+- ``Schema`` coerces and validates every field ("85/100" -> 85,
+  "no-hire" -> "No Hire"), and lists what is still missing or invalid,
+- ``Schema.follow_up`` builds a short request for ONLY those fields, so a
+  partial answer costs a small second call rather than a full retry.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+
+from .metrics import record_usage, span
+
+NULL_STRINGS = {"", "null", "none", "n/a", "na"}
+KEY_RE = re.compile(r"""^\s*("(?:[^"\\]|\\.)*"|'[^']*'|[A-Za-z_][\w \-]*?)\s*:\s*""")
+LIST_SPLIT_RE = re.compile(r"\s*(?:\n|;|•)\s*")
+NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+JSON_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+LITERALS = {"true": "true", "false": "false", "null": "null", "True": "true", "False": "false", "None": "null"}
+FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+
+# --- PARSING ---
+def repair_json(text: str) -> str:
+    """Best-effort fix of near-JSON: fences, prose around the object, single
+    quotes, Python literals, unquoted keys, trailing commas, raw newlines in
+    strings, and truncation (open strings and brackets are closed)."""
+    s = FENCE_RE.sub("", text or "")
+    starts = [i for i in (s.find("{"), s.find("[")) if i >= 0]
+    if starts: s = s[min(starts):]
+    out, stack, i, n = [], [], 0, len(s)
+    quote, escape = None, False
+
+    def drop_trailing_comma():
+        while out and out[-1].isspace(): out.pop()
+        if out and out[-1] == ",": out.pop()
+
+    while i < n:
+        c = s[i]
+        if quote:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == quote:
+                quote, c = None, '"'
+            elif c == '"':
+                c = '\\"'  # a double quote inside a single-quoted string
+            elif c == "\n":
+                c = "\\n"
+            out.append(c)
+            i += 1
+            continue
+        if c in "\"'":
+            quote = c
+            out.append('"')
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+            out.append(c)
+        elif c in "}]":
+            drop_trailing_comma()
+            if stack: stack.pop()
+            out.append(c)
+            if not stack: break  # anything after the object is prose
+        elif c.isdigit() or c == "-":
+            m = JSON_NUMBER_RE.match(s, i)
+            out.append(m.group(0) if m else c)
+            i = m.end() if m else i + 1
+            continue
+        elif c.isalpha() or c == "_":
+            j = i
+            while j < n and (s[j].isalnum() or s[j] in "_-"): j += 1
+            word = s[i:j]
+            rest = s[j:].lstrip()
+            if rest.startswith(":") and stack and stack[-1] == "}":
+                out.append(json.dumps(word))  # unquoted key
+            else:
+                out.append(LITERALS.get(word, "null" if word.lower() in ("none", "nan", "undefined") else json.dumps(word)))
+            i = j
+            continue
+        else:
+            out.append(c)
+        i += 1
+
+    if quote: out.append('"')
+    repaired = "".join(out).rstrip()
+    if stack:
+        # Truncated: drop a dangling key or separator, then close what is open
+        repaired = re.sub(r'([{,])\s*"(?:[^"\\]|\\.)*"\s*$', r"\1", repaired)
+        repaired = re.sub(r":\s*$", ": null", repaired)
+        repaired = re.sub(r",\s*$", "", repaired)
+        repaired += "".join(reversed(stack))
+    return repaired
+
+
+def loads_lenient(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(repair_json(text))
+
+
+class IncrementalJSONParser:
+    """Top-level members of a JSON object, each parsed as soon as it closes.
+
+    ``feed(chunk)`` returns the members completed by that chunk. Text before
+    the opening brace and after the closing one is ignored. Every character
+    is scanned once, however many chunks the text arrives in.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.fields = {}
+        self.errors = {}  # key (or raw member text) -> why it was skipped
+        self.started = False
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = 0
+
+    def feed(self, chunk) -> dict:
+        self.buffer += chunk or ""
+        buf, new = self.buffer, {}
+        i, n = self._pos, len(buf)
+        while i < n and not self.done:
+            c = buf[i]
+            if not self.started:
+                if c == "{":
+                    self.started, self._depth, self._member_start = True, 1, i + 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._member(buf[self._member_start:i], new)
+                    self.done = True
+            elif c == "," and self._depth == 1:
+                self._member(buf[self._member_start:i], new)
+                self._member_start = i + 1
+            i += 1
+        self._pos = i
+        return new
+
+    def _member(self, text, new):
+        if not text.strip(): return
+        m = KEY_RE.match(text)
+        if not m:
+            self.errors[text.strip()[:40]] = "not a key/value pair"
+            return
+        key = m.group(1)
+        key = json.loads(key) if key.startswith('"') else key.strip("'")
+        try:
+            value = loads_lenient(text[m.end():].strip())
+        except ValueError as e:
+            self.errors[key] = f"unparseable value ({e})"
+            return
+        self.fields[key] = new[key] = value
+
+
+# --- SCHEMAS ---
+@dataclass(frozen=True)
+class Field:
+    name: str
+    kind: str = "string"  # string | bool | score | enum | list
+    required: bool = True
+    nullable: bool = False
+    choices: tuple = ()
+
+    def describe(self) -> str:
+        if self.kind == "score": return "integer 0-100"
+        if self.kind == "enum": return "one of " + " / ".join(self.choices)
+        if self.kind == "list": return "list of strings"
+        if self.kind == "bool": return "boolean"
+        return "string or null" if self.nullable else "string"
+
+    def coerce(self, value):
+        """The value in canonical form; raises ValueError if it can't be."""
+        if value is None or (isinstance(value, str) and value.strip().lower() in NULL_STRINGS and self.kind != "list"):
+            if self.nullable: return None
+            raise ValueError("is empty")
+        if self.kind == "string":
+            if isinstance(value, (list, tuple)): return ", ".join(str(v).strip() for v in value if v not in (None, ""))
+            if isinstance(value, dict): raise ValueError("is an object")
+            return str(value).strip()
+        if self.kind == "bool":
+            if isinstance(value, bool): return value
+            if isinstance(value, (int, float)): return bool(value)
+            text = str(value).strip().lower()
+            if text in ("true", "yes", "y", "1"): return True
+            if text in ("false", "no", "n", "0"): return False
+            raise ValueError(f"{value!r} is not a boolean")
+        if self.kind == "score":
+            if isinstance(value, bool): raise ValueError("is a boolean")
+            if isinstance(value, (int, float)):
+                number, text = float(value), ""
+            else:
+                text = str(value)
+                m = NUMBER_RE.search(text)
+                if not m: raise ValueError(f"{value!r} is not a number")
+                number = float(m.group(0))
+            if re.search(r"/\s*10\b", text) or (isinstance(value, float) and 0 < number < 1):
+                number *= 100 if number < 1 else 10  # "8/10" or 0.85
+            return int(round(min(max(number, 0.0), 100.0)))
+        if self.kind == "enum":
+            wanted = re.sub(r"[\s_\-]+", " ", str(value)).strip().lower()
+            by_key = {c.lower(): c for c in self.choices}
+            if wanted in by_key: return by_key[wanted]
+            # "Strong Hire" -> "Hire"; longest first so "No Hire" beats "Hire"
+            for choice in sorted(self.choices, key=len, reverse=True):
+                if choice.lower() in wanted: return choice
+            raise ValueError(f"{value!r} is not one of {', '.join(self.choices)}")
+        if self.kind == "list":
+            if isinstance(value, str):
+                parts = LIST_SPLIT_RE.split(value)
+                value = parts if len(parts) > 1 else value.split(",")
+            if not isinstance(value, (list, tuple)): value = [value]
+            return [str(v).strip(" -•") for v in value if v is not None and str(v).strip(" -•")]
+        raise ValueError(f"unknown field kind {self.kind}")
+
+
+@dataclass
+class StructuredResult:
+    data: dict = field(default_factory=dict)  # valid fields, coerced
+    missing: list = field(default_factory=list)  # required fields absent or invalid
+    errors: dict = field(default_factory=dict)  # field -> why it was rejected
+    repaired: bool = False  # the text was not valid JSON as returned
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+class Schema:
+    """``requires(valid) -> [field]`` adds conditionally required fields."""
+
+    def __init__(self, name, fields, requires=None):
+        self.name = name
+        self.fields = {f.name: f for f in fields}
+        self.requires = requires
+
+    def __repr__(self):
+        return f"Schema({self.name!r}, {list(self.fields)})"
+
+    def coerce_fields(self, values) -> tuple:
+        """``(valid, errors)`` for the known fields among ``values``; unknown keys are dropped."""
+        valid, errors = {}, {}
+        for name, value in values.items():
+            f = self.fields.get(name)
+            if f is None: continue
+            try:
+                valid[name] = f.coerce(value)
+            except ValueError as e:
+                errors[name] = str(e)
+        return valid, errors
+
+    def validate(self, values, repaired=False) -> StructuredResult:
+        valid, errors = self.coerce_fields(values if isinstance(values, dict) else {})
+        missing = [name for name, f in self.fields.items() if f.required and name not in valid]
+        if self.requires: missing += [name for name in self.requires(valid) if name not in valid and name not in missing]
+        return StructuredResult(data=valid, missing=missing, errors=errors, repaired=repaired)
+
+    def parse(self, text) -> StructuredResult:
+        """Validates a complete reply, repairing it first if it isn't clean JSON."""
+        try:
+            values = json.loads(text)
+            if isinstance(values, dict): return self.validate(values)
+        except (TypeError, ValueError):
+            pass
+        parser = IncrementalJSONParser()
+        parser.feed(text or "")
+        values = dict(parser.fields)
+        if not parser.done or parser.errors:
+            # Truncated or damaged: repair the whole object for whatever the member scan missed
+            try:
+                repaired = loads_lenient(text or "")
+                if isinstance(repaired, dict): values = {**repaired, **values}
+            except ValueError:
+                pass
+        return self.validate(values, repaired=True)
+
+    def merge(self, result, text) -> StructuredResult:
+        """``result`` completed with the fields found in a follow-up reply."""
+        extra = self.parse(text)
+        data = {**result.data, **{k: v for k, v in extra.data.items() if k not in result.data}}
+        missing = [name for name in result.missing if name not in data]
+        errors = {k: v for k, v in {**result.errors, **extra.errors}.items() if k not in data}
+        return StructuredResult(data=data, missing=missing, errors=errors, repaired=result.repaired or extra.repaired)
+
+    def follow_up(self, request, result) -> dict:
+        """Request kwargs asking only for the fields ``result`` lacks, continuing the original chat."""
+        wanted = ", ".join(f'"{name}" ({self.fields[name].describe()})' for name in result.missing)
+        problems = "; ".join(f"{name} {why}" for name, why in result.errors.items())
+        messages = list(request["messages"]) + [
+            {"role": "assistant", "content": json.dumps(result.data, ensure_ascii=False)},
+            {"role": "user", "content": f"Your JSON is missing or has invalid values for: {wanted}."
+                                        + (f" Problems: {problems}." if problems else "")
+                                        + " Reply with a JSON object containing ONLY those keys."},
+        ]
+        return {**request, "messages": messages, "response_format": {"type": "json_object"}}
+
+
+class StreamingObject:
+    """Feeds a streamed reply through the incremental parser, validating fields as they complete."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.parser = IncrementalJSONParser()
+        self.fields = {}
+
+    def feed(self, chunk) -> dict:
+        """Newly completed, valid fields."""
+        valid, _ = self.schema.coerce_fields(self.parser.feed(chunk))
+        self.fields.update(valid)
+        return valid
+
+    def result(self) -> StructuredResult:
+        if self.parser.done and not self.parser.errors: return self.schema.validate(self.parser.fields)
+        return self.schema.parse(self.parser.buffer)
+
+
+def complete_structured(client, schema, request, deadline=None, stage="llm", **call_options) -> StructuredResult:
+    """One ``client.complete`` call validated against ``schema``, plus at most
+    one short follow-up for the fields that came back missing or invalid."""
+    with span(stage):
+        completion = client.complete(deadline=deadline, **call_options, **request)
+    record_usage(stage, completion)
+    result = schema.parse(completion.choices[0].message.content)
+    if result.complete: return result
+    try:
+        with span(f"{stage}_fill"):
+            completion = client.complete(deadline=deadline, **schema.follow_up(request, result))
+        record_usage(f"{stage}_fill", completion)
+        return schema.merge(result, completion.choices[0].message.content)
+    except Exception:
+        return result  # keep what the first call gave; callers treat missing fields as unknown
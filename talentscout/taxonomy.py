@@ -0,0 +1,195 @@
+"""Bundled skill taxonomy: canonical names, synonyms and categories.
+
+Resumes and job descriptions spell the same skill many ways ("JS",
+"Javascript", "ECMAScript"; "k8s", "Kubernetes"). Everything that compares
+skills goes through ``canonical_skill`` so those collapse to one lowercase
+key, and ``extract_skills`` finds known skills inside free text such as a
+job description. Skills that aren't in the taxonomy are kept, lowercased,
+so nothing a candidate lists is dropped.
+"""
+import re
+
+# canonical key: (display name, category, synonyms)
+SKILLS = {
+    # languages
+    "python": ("Python", "language", ["py", "python3", "python 3", "cpython"]),
+    "javascript": ("JavaScript", "language", ["js", "ecmascript", "es6", "java script", "vanilla js"]),
+    "typescript": ("TypeScript", "language", ["ts"]),
+    "java": ("Java", "language", ["core java", "java 8", "java 11", "java 17", "j2ee", "java ee"]),
+    "kotlin": ("Kotlin", "language", []),
+    "scala": ("Scala", "language", []),
+    "go": ("Go", "language", ["golang", "go lang"]),
+    "rust": ("Rust", "language", ["rustlang"]),
+    "c": ("C", "language", ["ansi c"]),
+    "c++": ("C++", "language", ["cpp", "cplusplus", "c plus plus"]),
+    "c#": ("C#", "language", ["csharp", "c sharp"]),
+    "ruby": ("Ruby", "language", []),
+    "php": ("PHP", "language", []),
+    "swift": ("Swift", "language", []),
+    "objective-c": ("Objective-C", "language", ["objc", "objective c"]),
+    "r": ("R", "language", ["r language", "rlang"]),
+    "matlab": ("MATLAB", "language", []),
+    "bash": ("Bash", "language", ["shell", "shell scripting", "sh", "zsh"]),
+    "sql": ("SQL", "language", ["t-sql", "tsql", "pl/sql", "pl sql", "plsql", "ansi sql"]),
+    "html": ("HTML", "language", ["html5"]),
+    "css": ("CSS", "language", ["css3", "scss", "sass", "less"]),
+    "dart": ("Dart", "language", []),
+    "elixir": ("Elixir", "language", []),
+    "haskell": ("Haskell", "language", []),
+    "perl": ("Perl", "language", []),
+    # web frameworks
+    "react": ("React", "framework", ["reactjs", "react.js", "react js"]),
+    "react native": ("React Native", "framework", ["react-native"]),
+    "angular": ("Angular", "framework", ["angularjs", "angular.js", "angular 2+"]),
+    "vue": ("Vue", "framework", ["vuejs", "vue.js", "vue js"]),
+    "svelte": ("Svelte", "framework", ["sveltekit"]),
+    "next.js": ("Next.js", "framework", ["nextjs", "next js"]),
+    "node.js": ("Node.js", "framework", ["node", "nodejs", "node js"]),
+    "express": ("Express", "framework", ["expressjs", "express.js"]),
+    "nestjs": ("NestJS", "framework", ["nest.js", "nest js"]),
+    "django": ("Django", "framework", ["django rest framework", "drf"]),
+    "flask": ("Flask", "framework", []),
+    "fastapi": ("FastAPI", "framework", ["fast api"]),
+    "spring": ("Spring", "framework", ["spring framework", "spring mvc"]),
+    "spring boot": ("Spring Boot", "framework", ["springboot", "spring-boot"]),
+    "rails": ("Ruby on Rails", "framework", ["ruby on rails", "ror"]),
+    "laravel": ("Laravel", "framework", []),
+    ".net": (".NET", "framework", ["dotnet", "dot net", ".net core", "asp.net", "asp.net core"]),
+    "graphql": ("GraphQL", "framework", ["graph ql", "apollo"]),
+    "rest": ("REST APIs", "practice", ["rest api", "rest apis", "restful", "restful apis", "restful api"]),
+    "grpc": ("gRPC", "framework", []),
+    "flutter": ("Flutter", "framework", []),
+    "android": ("Android", "platform", ["android sdk"]),
+    "ios": ("iOS", "platform", []),
+    "redux": ("Redux", "framework", []),
+    "tailwind": ("Tailwind CSS", "framework", ["tailwindcss", "tailwind css"]),
+    "jquery": ("jQuery", "framework", []),
+    # data stores
+    "postgresql": ("PostgreSQL", "database", ["postgres", "psql", "postgre", "postgre sql"]),
+    "mysql": ("MySQL", "database", ["my sql", "mariadb"]),
+    "sqlite": ("SQLite", "database", []),
+    "oracle": ("Oracle DB", "database", ["oracle db", "oracle database"]),
+    "sql server": ("SQL Server", "database", ["mssql", "ms sql", "microsoft sql server"]),
+    "mongodb": ("MongoDB", "database", ["mongo", "mongo db"]),
+    "redis": ("Redis", "database", []),
+    "cassandra": ("Cassandra", "database", ["apache cassandra"]),
+    "dynamodb": ("DynamoDB", "database", ["dynamo db", "dynamo"]),
+    "elasticsearch": ("Elasticsearch", "database", ["elastic search", "elastic", "opensearch"]),
+    "neo4j": ("Neo4j", "database", []),
+    "snowflake": ("Snowflake", "database", []),
+    "bigquery": ("BigQuery", "database", ["big query"]),
+    "firebase": ("Firebase", "database", ["firestore"]),
+    # messaging / data
+    "kafka": ("Kafka", "data", ["apache kafka"]),
+    "rabbitmq": ("RabbitMQ", "data", ["rabbit mq"]),
+    "spark": ("Spark", "data", ["apache spark", "pyspark"]),
+    "hadoop": ("Hadoop", "data", ["hdfs", "mapreduce"]),
+    "airflow": ("Airflow", "data", ["apache airflow"]),
+    "dbt": ("dbt", "data", []),
+    "pandas": ("pandas", "data", []),
+    "numpy": ("NumPy", "data", []),
+    "etl": ("ETL", "practice", ["elt", "data pipelines", "data pipeline"]),
+    # ML / AI
+    "machine learning": ("Machine Learning", "ml", ["ml"]),
+    "deep learning": ("Deep Learning", "ml", ["dl"]),
+    "nlp": ("NLP", "ml", ["natural language processing"]),
+    "computer vision": ("Computer Vision", "ml", ["cv", "opencv"]),
+    "tensorflow": ("TensorFlow", "ml", ["tf", "keras"]),
+    "pytorch": ("PyTorch", "ml", ["torch"]),
+    "scikit-learn": ("scikit-learn", "ml", ["sklearn", "scikit learn"]),
+    "llm": ("LLMs", "ml", ["llms", "large language models", "generative ai", "genai", "gen ai"]),
+    "langchain": ("LangChain", "ml", []),
+    "mlops": ("MLOps", "ml", ["ml ops"]),
+    # cloud / infra
+    "aws": ("AWS", "cloud", ["amazon web services", "ec2", "s3", "lambda", "aws lambda"]),
+    "google cloud": ("Google Cloud", "cloud", ["gcp", "google cloud platform"]),
+    "azure": ("Azure", "cloud", ["microsoft azure"]),
+    "docker": ("Docker", "devops", ["containers", "docker compose", "docker-compose"]),
+    "kubernetes": ("Kubernetes", "devops", ["k8s", "kube", "eks", "gke", "aks", "openshift"]),
+    "helm": ("Helm", "devops", []),
+    "terraform": ("Terraform", "devops", ["tf cloud", "opentofu"]),
+    "ansible": ("Ansible", "devops", []),
+    "jenkins": ("Jenkins", "devops", []),
+    "github actions": ("GitHub Actions", "devops", ["gh actions"]),
+    "gitlab ci": ("GitLab CI", "devops", ["gitlab-ci", "gitlab ci/cd"]),
+    "ci/cd": ("CI/CD", "practice", ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"]),
+    "linux": ("Linux", "platform", ["unix", "ubuntu", "centos", "rhel"]),
+    "nginx": ("Nginx", "devops", []),
+    "prometheus": ("Prometheus", "devops", []),
+    "grafana": ("Grafana", "devops", []),
+    "git": ("Git", "tool", ["github", "gitlab", "bitbucket", "version control"]),
+    # practices
+    "microservices": ("Microservices", "practice", ["micro services", "microservice", "service oriented architecture", "soa"]),
+    "system design": ("System Design", "practice", ["distributed systems", "scalability", "architecture"]),
+    "tdd": ("TDD", "practice", ["test driven development", "unit testing", "testing"]),
+    "agile": ("Agile", "practice", ["scrum", "kanban"]),
+    "data structures": ("Data Structures & Algorithms", "practice", ["dsa", "algorithms", "data structures and algorithms"]),
+    "oop": ("OOP", "practice", ["object oriented programming", "object-oriented programming"]),
+    "security": ("Security", "practice", ["appsec", "owasp", "cybersecurity"]),
+    "figma": ("Figma", "tool", []),
+    "jira": ("Jira", "tool", []),
+    "excel": ("Excel", "tool", ["ms excel", "microsoft excel"]),
+    "power bi": ("Power BI", "tool", ["powerbi"]),
+    "tableau": ("Tableau", "tool", []),
+}
+
+# Synonyms that are too generic to pick out of running text (they still
+# normalise when a candidate lists them as a skill)
+TEXT_STOP_ALIASES = {"c", "r", "go", "ts", "tf", "sh", "cv", "dl", "ml", "node", "elastic", "shell", "testing",
+                     "architecture", "scalability", "lambda", "s3", "containers", "dynamo", "torch", "kube",
+                     "version control", "github", "gitlab", "unix", "less", "sass", "apollo", "drf", "ror", "soa"}
+
+ALIASES = {}
+for _key, (_display, _category, _synonyms) in SKILLS.items():
+    for _name in (_key, _display, *_synonyms):
+        ALIASES.setdefault(_name.lower(), _key)
+MAX_ALIAS_WORDS = max(len(alias.split()) for alias in ALIASES)
+
+SKILL_SPLIT_RE = re.compile(r"\s*(?:,|;|/(?!cd\b|sql\b)|\||\band\b|&|\n|•)\s*", re.IGNORECASE)
+TOKEN_RE = re.compile(r"\.?[a-z0-9][a-z0-9\+#\.\-]*[a-z0-9\+#]|[a-z0-9\+#]", re.IGNORECASE)
+EMPTY_VALUES = ("", "null", "none", "n/a", "na", "skipped")
+
+
+def canonical_skill(name: str) -> str:
+    """Canonical lowercase key for a skill name; unknown skills are lowercased as-is."""
+    s = re.sub(r"\s+", " ", (name or "").strip(" .()").lower())
+    return ALIASES.get(s, s)
+
+
+def display_skill(key: str) -> str:
+    entry = SKILLS.get(key)
+    return entry[0] if entry else key
+
+
+def skill_category(key: str):
+    entry = SKILLS.get(key)
+    return entry[1] if entry else None
+
+
+def normalize_skills(value) -> list:
+    """Canonical, de-duplicated skills from a "Tech Stack" string or list, in order."""
+    items = value if isinstance(value, (list, tuple)) else SKILL_SPLIT_RE.split(str(value or ""))
+    seen = []
+    for item in items:
+        skill = canonical_skill(str(item))
+        if skill not in EMPTY_VALUES and skill not in seen: seen.append(skill)
+    return seen
+
+
+def extract_skills(text: str) -> list:
+    """Known skills mentioned anywhere in free text, longest phrase first."""
+    raw = [t.rstrip(".") for t in TOKEN_RE.findall(text or "")]
+    tokens = [t.lower() for t in raw]
+    found, i = [], 0
+    while i < len(tokens):
+        for width in range(min(MAX_ALIAS_WORDS, len(tokens) - i), 0, -1):
+            phrase = " ".join(tokens[i:i + width])
+            key = ALIASES.get(phrase)
+            # Generic words only count when written exactly like the skill ("Go", "R")
+            if key and (phrase not in TEXT_STOP_ALIASES or (width == 1 and raw[i] == display_skill(key))):
+                if key not in found: found.append(key)
+                i += width
+                break
+        else:
+            i += 1
+    return found
@@ -0,0 +1,43 @@
+"""Chat transcript rendering whose cost doesn't grow with the interview.
+
+Drawing every message as its own ``st.chat_message`` on every rerun makes
+each interaction O(transcript). Only the newest messages are drawn live;
+older ones sit in fixed-size pages, starting from the first turn, and are
+only drawn when the reader opens the history. Messages are append-only,
+so a full page never changes and its markdown is built once and then
+reused from the session's ``TranscriptPages``.
+"""
+
+LIVE_MESSAGES = 8  # newest messages drawn as chat bubbles
+PAGE_SIZE = 20  # messages per page of earlier history
+SPEAKERS = {"assistant": "🤖 **TalentScout**", "user": "👤 **You**"}
+
+
+def split_transcript(messages, live=LIVE_MESSAGES):
+    """(earlier, recent) turns of a transcript; the system prompt is in neither."""
+    turns = [m for m in messages if m["role"] != "system"]
+    cut = max(len(turns) - live, 0)
+    return turns[:cut], turns[cut:]
+
+
+def format_message(message) -> str:
+    return f"{SPEAKERS.get(message['role'], message['role'])}: {message['content']}"
+
+
+class TranscriptPages:
+    """Markdown for pages of earlier history, each full page built only once."""
+
+    def __init__(self, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        self._pages = {}  # page index -> (messages on it, markdown)
+
+    def count(self, messages) -> int:
+        return -(-len(messages) // self.page_size)
+
+    def page(self, messages, index) -> str:
+        chunk = messages[index * self.page_size:(index + 1) * self.page_size]
+        cached = self._pages.get(index)
+        if cached and cached[0] == len(chunk): return cached[1]
+        markdown = "\n\n---\n\n".join(format_message(m) for m in chunk)
+        self._pages[index] = (len(chunk), markdown)
+        return markdown